@@ -1,37 +1,115 @@
-import requests
-import pandas as pd
 import os
+import asyncio
+import argparse
+from datetime import datetime
+import roster_store
+from http_scheduler import RequestScheduler, client_session
+from metrics import Metrics
+from run_log import RunLog
 
 # Define leagues and their ESPN API URLs
 leagues = {
-    "NBA": "https://sports.core.api.espn.com/v3/sports/basketball/nba/athletes?limit=5000",
-    "NFL": "https://sports.core.api.espn.com/v3/sports/football/nfl/athletes?limit=5000",
-    "MLB": "https://sports.core.api.espn.com/v3/sports/baseball/mlb/athletes?limit=5000",
-    "NHL": "https://sports.core.api.espn.com/v3/sports/hockey/nhl/athletes?limit=5000",
+    "NBA": "https://sports.core.api.espn.com/v3/sports/basketball/nba/athletes",
+    "NFL": "https://sports.core.api.espn.com/v3/sports/football/nfl/athletes",
+    "MLB": "https://sports.core.api.espn.com/v3/sports/baseball/mlb/athletes",
+    "NHL": "https://sports.core.api.espn.com/v3/sports/hockey/nhl/athletes",
 }
 
-# Create the folder if it doesn't exist
+# Athletes per page; every page after the first is fetched concurrently
+PAGE_SIZE = 1000
+REQUESTS_PER_SECOND = 10
+
+# Folder for the roster CSVs (written only with --csv; the roster store is the source of truth)
 folder_name = "player_ids"
-os.makedirs(folder_name, exist_ok=True)
 
-# Loop through each league and fetch players
-for league, url in leagues.items():
-    response = requests.get(url)
-    data = response.json()
+def page_url(url, page):
+    return f"{url}?limit={PAGE_SIZE}&page={page}"
 
-    # Extract player info
-    players = []
+def page_athletes(data, seen_ids):
+    """(Athlete ID, name) pairs of a page, skipping IDs already seen this sync."""
+    athletes = []
     for player in data.get("items", []):
-        players.append({
-            "Player Name": player.get("fullName", ""),
-            "Athlete ID": player.get("id", "")
-        })
+        athlete_id = str(player.get("id", ""))
+        if not athlete_id or athlete_id in seen_ids:
+            continue
+        seen_ids.add(athlete_id)
+        athletes.append((athlete_id, player.get("fullName", "")))
+    return athletes
+
+async def sync_league(scheduler, db, league, url, log, export_csv=False):
+    """Page through a league's athletes and upsert them into the roster store."""
+    first_page = await scheduler.fetch_json(page_url(url, 1), log, tag=league)
+    if not first_page:
+        log.error(f"❌ {league}: could not fetch the first roster page, keeping the stored roster")
+        return
+
+    page_count = first_page.get("pageCount", 1)
+    expected = first_page.get("count")
+    seen_date = datetime.today().strftime("%Y-%m-%d")
+    seen_ids = set()
+    missing_pages = []
+    active = roster_store.load_active(db, league)
+    changed = roster_store.upsert_athletes(db, league, page_athletes(first_page, seen_ids), seen_date, active)
+
+    async def fetch_page(page):
+        return page, await scheduler.fetch_json(page_url(url, page), log, tag=league)
+
+    # Upsert each page as soon as it arrives rather than holding the whole roster in memory
+    for next_page in asyncio.as_completed([fetch_page(page) for page in range(2, page_count + 1)]):
+        page, data = await next_page
+        if data is None:
+            missing_pages.append(page)
+        else:
+            changed += roster_store.upsert_athletes(db, league, page_athletes(data, seen_ids), seen_date, active)
+
+    # Detect truncation: failed pages, or fewer athletes than the API reports. Upserts only
+    # add or refresh athletes, so a partial sync is kept but nobody is marked as departed.
+    if missing_pages or (expected is not None and len(seen_ids) < expected):
+        log.warning(f"⚠️ {league}: roster incomplete ({len(seen_ids)} of {expected} athletes, "
+                    f"missing pages {sorted(missing_pages)})")
+        departed = 0
+    else:
+        departed = roster_store.mark_departed(db, league, active, seen_ids)
+        roster_store.record_sync(db, league, seen_date, len(seen_ids))
+    db.commit()
+    log.info(f"✅ {league}: {len(seen_ids)} athletes in {page_count} pages, "
+             f"{changed} new or changed, {departed} departed")
+
+    if export_csv:
+        csv_filename = os.path.join(folder_name, f"{league}_Players.csv")
+        roster_store.export_csv(db, league, csv_filename)
+        log.info(f"CSV file saved as {csv_filename}")
+
+async def sync_rosters(league_names=None, export_csv=False):
+    """Sync every league's roster concurrently over one session."""
+    league_names = league_names or list(leagues)
+    os.makedirs(folder_name, exist_ok=True)
+    db = roster_store.connect()
+    run_metrics = Metrics()
+    # Progress is printed as it happens and kept in player_ids/sync.log
+    log = RunLog(os.path.join(folder_name, "sync.log"), echo=True)
+
+    async def timed_sync(league):
+        with run_metrics.stage(f"{league} roster", tag=league) as stage:
+            await sync_league(scheduler, db, league, leagues[league], log.bind(league=league), export_csv)
+            stage["records"] = len(roster_store.load_active(db, league))
 
-    # Convert to DataFrame
-    df = pd.DataFrame(players)
+    try:
+        async with client_session() as session:
+            scheduler = RequestScheduler(session, rate=REQUESTS_PER_SECOND, metrics=run_metrics)
+            await asyncio.gather(*(timed_sync(league) for league in league_names))
+    finally:
+        db.close()
+        log.close()
+    run_metrics.write_jsonl(os.path.join(folder_name, "sync_metrics.jsonl"))
+    run_metrics.write_prometheus("rosters")
+    print(run_metrics.summary_table())
 
-    # Save to CSV inside player_ids folder
-    csv_filename = os.path.join(folder_name, f"{league}_Players.csv")
-    df.to_csv(csv_filename, index=False)
-    print(f"CSV file saved as {csv_filename}")
+def main():
+    parser = argparse.ArgumentParser(description="Sync ESPN athlete rosters into the roster store.")
+    parser.add_argument("--csv", action="store_true", help="Also export player_ids/<LEAGUE>_Players.csv")
+    args = parser.parse_args()
+    asyncio.run(sync_rosters(export_csv=args.csv))
 
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Cost of diffing a report against the previous one, by snapshot size.
+
+For each size, a previous and a new snapshot are generated with CHURN of the
+injuries removed, CHURN added and CHURN changed. Timed per report:
+
+  full compare     read both JSON Lines reports and compare whole records by
+                   Injury ID, as a consumer diffing the latest files would
+  fingerprints     change_feed.fingerprint() of the new records and
+                   diff_fingerprints() against the previous fingerprints
+  upsert_report    injury_store.upsert_report(): the diff plus reading back
+                   changed and removed rows and the upsert transaction
+
+Times should grow linearly with the snapshot size.
+
+Run from the repository root: python benchmarks/bench_change_feed.py
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import injury_store  # noqa: E402
+from change_feed import fingerprint, diff_fingerprints  # noqa: E402
+from injury_writer import read_records  # noqa: E402
+from bench_timing import timed  # noqa: E402
+
+SIZES = [300, 3000, 30000]
+CHURN = 0.05
+
+def record(n, rng):
+    return {
+        "Player Name": f"Player {n}", "Athlete ID": str(n), "Team": f"Team {n % 30}", "Injury ID": str(n),
+        "Status": rng.choice(["Out", "Day-To-Day", "Questionable"]), "Injury Type": rng.choice(["Knee", "Ankle"]),
+        "Return Date": "2025-03-15", "Short Comment": f"Player {n} is out with an injury.",
+        "Long Comment": f"Player {n} left the game and will be re-evaluated next week.", "Reported Date": "2025-03-01",
+    }
+
+def snapshots(size, rng):
+    previous = [record(n, rng) for n in range(size)]
+    churn = int(size * CHURN)
+    current = [dict(r) for r in previous[churn:]] + [record(size + n, rng) for n in range(churn)]
+    for r in rng.sample(current, churn):
+        r["Status"] = "Out" if r["Status"] != "Out" else "Day-To-Day"
+    return previous, current
+
+def write_jsonl(path, records):
+    with open(path, "w", encoding="utf-8") as jsonl_file:
+        jsonl_file.writelines(json.dumps(r) + "\n" for r in records)
+
+def full_compare(previous_path, current_path):
+    previous = {r["Injury ID"]: r for r in read_records(previous_path)}
+    current = {r["Injury ID"]: r for r in read_records(current_path)}
+    changed = [i for i, r in current.items() if i in previous and previous[i] != r]
+    return [i for i in current if i not in previous], changed, [i for i in previous if i not in current]
+
+def main():
+    rng = random.Random(0)
+    print(f"{'records':>8} {'full compare':>13} {'fingerprints':>13} {'upsert_report':>14}   changes")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in SIZES:
+            previous, current = snapshots(size, rng)
+            previous_path, current_path = os.path.join(tmp, "previous.jsonl"), os.path.join(tmp, "current.jsonl")
+            write_jsonl(previous_path, previous)
+            write_jsonl(current_path, current)
+
+            compare_time, expected = timed(lambda: full_compare(previous_path, current_path))
+            previous_prints = {r["Injury ID"]: fingerprint(r) for r in previous}
+            diff_time, diff = timed(lambda: diff_fingerprints(
+                previous_prints, {r["Injury ID"]: fingerprint(r) for r in current}))
+            assert [sorted(ids) for ids in diff] == [sorted(ids) for ids in expected], "diffs differ"
+
+            db = injury_store.connect(os.path.join(tmp, f"injuries-{size}.sqlite"))
+            injury_store.upsert_report(db, "NBA", "2025-03-01", previous)
+
+            def upsert():
+                # Restore the previous snapshot (untimed) so every repeat diffs the same change
+                upsert_time = time.perf_counter()
+                changes = injury_store.upsert_report(db, "NBA", "2025-03-02", current)
+                upsert_time = time.perf_counter() - upsert_time
+                injury_store.upsert_report(db, "NBA", "2025-03-01", previous)
+                return upsert_time, changes
+
+            upsert_time = min(upsert()[0] for _ in range(3))
+            changes = upsert()[1]
+            db.close()
+            print(f"{size:8d} {compare_time * 1e3:10.2f} ms {diff_time * 1e3:10.2f} ms {upsert_time * 1e3:11.2f} ms"
+                  f"   {len(changes)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Time and peak memory of the combined Excel report, old vs write-only writer.
+
+Generates synthetic league frames (ROWS_PER_LEAGUE rows over 30 teams for each of
+six leagues) and renders them with the original Excel_sheet.py logic (per-team
+boolean filter, iterrows, full cell walk for widths) and with
+report_builder.build_report (write-only workbook, one groupby pass, vectorized widths).
+
+Run from the repository root: python benchmarks/bench_excel.py [ROWS_PER_LEAGUE]
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.styles import Font
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import report_builder  # noqa: E402
+
+LEAGUES = ["MLB", "NHL", "NFL", "NBA", "AFL", "NRL"]
+TEAMS = 30
+
+def make_frames(rows_per_league):
+    rng = random.Random(0)
+    frames = {}
+    for league in LEAGUES:
+        frames[league] = pd.DataFrame({
+            "Player Name": [f"Player {rng.randrange(100000)}" for _ in range(rows_per_league)],
+            "Athlete ID": [str(rng.randrange(100000)) for _ in range(rows_per_league)],
+            "Team": [f"{league} Team {rng.randrange(TEAMS)}" for _ in range(rows_per_league)],
+            "Injury ID": [str(i) for i in range(rows_per_league)],
+            "Status": [rng.choice(["Out", "Day-To-Day", "Questionable"]) for _ in range(rows_per_league)],
+            "Injury Type": [rng.choice(["Knee", "Ankle", "Hamstring", "Concussion"]) for _ in range(rows_per_league)],
+            "Return Date": ["2025-03-15"] * rows_per_league,
+            "Short Comment": [rng.choice(["", "Expected back next week."]) for _ in range(rows_per_league)],
+            "Long Comment": [""] * rows_per_league,
+            "Reported Date": ["2025-03-01T00:00Z"] * rows_per_league,
+        })
+    return frames
+
+def old_build_report(league_frames, output_file):
+    """Condensed copy of the previous Excel_sheet.py rendering loop."""
+    wb = Workbook()
+    wb.remove(wb.active)
+    summary_sheet = wb.create_sheet(title="Summary")
+    summary_sheet.append(["Combined Injury Report Summary"])
+    summary_sheet["A1"].font = Font(bold=True, size=16)
+    for league, df in league_frames.items():
+        ws = wb.create_sheet(title=league)
+        ws.append([f"{league} Injury Report"])
+        ws["A1"].font = Font(bold=True, size=16)
+        ws.append([])
+        row_num = 3
+        for team in sorted(df["Team"].unique()):
+            team_data = df[df["Team"] == team]
+            ws.append([team])
+            ws.cell(row=row_num, column=1).font = Font(bold=True, size=14)
+            row_num += 1
+            headers = ["Player Name", "Injury Type", "Status", "Return Date", "Reported Date"]
+            if "Short Comment" in team_data.columns and team_data["Short Comment"].any():
+                headers.append("Comment")
+            ws.append(headers)
+            for col_num, header in enumerate(headers, 1):
+                ws.cell(row=row_num, column=col_num).font = Font(bold=True)
+            row_num += 1
+            for _, row in team_data.iterrows():
+                row_values = [row["Player Name"], row["Injury Type"], row["Status"],
+                              row["Return Date"], row["Reported Date"]]
+                if "Short Comment" in headers and row["Short Comment"]:
+                    row_values.append(row["Short Comment"])
+                ws.append(row_values)
+                row_num += 1
+            ws.append([])
+            row_num += 1
+        for col in ws.columns:
+            max_length = 0
+            for cell in col:
+                if cell.value:
+                    max_length = max(max_length, len(str(cell.value)))
+            ws.column_dimensions[col[0].column_letter].width = min(max_length + 2, 50)
+    wb.save(output_file)
+
+def measure(name, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{name:<22} {elapsed:8.2f}s   peak {peak / 2 ** 20:8.1f} MiB")
+    return elapsed
+
+def main():
+    rows_per_league = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    frames = make_frames(rows_per_league)
+    print(f"{len(LEAGUES)} leagues x {rows_per_league} rows")
+    with tempfile.TemporaryDirectory() as tmp:
+        old = measure("old openpyxl loop", lambda: old_build_report(frames, os.path.join(tmp, "old.xlsx")))
+        new = measure("write-only + groupby",
+                      lambda: report_builder.build_report(frames, os.path.join(tmp, "new.xlsx")))
+    print(f"speedup {old / new:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Time the combined-report fetch before and after the concurrent rewrite.
+
+Both versions run against benchmarks/stub_server.py serving a fixed fixture set
+with per-request latency. The old Google_sheet.py path (serial requests.get plus
+a 0.5s sleep per injury) is timed on its truncated team list; the new path, a
+full espn_scraper run that the report is now rendered from, is timed on the
+same teams and on the full team lists.
+
+Run from the repository root: python benchmarks/bench_google_sheet.py
+"""
+import os
+import sys
+import time
+import asyncio
+import tempfile
+import threading
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import espn_scraper  # noqa: E402
+from espn_scraper import LEAGUES  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from bench_timing import timed  # noqa: E402
+
+SPORTS = ["NBA", "NFL", "MLB", "NHL"]
+INJURIES_PER_TEAM = 2
+LATENCY = 0.02  # seconds added to every stub response
+
+# Team lists of the previous Google_sheet.py (SPORT_TEAM_IDS)
+OLD_TEAM_IDS = {
+    "NBA": {"Atlanta Hawks": 1, "Boston Celtics": 2, "Brooklyn Nets": 17, "Chicago Bulls": 4,
+            "Los Angeles Lakers": 13, "Miami Heat": 14, "New York Knicks": 18, "Golden State Warriors": 9},
+    "NFL": {"Buffalo Bills": 2, "Dallas Cowboys": 6, "San Francisco 49ers": 25, "Kansas City Chiefs": 12},
+    "MLB": {"New York Yankees": 10, "Los Angeles Dodgers": 19, "Boston Red Sox": 2, "Houston Astros": 18},
+    "NHL": {"Toronto Maple Leafs": 21, "Montreal Canadiens": 8, "Boston Bruins": 1, "Chicago Blackhawks": 4},
+}
+
+def old_fetch(team_ids, sleep=0.5):
+    """The previous serial fetch loop, minus the row parsing."""
+    rows = 0
+    for sport, teams in team_ids.items():
+        for team, team_id in teams.items():
+            response = requests.get(LEAGUES[sport]["base_url"].format(team_id))
+            if response.status_code == 200:
+                for injury_item in response.json().get("items", []):
+                    details = requests.get(injury_item["$ref"])
+                    if details.status_code == 200:
+                        details.json()
+                        rows += 1
+                    time.sleep(sleep)
+    return rows
+
+def new_fetch():
+    runs = asyncio.run(espn_scraper.run_leagues(SPORTS, use_cache=False, incremental=False))
+    return sum(run["writer"].count for run in runs)
+
+def report(name, func):
+    elapsed, rows = timed(func, repeat=1)
+    print(f"{name:<36} {rows:5d} injuries {elapsed:8.2f}s {elapsed / max(rows, 1) * 1e3:8.1f} ms/injury")
+
+def main():
+    server = StubServer(injuries_per_team=INJURIES_PER_TEAM, latency=LATENCY)
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(server.start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+
+    full_team_ids = {sport: LEAGUES[sport]["team_ids"] for sport in SPORTS}
+    for sport in SPORTS:
+        LEAGUES[sport]["base_url"] = server.team_url_template(sport)
+    os.chdir(tempfile.mkdtemp())  # espn_scraper writes its reports relative to the working directory
+
+    report("old: serial + sleep(0.5), old teams", lambda: old_fetch(OLD_TEAM_IDS))
+    for sport in SPORTS:
+        LEAGUES[sport]["team_ids"] = OLD_TEAM_IDS[sport]
+    report("new: concurrent, old teams", new_fetch)
+    for sport in SPORTS:
+        LEAGUES[sport]["team_ids"] = full_team_ids[sport]
+    report("new: concurrent, full teams", new_fetch)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Run the AFL and NRL scrapers against a local stub that adds latency and failures.
+
+Both scrapers fetch through http_scheduler (connect/read timeouts, jittered
+retries, gzip/brotli transfer, conditional GET) and run concurrently on one
+event loop. Scenarios:
+
+  clean      the pages are served with LATENCY seconds of latency
+  cached     a second run, answered with 304 Not Modified from the HTTP cache
+  flaky      FAILURE_RATE of requests fail with 503 and are retried
+  stalled    responses take longer than the read timeout; the run must give up
+             in bounded time instead of hanging
+
+Run from the repository root: python benchmarks/bench_html_fetch.py
+"""
+import os
+import sys
+import time
+import random
+import asyncio
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import http_scheduler  # noqa: E402
+import AFL_Injuries  # noqa: E402
+import NRL_injuries  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from bench_html_parsing import afl_fixture, nrl_fixture  # noqa: E402
+
+LATENCY = 0.3
+FAILURE_RATE = 0.5
+STALLED_READ_TIMEOUT = 1.0
+
+async def scrape_sites(stub):
+    """Run both scrapers concurrently against the stub; returns (seconds, records, retries)."""
+    AFL_Injuries.url = stub.page_url("afl")
+    NRL_injuries.url = stub.page_url("nrl")
+    start = time.perf_counter()
+    results = await asyncio.gather(AFL_Injuries.run(), NRL_injuries.run())
+    elapsed = time.perf_counter() - start
+    retries = sum(total["retries"] for result in results for total in result["metrics"].totals())
+    # A page that could not be fetched publishes no report, so count what each run wrote
+    records = sum(stage["records"] for result in results for stage in result["metrics"].stages)
+    return elapsed, records, retries
+
+async def scenario(name, pages, port=0, **stub_options):
+    """Run one scenario and return the stub's port (cached URLs include it)."""
+    stub = StubServer(pages=pages, **stub_options)
+    base_url = await stub.start(port)
+    try:
+        elapsed, records, retries = await scrape_sites(stub)
+    finally:
+        await stub.stop()
+    encodings = ", ".join(f"{encoding} {count}" for encoding, count in sorted(stub.encodings.items())) or "-"
+    print(f"{name:<9} {elapsed:6.2f}s  {records:4d} injuries  {stub.requests:3d} requests  "
+          f"{stub.failed:2d} failed  {retries:2d} retries  {stub.not_modified:2d} not modified  [{encodings}]")
+    return int(base_url.rsplit(":", 1)[1])
+
+async def main():
+    rng = random.Random(0)
+    pages = {"afl": afl_fixture(rng), "nrl": nrl_fixture(rng)}
+    print(f"Accept-Encoding: {http_scheduler.ACCEPT_ENCODING}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        port = await scenario("clean", pages, latency=LATENCY)
+        await scenario("cached", pages, port=port, latency=LATENCY)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        await scenario("flaky", pages, latency=LATENCY, failure_rate=FAILURE_RATE, seed=1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        http_scheduler.READ_TIMEOUT = STALLED_READ_TIMEOUT
+        await scenario("stalled", pages, latency=STALLED_READ_TIMEOUT * 3)
+    os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+if __name__ == "__main__":
+    asyncio.run(main())
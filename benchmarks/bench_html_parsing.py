@@ -0,0 +1,128 @@
+"""Parse AFL and NRL injury pages with the old and the new HTML parsing path.
+
+Old path: the whole page parsed with html.parser, find_all('td') on every row and
+(NRL) table.find_previous('h4') per team. New path: AFL_Injuries.parse_afl_injuries
+and NRL_injuries.parse_nrl_injuries (html_tables: lxml when installed, tables and
+headings only, headings resolved in one forward pass). Both paths must produce
+the same records.
+
+Pages saved from the sites can be passed in; otherwise fixtures with the same
+structure (team tables inside a page of navigation, scripts and articles) are
+generated.
+
+Run from the repository root:
+    python benchmarks/bench_html_parsing.py [--afl afl.html] [--nrl nrl.html]
+"""
+import os
+import sys
+import random
+import argparse
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import html_tables  # noqa: E402
+import AFL_Injuries  # noqa: E402
+import NRL_injuries  # noqa: E402
+from run_log import RunLog  # noqa: E402
+from bench_timing import timed  # noqa: E402
+
+TODAY = "2024-01-01"
+TEAMS = 18
+PLAYERS_PER_TEAM = 12
+INJURIES = ["Hamstring", "Knee", "Concussion", "Ankle", "Shoulder", "Suspension"]
+RETURNS = ["TBC", "Test", "1 week", "2-3 weeks", "Season", "Indefinite"]
+
+def page_boilerplate(rng, blocks=400):
+    """Navigation, inline scripts and article teasers that surround the injury tables."""
+    parts = ['<nav><ul>' + "".join(f'<li><a href="/club/{i}">Club {i}</a></li>' for i in range(60)) + '</ul></nav>',
+             '<script>window.__STATE__ = {"data": "' + "x" * 20000 + '"};</script>']
+    for i in range(blocks):
+        parts.append(f'<div class="teaser"><a href="/news/{i}"><img src="/img/{i}.jpg" alt="">'
+                     f'<h3>Story {i}</h3><p>{"Lorem ipsum dolor sit amet. " * rng.randint(2, 6)}</p></a></div>')
+    return parts
+
+def afl_fixture(rng):
+    tables = []
+    for team in range(TEAMS):
+        rows = [f'<tr><td colspan="3">Team {team}</td></tr>']
+        rows += [f'<tr><td>Player {team} {n}</td><td>{rng.choice(INJURIES)}</td><td>{rng.choice(RETURNS)}</td></tr>'
+                 for n in range(PLAYERS_PER_TEAM)]
+        tables.append(f'<div class="injury-list"><table><tbody>{"".join(rows)}</tbody></table></div>')
+    body = page_boilerplate(rng)
+    return "<html><head><title>AFL</title></head><body>" + "".join(body[:200] + tables + body[200:]) + "</body></html>"
+
+def nrl_fixture(rng):
+    tables = []
+    for team in range(TEAMS - 1):
+        rows = ['<tr><th></th><th>Player</th><th>Reason</th><th>Expected Return</th></tr>']
+        rows += [f'<tr><td><img src="/p/{n}.png"></td><td>Player {team} {n}</td><td>{rng.choice(INJURIES)}</td>'
+                 f'<td>{rng.choice(RETURNS)}</td></tr>' for n in range(PLAYERS_PER_TEAM)]
+        tables.append(f'<div class="team"><h4>Team {team}</h4><p>Updated</p>'
+                      f'<table class="table"><tbody>{"".join(rows)}</tbody></table></div>')
+    body = page_boilerplate(rng)
+    return "<html><head><title>NRL</title></head><body>" + "".join(body[:200] + tables + body[200:]) + "</body></html>"
+
+def record(player, team_name, injury_type, return_date):
+    return {
+        "Player Name": player, "Athlete ID": "N/A", "Team": team_name,
+        "Injury ID": f"{team_name.lower().replace(' ', '_')}_{player.lower().replace(' ', '_')}",
+        "Status": "Injured", "Injury Type": injury_type, "Return Date": return_date,
+        "Short Comment": "", "Long Comment": "", "Reported Date": TODAY,
+    }
+
+def old_afl(html):
+    """Condensed copy of the previous scrape_afl_injuries parsing loop."""
+    records = []
+    for table in BeautifulSoup(html, "html.parser").find_all("table"):
+        team_name = "Unknown"
+        for row in table.find_all("tr"):
+            cols = row.find_all("td")
+            if len(cols) == 1:
+                team_name = cols[0].text.strip()
+            elif len(cols) >= 3:
+                records.append(record(cols[0].text.strip(), team_name, cols[1].text.strip(), cols[2].text.strip()))
+    return records
+
+def old_nrl(html):
+    """Condensed copy of the previous scrape_nrl_injuries parsing loop."""
+    records = []
+    for table in BeautifulSoup(html, "html.parser").find_all("table", class_="table"):
+        team_name = "Unknown"
+        for row in table.find_all("tr"):
+            cols = row.find_all("td")
+            if len(cols) == 0:
+                tag = table.find_previous("h4")
+                team_name = tag.get_text(strip=True) if tag else "Unknown Team"
+            elif len(cols) >= 3:
+                records.append(record(cols[1].text.strip(), team_name, cols[2].text.strip(), cols[3].text.strip()))
+    return records
+
+def compare(site, html, old, new):
+    old_time, old_records = timed(lambda: old(html))
+    log = RunLog()  # Logs nowhere; parsing still pays for queueing each line
+    new_time, new_records = timed(lambda: list(new(html, TODAY, log)))
+    log.close()
+    assert new_records == old_records, f"{site}: parsed records differ"
+    print(f"{site}: {len(html) / 1024:.0f} KB page, {len(new_records)} injuries")
+    print(f"  html.parser, full tree     {old_time * 1e3:8.1f} ms")
+    print(f"  {html_tables.PARSER + ', tables only':<26} {new_time * 1e3:8.1f} ms   {old_time / new_time:4.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--afl", help="Saved AFL injury list page")
+    parser.add_argument("--nrl", help="Saved Zero Tackle NRL injuries page")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    pages = {"AFL": afl_fixture(rng), "NRL": nrl_fixture(rng)}
+    for site, path in (("AFL", args.afl), ("NRL", args.nrl)):
+        if path:
+            with open(path, encoding="utf-8") as page:
+                pages[site] = page.read()
+
+    compare("AFL", pages["AFL"], old_afl, AFL_Injuries.parse_afl_injuries)
+    compare("NRL", pages["NRL"], old_nrl, NRL_injuries.parse_nrl_injuries)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Injury store ingest and query latency over a simulated season.
+
+Simulates DAYS daily reports for six leagues of about ACTIVE injuries each, with
+CHURN of them cleared and replaced every day. The previous way to answer "who
+is listed for team X" or "how long has player Y been listed" was to read the
+dated JSON Lines reports; both are timed against injury_store queries over the
+same season.
+
+Run from the repository root: python benchmarks/bench_injury_store.py
+"""
+import os
+import sys
+import json
+import time
+import random
+import tempfile
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import injury_store  # noqa: E402
+from injury_writer import read_records  # noqa: E402
+from bench_timing import print_timed  # noqa: E402
+
+LEAGUES = ["NBA", "NFL", "MLB", "NHL", "AFL", "NRL"]
+TEAMS = 30
+DAYS = 180
+ACTIVE = 300
+CHURN = 0.03
+QUERIES = 200
+
+def injury(league, n, rng, day):
+    team = f"{league} Team {n % TEAMS}"
+    return {
+        "Player Name": f"{league} Player {n}", "Athlete ID": str(n), "Team": team, "Injury ID": f"{league}-{n}",
+        "Status": rng.choice(["Out", "Day-To-Day", "Questionable", "Injured Reserve"]),
+        "Injury Type": rng.choice(["Knee", "Ankle", "Hamstring", "Shoulder"]), "Return Date": "",
+        "Short Comment": "", "Long Comment": "", "Reported Date": day,
+    }
+
+def season(rng):
+    """(date, league, records) for every simulated daily report."""
+    start = date(2025, 1, 1)
+    active = {league: [injury(league, n, rng, start.isoformat()) for n in range(ACTIVE)] for league in LEAGUES}
+    next_id = ACTIVE
+    for offset in range(DAYS):
+        day = (start + timedelta(days=offset)).isoformat()
+        for league in LEAGUES:
+            records = active[league]
+            for i in rng.sample(range(len(records)), int(ACTIVE * CHURN)):
+                records[i] = injury(league, next_id, rng, day)
+                next_id += 1
+            yield day, league, [dict(record) for record in records]
+
+def main():
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        reports = []
+        db = injury_store.connect(os.path.join(tmp, "injuries.sqlite"))
+        start = time.perf_counter()
+        for day, league, records in season(rng):
+            injury_store.upsert_report(db, league, day, records)
+            # The dated JSON Lines report the scrapers write, for the file-scan baseline
+            path = os.path.join(tmp, f"{league}_{day}.jsonl")
+            with open(path, "w", encoding="utf-8") as jsonl_file:
+                jsonl_file.writelines(json.dumps(record) + "\n" for record in records)
+            reports.append((day, league, path))
+        rows = db.execute("SELECT COUNT(*) FROM injuries").fetchone()[0]
+        print(f"{len(reports)} reports ({DAYS} days x {len(LEAGUES)} leagues), {rows} injuries stored, "
+              f"{(time.perf_counter() - start) / len(reports) * 1e3:.2f} ms per report incl. JSONL write")
+        print_timed("upsert one report (same-day rerun)",
+                    lambda: injury_store.upsert_report(db, "NBA", day, records), repeat=20)
+
+        team = "NFL Team 7"
+        latest = max(path for _, league, path in reports if league == "NFL")
+        print_timed("team X, scan latest report",
+                    lambda: [r for r in read_records(latest) if r["Team"] == team], QUERIES)
+        print_timed("team X, current_injuries", lambda: injury_store.current_injuries(db, "NFL", team), QUERIES)
+        print_timed("Out in every league, current_injuries",
+                    lambda: injury_store.current_injuries(db, status="Out"), 20)
+
+        player = "NHL Player 5"
+
+        def scan_player():
+            seen = [day for day, league, path in reports if league == "NHL"
+                    and any(r["Player Name"] == player for r in read_records(path))]
+            return seen[0], seen[-1]
+
+        print_timed("player Y history, scan every dated report", scan_player)
+        print_timed("player Y history, player_injuries", lambda: injury_store.player_injuries(db, player), QUERIES)
+        print_timed("athlete ID history, player_injuries",
+                    lambda: injury_store.player_injuries(db, athlete_id="5", league="NHL"), QUERIES)
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""JSON decode and encode throughput of each json_codec backend over a day of ESPN responses.
+
+Every JSON response in a recording (made with `python run_daily.py --record FOLDER`;
+without --recording a run against stub_server.StubServer is recorded first) is
+decoded from its raw bytes and encoded back, as fetch_json and the writers do.
+The day's injury records, built from the recorded detail documents, are then
+written as a JSON Lines report and read back with read_records' typed decode.
+Every backend must decode to the same objects and write the same bytes.
+
+Run from the repository root: python benchmarks/bench_json.py [--recording FOLDER]
+"""
+import os
+import sys
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import json_codec  # noqa: E402
+from http_recording import load_recording  # noqa: E402
+from injury_writer import InjuryRecord  # noqa: E402
+from bench_suite import record_stub_run  # noqa: E402
+from bench_timing import timed  # noqa: E402
+
+def injury_record(document):
+    """An injury report record from a detail document, as espn_scraper builds it."""
+    athlete_id = document.get("athlete", {}).get("$ref", "").split("/")[-1].split("?")[0]
+    return {
+        "Player Name": f"Player {athlete_id}", "Athlete ID": athlete_id, "Team": "Team",
+        "Injury ID": document.get("id"), "Status": document.get("status"),
+        "Injury Type": document.get("details", {}).get("type", "Unknown"),
+        "Return Date": document.get("details", {}).get("returnDate", "Unknown"),
+        "Short Comment": document.get("shortComment", ""), "Long Comment": document.get("longComment", ""),
+        "Reported Date": document.get("date", ""),
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recording", help="Folder of a run_daily.py --record recording")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        folder = args.recording
+        if folder is None:
+            folder = os.path.join(tmp, "recording")
+            record_stub_run(folder)
+        bodies = [body for content_type, body in load_recording(folder).values() if "json" in (content_type or "")]
+        size = sum(len(body) for body in bodies)
+
+        json_codec.use("json")
+        expected = [json_codec.loads(body) for body in bodies]
+        records = [injury_record(document) for document in expected if "athlete" in document]
+        report = b"".join(json_codec.dumpb(record) + b"\n" for record in records)
+
+        print(f"{len(bodies)} JSON responses ({size / 1e6:.1f} MB), {len(records)} injury records; "
+              f"backends installed: {', '.join(json_codec.BACKENDS)}")
+        print(f"{'backend':<8} {'decode':>16} {'encode':>16} {'decode+encode':>14} {'JSON Lines read':>16}")
+        baseline = None
+        for backend in reversed(json_codec.BACKENDS):
+            json_codec.use(backend)
+            decode_time, decoded = timed(lambda: [json_codec.loads(body) for body in bodies])
+            encode_time, encoded = timed(lambda: [json_codec.dumpb(document) for document in decoded])
+            read_time, read = timed(lambda: json_codec.loads_lines(report, InjuryRecord))
+            assert decoded == expected and read == records, f"{backend} decodes differently"
+            assert b"".join(json_codec.dumpb(record) + b"\n" for record in records) == report, \
+                f"{backend} encodes differently"
+
+            total = decode_time + encode_time
+            baseline = baseline or total
+            print(f"{backend:<8} {len(bodies) / decode_time:9.0f} docs/s {len(bodies) / encode_time:9.0f} docs/s "
+                  f"{total * 1e3:7.1f} ms x{baseline / total:3.1f} {len(records) / read_time:9.0f} rec/s")
+        json_codec.use(json_codec.BACKENDS[0])
+
+if __name__ == "__main__":
+    main()
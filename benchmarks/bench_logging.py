@@ -0,0 +1,103 @@
+"""Cost of a log line on the scrapers' hot path.
+
+Compares, per line with league/team/url/duration fields:
+
+  list append     the old approach: append to a list, write it all at the end
+  sync file       logging.FileHandler on the calling thread (flushes every line)
+  run_log         run_log.RunLog: the caller only queues the line; a listener
+                  thread formats and writes it
+
+"burst" logs the lines back to back: "caller" is the time the calling thread
+spends per line (for RunLog, including the GIL it shares with the listener)
+and "drain" how long closing then takes to get the remaining lines to disk.
+"paced" logs one line after every WORK_SECONDS of other work, as the scrapers
+do between responses, and reports the time added per line over no logging.
+
+Run from the repository root: python benchmarks/bench_logging.py [--lines 100000]
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from run_log import RunLog, FieldFormatter  # noqa: E402
+
+URL = "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/teams/{}/injuries"
+WORK_SECONDS = 0.0002
+PACED_LINES = 10000
+
+def work():
+    """Busy-wait WORK_SECONDS, standing in for parsing a response."""
+    end = time.perf_counter() + WORK_SECONDS
+    while time.perf_counter() < end:
+        pass
+
+def list_append(lines, folder, paced=False):
+    log_messages = []
+    start = time.perf_counter()
+    for i in range(lines):
+        if paced:
+            work()
+        log_messages.append(f"✅ Team {i % 32}: Retrieved {i % 7} injury records.")
+    caller = time.perf_counter() - start
+    with open(os.path.join(folder, "list.log"), "w") as log_file:
+        log_file.write("\n".join(log_messages))
+    return caller, time.perf_counter() - start - caller
+
+def sync_file(lines, folder, paced=False):
+    logger = logging.Logger("bench", logging.INFO)
+    handler = logging.FileHandler(os.path.join(folder, "sync.log"), mode="w", encoding="utf-8")
+    handler.setFormatter(FieldFormatter())
+    logger.addHandler(handler)
+    start = time.perf_counter()
+    for i in range(lines):
+        if paced:
+            work()
+        logger.info(f"✅ Team {i % 32}: Retrieved {i % 7} injury records.",
+                    extra={"league": "NFL", "team": f"Team {i % 32}", "url": URL.format(i % 32), "duration": 0.123})
+    caller = time.perf_counter() - start
+    handler.close()
+    return caller, time.perf_counter() - start - caller
+
+def run_log(lines, folder, paced=False):
+    log = RunLog(os.path.join(folder, "run.log"), league="NFL")
+    start = time.perf_counter()
+    for i in range(lines):
+        if paced:
+            work()
+        log.info(f"✅ Team {i % 32}: Retrieved {i % 7} injury records.",
+                 team=f"Team {i % 32}", url=URL.format(i % 32), duration=0.123)
+    caller = time.perf_counter() - start
+    log.close()
+    return caller, time.perf_counter() - start - caller
+
+def no_logging(lines, folder, paced=False):
+    start = time.perf_counter()
+    for i in range(lines):
+        if paced:
+            work()
+    return time.perf_counter() - start, 0.0
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lines", type=int, default=100000)
+    args = parser.parse_args()
+
+    print(f"burst: {args.lines} lines; paced: {PACED_LINES} lines, one per {WORK_SECONDS * 1e6:.0f} us of work")
+    print(f"{'':<12} {'caller us/line':>15} {'drain ms':>9} {'file KB':>8} {'paced us/line':>14}")
+    with tempfile.TemporaryDirectory() as folder:
+        baseline, _ = no_logging(PACED_LINES, folder, paced=True)
+        for name, bench, filename in (("list append", list_append, "list.log"),
+                                      ("sync file", sync_file, "sync.log"),
+                                      ("run_log", run_log, "run.log")):
+            caller, drain = bench(args.lines, folder)
+            size = os.path.getsize(os.path.join(folder, filename)) / 1024
+            paced, _ = bench(PACED_LINES, folder, paced=True)
+            print(f"{name:<12} {caller / args.lines * 1e6:15.2f} {drain * 1e3:9.1f} {size:8.0f} "
+                  f"{(paced - baseline) / PACED_LINES * 1e6:14.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compare Athlete ID -> Player Name lookup cost on a 5,000 player roster.
+
+Old approach: re-cast the "Athlete ID" column and boolean-mask the DataFrame
+for every injury record. New approach: player_lookup.load_player_index().
+
+Run from the repository root: python benchmarks/bench_player_lookup.py
+"""
+import os
+import sys
+import random
+import tempfile
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import player_lookup  # noqa: E402
+from bench_timing import timed  # noqa: E402
+
+ROSTER_SIZE = 5000
+LOOKUPS = 1000
+
+def main():
+    random.seed(0)
+    athlete_ids = random.sample(range(1000, 5_000_000), ROSTER_SIZE)
+    lookup_ids = [str(random.choice(athlete_ids)) for _ in range(LOOKUPS)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        player_lookup.players_folder = tmp
+        csv_path = player_lookup.players_csv_path("BENCH")
+        pd.DataFrame({
+            "Player Name": [f"Player {i}" for i in athlete_ids],
+            "Athlete ID": athlete_ids,
+        }).to_csv(csv_path, index=False)
+
+        players_df = pd.read_csv(csv_path, dtype={"Athlete ID": str})
+
+        def mask_lookups():
+            for athlete_id in lookup_ids:
+                players_df["Athlete ID"] = players_df["Athlete ID"].astype(str)
+                name = players_df.loc[players_df["Athlete ID"] == athlete_id, "Player Name"].values
+                name = name[0] if len(name) > 0 else "Unknown"
+
+        index = player_lookup.load_player_index("BENCH")
+
+        def index_lookups():
+            for athlete_id in lookup_ids:
+                index.get(athlete_id, "Unknown")
+
+        csv_load, _ = timed(lambda: pd.read_csv(csv_path, dtype={"Athlete ID": str}))
+        index_build, _ = timed(lambda: player_lookup.build_player_index(csv_path))
+        cache_load, _ = timed(lambda: player_lookup.load_player_index("BENCH"))
+        mask, _ = timed(mask_lookups, repeat=3)
+        indexed, _ = timed(index_lookups)
+
+    print(f"Roster size: {ROSTER_SIZE}, lookups: {LOOKUPS}")
+    print(f"  pandas read_csv            {csv_load * 1e3:10.2f} ms")
+    print(f"  csv -> dict index          {index_build * 1e3:10.2f} ms")
+    print(f"  cached index load          {cache_load * 1e3:10.2f} ms")
+    print(f"  mask lookup (per record)   {mask / LOOKUPS * 1e6:10.2f} us")
+    print(f"  index lookup (per record)  {indexed / LOOKUPS * 1e6:10.2f} us")
+    print(f"  speedup                    {mask / indexed:10.0f}x")
+
+if __name__ == "__main__":
+    main()
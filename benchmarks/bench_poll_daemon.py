@@ -0,0 +1,122 @@
+"""Adaptive vs fixed-interval polling over simulated days, offline.
+
+Runs poll_daemon.PollDaemon on a SimulatedClock against stub_server.StubServer
+for DAYS days from START (NBA and AFL in season, NFL off season). Each league's
+data changes CHANGES_PER_DAY times a day, GAME_SHARE of them inside its game
+windows: an ESPN change swaps an injury on one team's list or (every other
+change) moves a listed injury to a new status, an AFL change publishes a new
+injury page. For each strategy the table shows polls, requests
+served by the stub (and how many were 304 Not Modified), and the mean delay
+from a change to the poll that found it, for changes inside game windows and
+for the rest, plus the longest delay and changes still unseen at the end.
+
+Run from the repository root: python benchmarks/bench_poll_daemon.py [--days 3]
+"""
+import io
+import os
+import sys
+import random
+import asyncio
+import argparse
+import tempfile
+import contextlib
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import AFL_Injuries  # noqa: E402
+import Get_player_id  # noqa: E402
+import espn_scraper  # noqa: E402
+import poll_daemon  # noqa: E402
+from run_log import RunLog  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+from bench_html_parsing import afl_fixture  # noqa: E402
+
+LEAGUES = ["NBA", "NFL", "AFL"]
+START = datetime(2025, 3, 6, tzinfo=timezone.utc).timestamp()  # A Thursday
+DAYS = 3
+CHANGES_PER_DAY = 6
+GAME_SHARE = 0.7
+STRATEGIES = [("daily", 24 * 3600), ("hourly", 3600), ("adaptive", None)]
+
+def change_times(league, days, rng):
+    """Simulated times of a league's data changes, mostly inside its game windows."""
+    times = []
+    while len(times) < days * CHANGES_PER_DAY:
+        when = START + rng.uniform(0, days * 86400)
+        in_game = poll_daemon.phase(league, when) == "game"
+        if in_game or rng.random() > GAME_SHARE:
+            times.append(when)
+    return sorted(times)
+
+async def run_strategy(fixed_interval, days):
+    rng = random.Random(0)
+    stub = StubServer(pages={"afl": afl_fixture(random.Random(0))})
+    base_url = await stub.start()
+    for league, config in espn_scraper.LEAGUES.items():
+        config["base_url"] = stub.team_url_template(league)
+    for league in Get_player_id.leagues:
+        Get_player_id.leagues[league] = f"{base_url}/{league}/athletes"
+    AFL_Injuries.url = stub.page_url("afl")
+
+    clock = poll_daemon.SimulatedClock(START)
+    pending = {league: [] for league in LEAGUES}
+    for league in LEAGUES:
+        for version, when in enumerate(change_times(league, days, rng), 1):
+            if league == "AFL":
+                change = lambda version=version: stub.pages.update(afl=afl_fixture(random.Random(version)))
+            else:
+                team_ids = list(espn_scraper.LEAGUES[league]["team_ids"].values())
+                change_data = stub.change_status if version % 2 else stub.change_team
+                change = lambda league=league, team_id=rng.choice(team_ids), change_data=change_data: \
+                    change_data(league, team_id)
+            clock.call_at(when, lambda league=league, when=when, change=change: (pending[league].append(when), change()))
+
+    delays = {"game": [], "other": []}
+
+    def watched(league, poll):
+        async def poll_and_check():
+            changes = await poll()
+            if changes:
+                for when in pending[league]:
+                    in_game = poll_daemon.phase(league, when) == "game"
+                    delays["game" if in_game else "other"].append(clock.now() - when)
+                pending[league].clear()
+            return changes
+        return poll_and_check
+
+    pollers = {league: watched(league, poll) for league, poll in poll_daemon.league_pollers(LEAGUES, rate=1000).items()}
+    log = RunLog()
+    daemon = poll_daemon.PollDaemon(pollers, clock=clock, fixed_interval=fixed_interval, log=log)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            await daemon.run(until=START + days * 86400)
+    finally:
+        log.close()
+        await stub.stop()
+    missed = sum(len(times) for times in pending.values())
+    polls = {league: state["polls"] for league, state in daemon.state.items()}
+    return polls, stub.requests, stub.not_modified, delays, missed
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=DAYS)
+    args = parser.parse_args()
+
+    print(f"{args.days} simulated days, {CHANGES_PER_DAY} changes per league per day")
+    print(f"{'':<9} {'polls ' + '/'.join(LEAGUES):>20} {'requests':>9} {'304s':>6} "
+          f"{'game delay':>11} {'other delay':>12} {'max delay':>10} {'missed':>7}")
+    cwd = os.getcwd()
+    for name, fixed_interval in STRATEGIES:
+        with tempfile.TemporaryDirectory() as tmp:
+            os.chdir(tmp)
+            try:
+                polls, requests, not_modified, delays, missed = await run_strategy(fixed_interval, args.days)
+            finally:
+                os.chdir(cwd)
+        game, other = (sum(values) / len(values) if values else 0.0 for values in delays.values())
+        longest = max(delays["game"] + delays["other"], default=0)
+        print(f"{name:<9} {'/'.join(str(polls[league]) for league in LEAGUES):>20} {requests:9d} {not_modified:6d} "
+              f"{game / 60:7.0f} min {other / 60:8.0f} min {longest / 60:6.0f} min {missed:7d}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
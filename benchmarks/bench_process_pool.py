@@ -0,0 +1,95 @@
+"""Scaling of the CPU-bound stages over cpu_pool worker processes.
+
+For 0 (inline), 1, 2, 4 and 8 workers, times with a pool that is already started:
+
+  HTML parsing     PAGES AFL and PAGES NRL fixture pages through the parse step of
+                   html_scraper.scrape_page (cpu_pool.run), all at once on one
+                   event loop, as polling or replaying several days would
+  report           report_builder.build_report over six leagues of ROWS_PER_LEAGUE
+                   rows: league sheets rendered per worker and merged
+  JSON decode      DOCUMENTS ESPN injury detail documents decoded one per task,
+                   the way they arrive; kept inline in the scrapers because a
+                   round trip to a worker costs more than the decode itself
+
+Pool startup (forkserver with the scraper modules preloaded) is timed separately.
+Speedups need as many free cores as workers; on one core the pool only adds its
+overhead.
+
+Run from the repository root: python benchmarks/bench_process_pool.py [ROWS_PER_LEAGUE]
+"""
+import io
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import tempfile
+import contextlib
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import cpu_pool  # noqa: E402
+import report_builder  # noqa: E402
+import AFL_Injuries  # noqa: E402
+import NRL_injuries  # noqa: E402
+from bench_excel import make_frames  # noqa: E402
+from bench_html_parsing import afl_fixture, nrl_fixture, TODAY  # noqa: E402
+from bench_timing import timed  # noqa: E402
+
+WORKERS = [0, 1, 2, 4, 8]
+PAGES = 8
+ROWS_PER_LEAGUE = 5000
+DOCUMENTS = 2000
+
+def detail_document(n):
+    return json.dumps({
+        "id": str(n), "status": "Out", "date": "2025-03-01T00:00Z",
+        "athlete": {"$ref": f"http://sports.core.api.espn.com/v2/sports/basketball/athletes/{n}?lang=en"},
+        "details": {"type": "Knee", "location": "Leg", "side": "Left", "returnDate": "2025-03-15"},
+        "shortComment": f"Player {n} is out with knee soreness.",
+        "longComment": f"Player {n} left the game with knee soreness and will be re-evaluated next week.",
+    })
+
+async def parse_pages(pages):
+    jobs = [cpu_pool.run(module.parse_page, html, TODAY) for module, html in pages]
+    return sum(len(records) for records, _ in await asyncio.gather(*jobs))
+
+async def decode_documents(documents):
+    return len(await asyncio.gather(*(cpu_pool.run(json.loads, document) for document in documents)))
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else ROWS_PER_LEAGUE
+    rng = random.Random(0)
+    pages = [(AFL_Injuries, afl_fixture(rng)) for _ in range(PAGES)] + \
+            [(NRL_injuries, nrl_fixture(rng)) for _ in range(PAGES)]
+    frames = make_frames(rows)
+    documents = [detail_document(n) for n in range(DOCUMENTS)]
+
+    print(f"{os.cpu_count()} CPU(s); {2 * PAGES} pages, 6 x {rows} report rows, {DOCUMENTS} JSON documents")
+    if os.cpu_count() < max(WORKERS):
+        print(f"⚠️ Rows above {os.cpu_count()} worker(s) measure pool overhead, not scaling; "
+              f"run on a machine with {max(WORKERS)} cores for scaling numbers")
+    print(f"{'workers':>7} {'startup':>9} {'HTML parsing':>12} {'report':>12} {'JSON decode':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        output_file = os.path.join(tmp, "report.xlsx")
+        baseline = None
+        for workers in WORKERS:
+            cpu_pool.workers = workers
+            start = time.perf_counter()
+            # Start every worker so the timings below do not include process startup
+            list(cpu_pool.map_in_pool(abs, range(workers)))
+            startup = time.perf_counter() - start
+            try:
+                parse_time, _ = timed(lambda: asyncio.run(parse_pages(pages)), repeat=3)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    report_time, _ = timed(lambda: report_builder.build_report(frames, output_file), repeat=3)
+                decode_time, _ = timed(lambda: asyncio.run(decode_documents(documents)), repeat=3)
+            finally:
+                cpu_pool.shutdown()
+            times = (parse_time, report_time, decode_time)
+            baseline = baseline or times
+            print(f"{workers or 'inline':>7} {startup * 1e3:6.0f} ms "
+                  + " ".join(f"{t:6.2f}s x{b / t:3.1f}" for t, b in zip(times, baseline)))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Full roster rewrite vs incremental roster store sync, and lookup latency.
+
+Simulates four leagues of ROSTER_SIZE athletes. "Full rewrite" is the previous
+Get_player_id.py output step (DataFrame -> CSV for every league, every day);
+the roster store is timed for a first sync and for a daily sync in which
+CHANGED athletes are renamed or added.
+
+Run from the repository root: python benchmarks/bench_roster_store.py
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import roster_store  # noqa: E402
+from bench_timing import print_timed  # noqa: E402
+
+LEAGUES = ["NBA", "NFL", "MLB", "NHL"]
+ROSTER_SIZE = 5000
+CHANGED = 20
+LOOKUPS = 10000
+
+def main():
+    rng = random.Random(0)
+    rosters = {league: [(str(1000000 * i + n), f"Player {league} {n}") for n in range(ROSTER_SIZE)]
+               for i, league in enumerate(LEAGUES)}
+    tomorrow = {}
+    for league, athletes in rosters.items():
+        athletes = list(athletes)
+        for n in rng.sample(range(ROSTER_SIZE), CHANGED // 2):
+            athletes[n] = (athletes[n][0], athletes[n][1] + " Jr.")
+        athletes += [(f"9{league}{n}", f"Rookie {n}") for n in range(CHANGED // 2)]
+        tomorrow[league] = athletes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def full_rewrite():
+            for league, athletes in rosters.items():
+                df = pd.DataFrame([{"Player Name": name, "Athlete ID": athlete_id} for athlete_id, name in athletes])
+                df.to_csv(os.path.join(tmp, f"{league}_Players.csv"), index=False)
+
+        db = roster_store.connect(os.path.join(tmp, "rosters.sqlite"))
+
+        def sync(day_rosters, seen_date):
+            changed = 0
+            for league, athletes in day_rosters.items():
+                active = roster_store.load_active(db, league)
+                changed += roster_store.upsert_athletes(db, league, athletes, seen_date, active)
+                changed += roster_store.mark_departed(db, league, active, {athlete_id for athlete_id, _ in athletes})
+                roster_store.record_sync(db, league, seen_date, len(athletes))
+            db.commit()
+            return changed
+
+        print(f"{len(LEAGUES)} leagues x {ROSTER_SIZE} athletes, {CHANGED} changes per league")
+        print_timed("full CSV rewrite (previous)", full_rewrite)
+        print_timed("roster store, first sync", lambda: sync(rosters, "2025-03-01"))
+        print_timed("roster store, same-day resync", lambda: sync(rosters, "2025-03-01"))
+        changed = print_timed("roster store, next-day sync", lambda: sync(tomorrow, "2025-03-02"))
+        print(f"  rows written by next-day sync: {changed}")
+
+        ids = [rng.choice(rosters["NBA"])[0] for _ in range(LOOKUPS)]
+        start = time.perf_counter()
+        for athlete_id in ids:
+            roster_store.lookup_name(db, "NBA", athlete_id)
+        per_lookup = (time.perf_counter() - start) / LOOKUPS
+        names = print_timed("load_names (one league)", lambda: roster_store.load_names(db, "NBA"))
+        start = time.perf_counter()
+        for athlete_id in ids:
+            names.get(athlete_id)
+        per_dict = (time.perf_counter() - start) / LOOKUPS
+        print(f"{'lookup_name (indexed SELECT)':<44} {per_lookup * 1e6:10.3f} us/lookup")
+        print(f"{'dict from load_names':<44} {per_dict * 1e6:10.3f} us/lookup")
+        db.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Fan out NFL-sized injury detail requests against a rate-limited local stub.
+
+Compares the old unbounded asyncio.gather fan-out with routing the same requests
+through http_scheduler.RequestScheduler, reporting throughput, the peak request
+rate the server saw, 429 responses, requests sent before a Retry-After the server
+gave was up, and dropped records.
+
+Run from the repository root: python benchmarks/bench_scheduler.py
+"""
+import os
+import sys
+import time
+import asyncio
+
+import aiohttp
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from http_scheduler import RequestScheduler  # noqa: E402
+from run_log import RunLog  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+SERVER_RATE = 100  # requests per second the stub accepts
+TEAMS = 32
+INJURIES_PER_TEAM = 12
+
+async def unbounded_fetch(session, url):
+    async with session.get(url) as response:
+        if response.status == 200:
+            return await response.json()
+    return None
+
+async def run_scenario(name, make_fetch):
+    server = StubServer(injuries_per_team=INJURIES_PER_TEAM, max_rate=SERVER_RATE)
+    await server.start()
+    urls = [f"{server.base_url}/injury/NFL-{team}-{i}" for team in range(TEAMS) for i in range(INJURIES_PER_TEAM)]
+    log = RunLog()
+    async with aiohttp.ClientSession() as session:
+        fetch = make_fetch(session, log)
+        start = time.perf_counter()
+        results = await asyncio.gather(*(fetch(url) for url in urls))
+        elapsed = time.perf_counter() - start
+    await server.stop()
+    log.close()
+
+    fetched = sum(1 for result in results if result)
+    print(f"{name:<28} {elapsed:7.2f}s {fetched / elapsed:8.1f} rec/s "
+          f"peak {server.peak_rate:4d} req/s  429s {server.rejected:4d}  early {server.early:4d}  "
+          f"dropped {len(urls) - fetched:4d}")
+
+async def main():
+    print(f"{TEAMS * INJURIES_PER_TEAM} detail requests, server limit {SERVER_RATE} req/s")
+    await run_scenario("unbounded gather", lambda session, log: lambda url: unbounded_fetch(session, url))
+    for rate in (SERVER_RATE * 0.5, SERVER_RATE * 0.9):
+        await run_scenario(
+            f"scheduler @ {rate:.0f} req/s",
+            lambda session, log, rate=rate: lambda url, s=RequestScheduler(session, rate=rate): s.fetch_json(url, log),
+        )
+    # Configured above the server limit: adaptive backoff has to find the real rate
+    await run_scenario(
+        f"scheduler @ {SERVER_RATE * 2} req/s",
+        lambda session, log: lambda url, s=RequestScheduler(session, rate=SERVER_RATE * 2): s.fetch_json(url, log),
+    )
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+"""Cold-start import cost of each entry script, measured with `python -X importtime`.
+
+Every module is imported in a fresh interpreter from an empty working directory,
+REPEAT times, and the best cumulative import time is reported next to the cost
+of `import pandas` (the target: scripts that only emit JSON must stay well under
+it). The three heaviest top-level imports of each script are listed, and a
+script that creates files or folders at import time is flagged.
+
+Run from the repository root: python benchmarks/bench_startup.py
+"""
+import os
+import sys
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = [
+    "espn_scraper", "NBA_Injuries", "Get_player_id", "AFL_Injuries", "NRL_injuries",
+    "Excel_sheet", "Google_sheet", "run_daily",
+]
+BASELINE = "pandas"
+REPEAT = 5
+
+def import_times(module, cwd):
+    """(cumulative us, {direct import: cumulative us}) of one `-X importtime` run."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=env, capture_output=True, text=True, check=True,
+    )
+    # Children are reported before their parent, indented two spaces per level
+    children = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|")
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        if level == 1:
+            children[name.strip()] = int(cumulative_us)
+        elif level == 0:
+            if name.strip() == module:
+                return int(cumulative_us), children
+            children = {}
+    raise RuntimeError(f"{module} not found in -X importtime output")
+
+def best_import(module):
+    """Best cumulative time (ms), heaviest direct imports and files created at import time."""
+    best, heaviest, created = float("inf"), [], []
+    for _ in range(REPEAT):
+        with tempfile.TemporaryDirectory() as cwd:
+            total, children = import_times(module, cwd)
+            created = created or sorted(os.listdir(cwd))
+        if total / 1e3 < best:
+            best = total / 1e3
+            heaviest = sorted(((name, us / 1e3) for name, us in children.items()),
+                              key=lambda item: item[1], reverse=True)[:3]
+    return best, heaviest, created
+
+def main():
+    baseline, _, _ = best_import(BASELINE)
+    print(f"Best of {REPEAT} cold imports (python -X importtime)")
+    print(f"  {'import ' + BASELINE:<22} {baseline:8.1f} ms  (reference)")
+    for module in MODULES:
+        total, heaviest, created = best_import(module)
+        top = ", ".join(f"{name} {ms:.0f}" for name, ms in heaviest)
+        print(f"  {'import ' + module:<22} {total:8.1f} ms  {total / baseline:5.0%} of {BASELINE}  [{top}]")
+        if created:
+            print(f"    ⚠️ created at import time: {', '.join(created)}")
+
+if __name__ == "__main__":
+    main()
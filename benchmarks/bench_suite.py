@@ -0,0 +1,221 @@
+"""Offline end-to-end benchmark of every scraper and the Excel report.
+
+Replays a recording (made with `python run_daily.py --record FOLDER`) through
+replay_server.ReplayServer with REPLAY_LATENCY seconds per response, and runs
+each stage in a fresh interpreter, in order, in one working directory:
+
+  rosters   Get_player_id.sync_rosters()
+  espn      espn_scraper.run_leagues(), every league, no cache, full refetch
+  afl, nrl  AFL_Injuries.run() / NRL_injuries.run(), no cache
+  excel     Excel_sheet.main() over the reports the scrapers just wrote
+
+For each stage it reports wall time, records produced (athletes for rosters,
+report rows for excel) and records/sec, requests served, requests missing from
+the recording, and the peak RSS of the stage's process. Without --recording,
+a recording of a run against stub_server.StubServer is made first. --json
+saves the results to compare against a later run.
+
+Run from the repository root:
+    python benchmarks/bench_suite.py [--recording FOLDER] [--latency 0.05] [--json results.json]
+"""
+import io
+import os
+import sys
+import json
+import time
+import random
+import resource
+import contextlib
+import asyncio
+import argparse
+import tempfile
+import threading
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+STAGES = ["rosters", "espn", "afl", "nrl", "excel"]
+REPLAY_LATENCY = 0.05
+RATE = 1000  # Requests per second: high enough that the scrapers, not the rate limit, are measured
+
+def count_lines(path):
+    if not os.path.exists(path):
+        return 0
+    with open(path, encoding="utf-8") as lines:
+        return sum(1 for _ in lines)
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB.
+
+    VmHWM belongs to the process's own address space; ru_maxrss would also count
+    the benchmark process's memory, inherited through fork.
+    """
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_stage(stage, rate):
+    """Run one stage in this process and return how many records it produced."""
+    import espn_scraper
+    import Get_player_id
+    import AFL_Injuries
+    import NRL_injuries
+    import Excel_sheet
+    import roster_store
+
+    if stage == "rosters":
+        Get_player_id.REQUESTS_PER_SECOND = rate
+        asyncio.run(Get_player_id.sync_rosters())
+        db = roster_store.connect()
+        try:
+            return db.execute("SELECT COUNT(*) FROM athletes").fetchone()[0]
+        finally:
+            db.close()
+    if stage == "espn":
+        asyncio.run(espn_scraper.run_leagues(rate=rate, use_cache=False, incremental=False))
+        return sum(count_lines(espn_scraper.league_paths(league)["latest_jsonl"]) for league in espn_scraper.LEAGUES)
+    if stage in ("afl", "nrl"):
+        module = AFL_Injuries if stage == "afl" else NRL_injuries
+        asyncio.run(module.run(use_cache=False))
+        return count_lines(os.path.join(module.main_folder, "latest", f"{module.main_folder}_latest.jsonl"))
+    if stage == "excel":
+        Excel_sheet.main()
+        return sum(max(0, count_lines(path) - 1) for path in Excel_sheet.league_files.values())
+    raise ValueError(stage)
+
+def child_main(args):
+    """Entry point of a stage process: redirect the scrapers to the replay server and run."""
+    from replay_server import redirect_scrapers
+    from http_recording import load_endpoints
+
+    redirect_scrapers(args.replay, load_endpoints(args.recording))
+    records = run_stage(args.child, args.rate)
+    print(f"RESULT {json.dumps({'records': records, 'peak_rss_mb': peak_rss_mb()})}")
+
+def record_stub_run(folder):
+    """Record a run of every scraper against the stub server."""
+    import http_scheduler
+    import espn_scraper
+    import Get_player_id
+    import AFL_Injuries
+    import NRL_injuries
+    from run_daily import scraper_endpoints
+    from http_recording import Recorder
+    from stub_server import StubServer
+    from bench_html_parsing import afl_fixture, nrl_fixture
+
+    async def record():
+        rng = random.Random(0)
+        stub = StubServer(pages={"afl": afl_fixture(rng), "nrl": nrl_fixture(rng)})
+        base_url = await stub.start()
+        for league, config in espn_scraper.LEAGUES.items():
+            config["base_url"] = stub.team_url_template(league)
+        for league in Get_player_id.leagues:
+            Get_player_id.leagues[league] = f"{base_url}/{league}/athletes"
+        AFL_Injuries.url = stub.page_url("afl")
+        NRL_injuries.url = stub.page_url("nrl")
+
+        http_scheduler.recorder = Recorder(folder, scraper_endpoints())
+        try:
+            # No rosters are synced first, so unknown athletes are resolved (and recorded) too
+            await espn_scraper.run_leagues(rate=RATE, use_cache=False, incremental=False)
+            Get_player_id.REQUESTS_PER_SECOND = RATE
+            await Get_player_id.sync_rosters()
+            await AFL_Injuries.run(use_cache=False)
+            await NRL_injuries.run(use_cache=False)
+        finally:
+            http_scheduler.recorder.close()
+            http_scheduler.recorder = None
+            await stub.stop()
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                asyncio.run(record())
+        finally:
+            os.chdir(cwd)
+
+def start_replay_server(folder, latency):
+    """Run a ReplayServer on a background event loop; returns the server once it listens."""
+    from replay_server import ReplayServer
+
+    server = ReplayServer(folder, latency)
+    loop = asyncio.new_event_loop()
+    started = threading.Event()
+
+    def serve():
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(server.start())
+        started.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    started.wait()
+    return server
+
+def measure(stage, args, server, workdir):
+    """Run a stage in a fresh interpreter; returns wall time, records, requests and peak RSS."""
+    requests_before, missing_before = server.requests, server.missing
+    command = [sys.executable, os.path.abspath(__file__), "--child", stage, "--replay", server.base_url,
+               "--recording", args.recording, "--rate", str(args.rate)]
+    start = time.perf_counter()
+    process = subprocess.run(command, cwd=workdir, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    elapsed = time.perf_counter() - start
+    if process.returncode != 0:
+        raise RuntimeError(f"{stage} failed:\n{process.stdout}")
+    result = json.loads(process.stdout.rsplit("RESULT ", 1)[1])
+    return {
+        "stage": stage,
+        "seconds": elapsed,
+        "records": result["records"],
+        "records_per_second": result["records"] / elapsed,
+        "requests": server.requests - requests_before,
+        "missing": server.missing - missing_before,
+        "peak_rss_mb": result["peak_rss_mb"],
+    }
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--recording", help="Folder written by run_daily.py --record (default: record the stub)")
+    parser.add_argument("--latency", type=float, default=REPLAY_LATENCY, help="Seconds added to every response")
+    parser.add_argument("--rate", type=float, default=RATE, help="Scraper request rate during replay")
+    parser.add_argument("--json", help="Save the results to this file")
+    parser.add_argument("--child", choices=STAGES, help=argparse.SUPPRESS)
+    parser.add_argument("--replay", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child_main(args)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if not args.recording:
+            args.recording = os.path.join(tmp, "recording")
+            record_stub_run(args.recording)
+        args.recording = os.path.abspath(args.recording)
+        server = start_replay_server(args.recording, args.latency)
+        workdir = os.path.join(tmp, "work")
+        os.makedirs(workdir)
+
+        print(f"Replaying {len(server.recording)} responses with {args.latency * 1e3:.0f} ms latency")
+        print(f"{'stage':<8} {'seconds':>8} {'records':>8} {'rec/s':>8} {'requests':>9} {'missing':>8} {'peak RSS':>9}")
+        results = []
+        for stage in STAGES:
+            result = measure(stage, args, server, workdir)
+            results.append(result)
+            print(f"{stage:<8} {result['seconds']:8.2f} {result['records']:8d} {result['records_per_second']:8.0f} "
+                  f"{result['requests']:9d} {result['missing']:8d} {result['peak_rss_mb']:7.1f} MB")
+
+    if args.json:
+        with open(args.json, "w") as json_file:
+            json.dump(results, json_file, indent=4)
+
+if __name__ == "__main__":
+    main()
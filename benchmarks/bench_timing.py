@@ -0,0 +1,17 @@
+"""Timing helpers shared by the benchmark scripts."""
+import time
+
+def timed(func, repeat=5):
+    """Best wall time of `repeat` calls to func in seconds, and its last result."""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def print_timed(name, func, repeat=1):
+    """Print func's best time over `repeat` calls on one line after `name`; returns its result."""
+    elapsed, result = timed(func, repeat)
+    print(f"{name:<44} {elapsed * 1e3:10.3f} ms")
+    return result
@@ -0,0 +1,83 @@
+"""Local server that replays a recording made with `run_daily.py --record FOLDER`.
+
+A recorded URL such as https://sports.core.api.espn.com/v2/... is served at
+<base_url>/https/sports.core.api.espn.com/v2/..., and every recorded origin
+inside a response body (e.g. ESPN $ref links) is rewritten the same way, so a
+scraper pointed at the server with redirect_scrapers() (which starts each scraper
+from the entry URLs saved with the recording) never leaves it.
+Every response is delayed by `latency` seconds; URLs missing from the recording
+answer 404 and are counted in `missing`.
+"""
+import asyncio
+from urllib.parse import urlsplit
+
+from aiohttp import web
+
+from http_recording import load_recording, load_endpoints
+
+def replay_url(base_url, url):
+    """Where a recorded URL is served by a replay server at base_url."""
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{base_url}/{parts.scheme}/{parts.netloc}{parts.path}{query}"
+
+def redirect_scrapers(base_url, endpoints):
+    """Point every scraper's hardcoded endpoints (as saved with a recording, see
+    run_daily.scraper_endpoints) at a replay server."""
+    import espn_scraper
+    import Get_player_id
+    import AFL_Injuries
+    import NRL_injuries
+
+    for league, url in endpoints["espn"].items():
+        espn_scraper.LEAGUES[league]["base_url"] = replay_url(base_url, url)
+    for league, url in endpoints["rosters"].items():
+        Get_player_id.leagues[league] = replay_url(base_url, url)
+    AFL_Injuries.url = replay_url(base_url, endpoints["afl"])
+    NRL_injuries.url = replay_url(base_url, endpoints["nrl"])
+
+class ReplayServer:
+    def __init__(self, folder, latency=0.0):
+        self.recording = load_recording(folder)
+        self.endpoints = load_endpoints(folder)
+        self.latency = latency
+        self.responses = {}
+        self.requests = 0
+        self.missing = 0
+        self.runner = None
+        self.base_url = None
+
+    def _rewrite_bodies(self):
+        """Serve every recorded origin from this server, in bodies as well as URLs."""
+        origins = {f"{urlsplit(url).scheme}://{urlsplit(url).netloc}" for url in self.recording}
+        for url, (content_type, body) in self.recording.items():
+            for origin in origins:
+                body = body.replace(origin.encode(), replay_url(self.base_url, origin).encode())
+            self.responses[replay_url("", url)] = (content_type, body)
+
+    async def replay(self, request):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        # raw_path is the request target (path and query) exactly as the client sent it
+        response = self.responses.get(request.raw_path)
+        if response is None:
+            self.missing += 1
+            return web.Response(status=404)
+        content_type, body = response
+        return web.Response(body=body, headers={"Content-Type": content_type or "application/octet-stream"})
+
+    async def start(self, port=0):
+        app = web.Application()
+        app.router.add_get("/{tail:.*}", self.replay)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        self._rewrite_bodies()
+        return self.base_url
+
+    async def stop(self):
+        await self.runner.cleanup()
@@ -0,0 +1,176 @@
+"""Local stand-in for the ESPN injuries API used by the benchmarks.
+
+Serves /<league>/athletes (paged like the v3 athletes endpoint), /athletes/<id>,
+/<league>/teams/<team_id>/injuries with `injuries_per_team` $ref items and
+/injury/<injury_id> detail documents. Optionally enforces a request rate (answering
+429 with Retry-After when more than `max_rate` requests arrive within one second,
+and counting in `early` the requests that arrive before that Retry-After is up),
+adds latency and fails a fraction of requests with 503. Team injury lists and
+detail documents carry an ETag and answer 304 to a matching If-None-Match;
+change_team() swaps one injury of a team's list for a new one and change_status()
+moves one listed injury to the next of STATUSES (its team's list stays the same).
+
+HTML pages passed as `pages` are served at /pages/<name> the same way, compressed
+with brotli or gzip according to Accept-Encoding (counted in `encodings`).
+"""
+import gzip
+import asyncio
+import random
+import time
+import zlib
+from collections import Counter, deque
+
+from aiohttp import web
+
+STATUSES = ["Out", "Day-To-Day", "Questionable"]
+
+class StubServer:
+    def __init__(self, injuries_per_team=5, max_rate=None, latency=0.0, failure_rate=0.0, seed=0,
+                 roster_size=2000, pages=None):
+        self.pages = pages or {}
+        self.encodings = Counter()
+        self.injuries_per_team = injuries_per_team
+        self.team_changes = Counter()
+        self.status_changes = Counter()
+        self.roster_size = roster_size
+        self.max_rate = max_rate
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+        self.recent = deque()
+        self.requests = 0
+        self.rejected = 0
+        self.early = 0
+        self.retry_until = 0.0
+        self.failed = 0
+        self.not_modified = 0
+        self.athlete_requests = 0
+        self.peak_rate = 0
+        self.runner = None
+        self.base_url = None
+
+    def _over_rate(self):
+        now = time.monotonic()
+        self.recent.append(now)
+        while self.recent and self.recent[0] <= now - 1.0:
+            self.recent.popleft()
+        self.peak_rate = max(self.peak_rate, len(self.recent))
+        return self.max_rate is not None and len(self.recent) > self.max_rate
+
+    @web.middleware
+    async def middleware(self, request, handler):
+        self.requests += 1
+        if time.monotonic() < self.retry_until:
+            self.early += 1
+        if self._over_rate():
+            self.rejected += 1
+            self.retry_until = time.monotonic() + 1
+            return web.Response(status=429, headers={"Retry-After": "1"})
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.failure_rate and self.random.random() < self.failure_rate:
+            self.failed += 1
+            return web.Response(status=503)
+        return await handler(request)
+
+    def change_team(self, league, team_id):
+        """Replace the oldest injury on a team's list with a new one."""
+        self.team_changes[(league, str(team_id))] += 1
+
+    def change_status(self, league, team_id):
+        """Change the status of the newest injury on a team's list; returns its injury ID."""
+        first = self.team_changes[(league, str(team_id))]
+        injury_id = f"{league}-{team_id}-{first + self.injuries_per_team - 1}"
+        self.status_changes[injury_id] += 1
+        return injury_id
+
+    async def team_injuries(self, request):
+        team_id = request.match_info["team_id"]
+        league = request.match_info["league"]
+        first = self.team_changes[(league, team_id)]
+        etag = f'"{league}-{team_id}-{first}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        items = [{"$ref": f"{self.base_url}/injury/{league}-{team_id}-{i}?lang=en"}
+                 for i in range(first, first + self.injuries_per_team)]
+        return web.json_response({"count": len(items), "items": items}, headers={"ETag": etag})
+
+    async def injury(self, request):
+        injury_id = request.match_info["injury_id"]
+        athlete_id = zlib.crc32(injury_id.encode()) % 100000
+        version = self.status_changes[injury_id]
+        etag = f'"{injury_id}-{version}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(headers={"ETag": etag}, data={
+            "id": injury_id,
+            "status": STATUSES[version % len(STATUSES)],
+            "date": "2025-03-01T00:00Z",
+            "athlete": {"$ref": f"{self.base_url}/athletes/{athlete_id}?lang=en"},
+            "details": {"type": "Knee", "returnDate": "2025-03-15"},
+            "shortComment": "Knee soreness.",
+            "longComment": "Listed as out with knee soreness.",
+        })
+
+    async def athletes(self, request):
+        limit = int(request.query.get("limit", 25))
+        page = int(request.query.get("page", 1))
+        start = (page - 1) * limit
+        ids = range(start, min(start + limit, self.roster_size))
+        return web.json_response({
+            "count": self.roster_size,
+            "pageIndex": page,
+            "pageSize": limit,
+            "pageCount": -(-self.roster_size // limit),
+            "items": [{"id": str(100000 + i), "fullName": f"Player {i}"} for i in ids],
+        })
+
+    async def athlete(self, request):
+        athlete_id = request.match_info["athlete_id"]
+        self.athlete_requests += 1
+        return web.json_response({"id": athlete_id, "fullName": f"Player {athlete_id}"})
+
+    async def page(self, request):
+        name = request.match_info["name"]
+        if name not in self.pages:
+            return web.Response(status=404)
+        body = self.pages[name].encode("utf-8")
+        etag = f'"{zlib.crc32(body):08x}"'
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+        headers = {"ETag": etag, "Content-Type": "text/html; charset=utf-8"}
+        accept = request.headers.get("Accept-Encoding", "")
+        if "br" in accept:
+            import brotli
+            body, headers["Content-Encoding"] = brotli.compress(body), "br"
+        elif "gzip" in accept:
+            body, headers["Content-Encoding"] = gzip.compress(body), "gzip"
+        self.encodings[headers.get("Content-Encoding", "identity")] += 1
+        return web.Response(body=body, headers=headers)
+
+    async def start(self, port=0):
+        app = web.Application(middlewares=[self.middleware])
+        app.router.add_get("/{league}/teams/{team_id}/injuries", self.team_injuries)
+        app.router.add_get("/injury/{injury_id}", self.injury)
+        app.router.add_get("/{league}/athletes", self.athletes)
+        app.router.add_get("/athletes/{athlete_id}", self.athlete)
+        app.router.add_get("/pages/{name}", self.page)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", port)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+    def page_url(self, name):
+        return f"{self.base_url}/pages/{name}"
+
+    def team_url_template(self, league):
+        return f"{self.base_url}/{league}/teams/{{}}/injuries"
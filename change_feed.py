@@ -0,0 +1,62 @@
+import hashlib
+import json_codec
+from datetime import datetime, timezone
+
+# Fields compared between snapshots. Injury ID is the key, and Reported Date is left
+# out because the AFL and NRL scrapers stamp it with the scrape date.
+FINGERPRINT_FIELDS = (
+    "Player Name", "Athlete ID", "Team", "Status", "Injury Type", "Return Date", "Short Comment", "Long Comment",
+)
+
+# Fields every change-log entry carries to say which injury it is about
+ENTRY_FIELDS = ("Injury ID", "Player Name", "Team")
+
+def fingerprint(record):
+    """8-byte hash of a record's compared fields; equal fingerprints mean an unchanged injury."""
+    data = "\x1f".join(str(record.get(field) or "") for field in FINGERPRINT_FIELDS)
+    return hashlib.blake2b(data.encode(), digest_size=8).digest()
+
+def diff_fingerprints(previous, current):
+    """Injury IDs added, changed and removed between two Injury ID -> fingerprint
+    snapshots, in one pass over each."""
+    added, changed = [], []
+    for injury_id, new in current.items():
+        old = previous.get(injury_id)
+        if old is None:
+            added.append(injury_id)
+        elif old != new:
+            changed.append(injury_id)
+    removed = [injury_id for injury_id in previous if injury_id not in current]
+    return added, changed, removed
+
+def changed_fields(old, new):
+    """Field -> [old, new] for the compared fields that differ between two records."""
+    return {field: [old.get(field), new.get(field)] for field in FINGERPRINT_FIELDS
+            if (old.get(field) or "") != (new.get(field) or "")}
+
+def change_entries(league, added, changed, removed):
+    """Compact change-log entries: added injuries in full, changed ones as their changed
+    fields and removed ones by name. `changed` holds (old, new) record pairs."""
+    entries = [{"change": "added", "league": league, **record} for record in added]
+    for old, new in changed:
+        entries.append({"change": "changed", "league": league, **{field: new.get(field) for field in ENTRY_FIELDS},
+                        "fields": changed_fields(old, new)})
+    for record in removed:
+        entries.append({"change": "removed", "league": league, **{field: record.get(field) for field in ENTRY_FIELDS},
+                        "Status": record.get("Status")})
+    return entries
+
+def summary(league, entries):
+    counts = {"added": 0, "changed": 0, "removed": 0}
+    for entry in entries:
+        counts[entry["change"]] += 1
+    return f"🔄 {league}: {counts['added']} added, {counts['changed']} changed, {counts['removed']} removed"
+
+def append_changes(filename, entries):
+    """Append a run's change-log entries, stamped with the run's time, to a JSON Lines file."""
+    if not entries:
+        return
+    run = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    with open(filename, "a", encoding="utf-8") as changes_file:
+        for entry in entries:
+            changes_file.write(json_codec.dumps({"run": run, **entry}) + "\n")
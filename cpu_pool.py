@@ -0,0 +1,51 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Worker processes for the CPU-bound stages (parsing the AFL and NRL pages, rendering
+# the report's league sheets); 0 runs them inline in the calling process
+workers = 0
+
+# Modules the workers need, imported once in the fork server instead of in every worker
+PRELOAD = ["AFL_Injuries", "NRL_injuries", "report_builder"]
+
+_executor = None
+_executor_workers = 0
+
+def executor():
+    """The shared process pool, started on first use; None when stages run inline."""
+    global _executor, _executor_workers
+    if workers <= 0:
+        return None
+    if _executor is None or _executor_workers != workers:
+        shutdown()
+        # Workers are forked from a clean server process rather than from this one,
+        # which has the log listener and resolver threads running
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        if "forkserver" in methods:
+            context.set_forkserver_preload(PRELOAD)
+        _executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        _executor_workers = workers
+    return _executor
+
+async def run(func, *args):
+    """func(*args) in a worker process without blocking the event loop, or inline."""
+    pool = executor()
+    if pool is None:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+
+def map_in_pool(func, *iterables):
+    """map() over the worker processes (results in order), or inline."""
+    pool = executor()
+    if pool is None:
+        return list(map(func, *iterables))
+    return list(pool.map(func, *iterables))
+
+def shutdown():
+    """Stop the worker processes; the next executor() call starts new ones."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown()
+        _executor = None
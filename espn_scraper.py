@@ -0,0 +1,431 @@
+import os
+import time
+import argparse
+import asyncio
+from datetime import datetime, timedelta
+import json_codec
+import roster_store
+import metrics
+from player_lookup import load_player_index
+from http_scheduler import RequestScheduler, client_session
+from http_cache import HTTPCache
+from injury_writer import InjuryWriter, read_records
+from history_store import archive_report
+from injury_store import store_report
+from run_log import RunLog
+
+def today():
+    """Today's date as used in the dated report folders (looked up per run, not at import)."""
+    return datetime.today().strftime("%Y-%m-%d")
+
+# Per-league settings for the ESPN injury endpoints. Player names are read from
+# player_ids/<LEAGUE>_Players.csv (see Get_player_id.py).
+LEAGUES = {
+    "NBA": {
+        "main_folder": "nba_injuries",
+        "base_url": "https://sports.core.api.espn.com/v2/sports/basketball/leagues/nba/teams/{}/injuries",
+        "team_ids": {
+            "Atlanta Hawks": 1, "Boston Celtics": 2, "Brooklyn Nets": 17, "Charlotte Hornets": 30,
+            "Chicago Bulls": 4, "Cleveland Cavaliers": 5, "Dallas Mavericks": 6, "Denver Nuggets": 7,
+            "Detroit Pistons": 8, "Golden State Warriors": 9, "Houston Rockets": 10, "Indiana Pacers": 11,
+            "LA Clippers": 12, "Los Angeles Lakers": 13, "Memphis Grizzlies": 29, "Miami Heat": 14,
+            "Milwaukee Bucks": 15, "Minnesota Timberwolves": 16, "New Orleans Pelicans": 3, "New York Knicks": 18,
+            "Oklahoma City Thunder": 25, "Orlando Magic": 19, "Philadelphia 76ers": 20, "Phoenix Suns": 21,
+            "Portland Trail Blazers": 22, "Sacramento Kings": 23, "San Antonio Spurs": 24, "Toronto Raptors": 28,
+            "Utah Jazz": 26, "Washington Wizards": 27
+        },
+    },
+    "NFL": {
+        "main_folder": "nfl_injuries",
+        "base_url": "https://sports.core.api.espn.com/v2/sports/football/leagues/nfl/teams/{}/injuries",
+        "team_ids": {
+            "Arizona Cardinals": 22, "Atlanta Falcons": 1, "Baltimore Ravens": 33, "Buffalo Bills": 2,
+            "Carolina Panthers": 29, "Chicago Bears": 3, "Cincinnati Bengals": 4, "Cleveland Browns": 5,
+            "Dallas Cowboys": 6, "Denver Broncos": 7, "Detroit Lions": 8, "Green Bay Packers": 9,
+            "Houston Texans": 34, "Indianapolis Colts": 11, "Jacksonville Jaguars": 30, "Kansas City Chiefs": 12,
+            "Las Vegas Raiders": 13, "Los Angeles Chargers": 24, "Los Angeles Rams": 14, "Miami Dolphins": 15,
+            "Minnesota Vikings": 16, "New England Patriots": 17, "New Orleans Saints": 18, "New York Giants": 19,
+            "New York Jets": 20, "Philadelphia Eagles": 21, "Pittsburgh Steelers": 23, "San Francisco 49ers": 25,
+            "Seattle Seahawks": 26, "Tampa Bay Buccaneers": 27, "Tennessee Titans": 10, "Washington Commanders": 28
+        },
+    },
+    "MLB": {
+        "main_folder": "mlb_injuries",
+        "base_url": "https://sports.core.api.espn.com/v2/sports/baseball/leagues/mlb/teams/{}/injuries",
+        "team_ids": {
+            "Arizona Diamondbacks": 29, "Atlanta Braves": 15, "Baltimore Orioles": 1, "Boston Red Sox": 2,
+            "Chicago Cubs": 16, "Chicago White Sox": 4, "Cincinnati Reds": 17, "Cleveland Guardians": 5,
+            "Colorado Rockies": 27, "Detroit Tigers": 6, "Houston Astros": 18, "Kansas City Royals": 7,
+            "Los Angeles Angels": 3, "Los Angeles Dodgers": 19, "Miami Marlins": 28, "Milwaukee Brewers": 8,
+            "Minnesota Twins": 9, "New York Mets": 21, "New York Yankees": 10, "Oakland Athletics": 11,
+            "Philadelphia Phillies": 22, "Pittsburgh Pirates": 23, "San Diego Padres": 25, "San Francisco Giants": 26,
+            "Seattle Mariners": 12, "St. Louis Cardinals": 24, "Tampa Bay Rays": 30, "Texas Rangers": 13,
+            "Toronto Blue Jays": 14, "Washington Nationals": 20
+        },
+    },
+    "NHL": {
+        "main_folder": "nhl_injuries",
+        "base_url": "https://sports.core.api.espn.com/v2/sports/hockey/leagues/nhl/teams/{}/injuries",
+        "team_ids": {
+            "Anaheim Ducks": 25, "Arizona Coyotes": 53, "Boston Bruins": 1, "Buffalo Sabres": 2,
+            "Calgary Flames": 3, "Carolina Hurricanes": 7, "Chicago Blackhawks": 4, "Colorado Avalanche": 5,
+            "Columbus Blue Jackets": 29, "Dallas Stars": 9, "Detroit Red Wings": 6, "Edmonton Oilers": 10,
+            "Florida Panthers": 11, "Los Angeles Kings": 26, "Minnesota Wild": 30, "Montreal Canadiens": 8,
+            "Nashville Predators": 18, "New Jersey Devils": 1, "New York Islanders": 12, "New York Rangers": 13,
+            "Ottawa Senators": 14, "Philadelphia Flyers": 15, "Pittsburgh Penguins": 16, "San Jose Sharks": 28,
+            "Seattle Kraken": 55, "St. Louis Blues": 19, "Tampa Bay Lightning": 20, "Toronto Maple Leafs": 21,
+            "Vancouver Canucks": 22, "Vegas Golden Knights": 54, "Washington Capitals": 23, "Winnipeg Jets": 24
+        },
+    },
+}
+
+# Connection pool shared by every league: keep-alive connections to the ESPN API
+# are reused across leagues instead of paying a TLS handshake per script.
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 30
+KEEPALIVE_TIMEOUT = 60
+
+# Request scheduling: every ESPN request goes through a RequestScheduler that caps
+# in-flight requests and the request rate per host, retrying 429/5xx with backoff.
+REQUESTS_PER_SECOND = 20
+MAX_CONCURRENT_REQUESTS = 50
+MAX_CONCURRENT_PER_HOST = 20
+
+# Incremental runs reuse a listed injury's record from the last run. With the HTTP cache
+# the record is revalidated every run; without it, it is refetched once it is this many
+# days old, so status, return date and comment changes can show that late
+MAX_RECORD_AGE_DAYS = 3
+
+# fetch_json() result for an injury whose cached detail document is still current
+UNCHANGED = object()
+
+def league_paths(league, date=None):
+    """Output file paths for a league's run on `date` (default: today)."""
+    date = date or today()
+    main_folder = LEAGUES[league]["main_folder"]
+    prefix = main_folder  # e.g. "nba_injuries"
+    folder_name = os.path.join(main_folder, f"{prefix}_{date}")
+    latest_folder = os.path.join(main_folder, "latest")
+    return {
+        "prefix": prefix,
+        "folder": folder_name,
+        "log": os.path.join(folder_name, "scraper.log"),
+        "resolved": os.path.join(folder_name, "resolved_injuries.json"),
+        "metrics": os.path.join(folder_name, "metrics.jsonl"),
+        "changes": os.path.join(folder_name, "changes.jsonl"),
+        "latest_folder": latest_folder,
+        "latest_jsonl": os.path.join(latest_folder, f"{prefix}_latest.jsonl"),
+        "latest_csv": os.path.join(latest_folder, f"{prefix}_latest.csv"),
+        "manifest": os.path.join(latest_folder, "manifest.json"),
+    }
+
+def load_previous_run(league):
+    """Load the last run's per-team manifest (Injury ID -> date its details were fetched)
+    and its records keyed by Injury ID."""
+    paths = league_paths(league)
+    manifest, records = {}, {}
+    try:
+        manifest = json_codec.load(paths["manifest"])
+        records = {str(record["Injury ID"]): record for record in read_records(paths["latest_jsonl"])}
+        # Older manifests list bare IDs with no fetch date, so those records are refetched
+        manifest = {team: ids if isinstance(ids, dict) else dict.fromkeys(ids) for team, ids in manifest.items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}, {}  # No usable previous run, so fetch everything
+    return manifest, records
+
+def new_league_run(league, incremental=True, keep_records=False):
+    """Per-league state for one scrape: settings, player names, output writer and log."""
+    # Loaded in full mode too: a team whose list cannot be fetched keeps its last known injuries
+    manifest, previous_records = load_previous_run(league)
+    date = today()
+    paths = league_paths(league, date)
+    # Records whose details were fetched on or before this date are refetched
+    refresh_before = (datetime.strptime(date, "%Y-%m-%d") - timedelta(days=MAX_RECORD_AGE_DAYS)).strftime("%Y-%m-%d")
+    return {
+        "league": league,
+        "date": date,
+        "refresh_before": refresh_before,
+        "config": LEAGUES[league],
+        "player_names": load_player_index(league),
+        "writer": InjuryWriter(paths["folder"], paths["latest_folder"], paths["prefix"], keep_records),
+        "log": RunLog(paths["log"], league=league),
+        "incremental": incremental,
+        "previous_manifest": manifest,
+        "previous_records": previous_records,
+        "manifest": {},
+        "resolved": [],
+        "unresolved": [],
+        "failed_teams": [],
+        "changes": None,
+        "records": None,
+    }
+
+def injury_id_from_ref(ref_url):
+    """Injury ID at the end of an injury $ref URL (query parameters removed)."""
+    return ref_url.split("?")[0].rstrip("/").split("/")[-1]
+
+async def fetch_injury_details(scheduler, run, ref_urls):
+    """Fetch full injury details from the given reference URLs."""
+    tasks = [scheduler.fetch_json(url["$ref"], run["log"], tag=run["league"]) for url in ref_urls]
+    return await asyncio.gather(*tasks)
+
+async def fetch_injury_data(scheduler, run, team, team_id):
+    """Fetch injury list for a team and retrieve full injury details."""
+    log = run["log"].bind(team=team)
+    url = run["config"]["base_url"].format(team_id)
+    team_data = await scheduler.fetch_json(url, log, tag=run["league"])
+
+    if team_data is None or "items" not in team_data:
+        # A list that could not be fetched says nothing about which injuries cleared: carry
+        # the team's last known injuries forward and keep them listed in the injury store
+        run["failed_teams"].append(team)
+        previous_records = run["previous_records"]
+        known = run["previous_manifest"].get(team, {})
+        kept = {injury_id: fetched for injury_id, fetched in known.items() if injury_id in previous_records}
+        for injury_id in kept:
+            run["writer"].write(previous_records[injury_id])
+        run["manifest"][team] = kept
+        log.warning(f"⚠️ {team}: Injury list unavailable, kept {len(kept)} injuries from the last run.")
+        return
+
+    ref_urls = {injury_id_from_ref(url["$ref"]): url["$ref"] for url in team_data["items"]}
+    injury_ids = list(ref_urls)
+
+    # Incremental mode reuses last run's record for every injury still listed. With the HTTP
+    # cache each one is revalidated and a 304 keeps the record as it is; without it a record
+    # is reused until it is MAX_RECORD_AGE_DAYS old. Everything else is fetched.
+    known = run["previous_manifest"].get(team, {})
+    known_ids = set(known)
+    previous_records = run["previous_records"]
+    revalidate = scheduler.cache is not None
+    reusable = [injury_id for injury_id in injury_ids
+                if run["incremental"] and injury_id in known_ids and injury_id in previous_records
+                and (revalidate or (known[injury_id] and known[injury_id] > run["refresh_before"]))]
+    new_ids = [injury_id for injury_id in injury_ids if injury_id not in reusable]
+    refreshed = sum(1 for injury_id in new_ids if injury_id in known_ids)
+
+    listed_ids = set(injury_ids)
+    for injury_id in known_ids - listed_ids:
+        if injury_id in previous_records:
+            run["resolved"].append(dict(previous_records[injury_id], Status="Resolved"))
+
+    if revalidate:
+        revalidated = await asyncio.gather(*(
+            scheduler.fetch_json(ref_urls[injury_id], log, tag=run["league"], unchanged=UNCHANGED)
+            for injury_id in reusable
+        ))
+    else:
+        revalidated = [None] * len(reusable)
+    manifest_ids = {}
+    updated = []
+    for injury_id, injury in zip(reusable, revalidated):
+        if injury is UNCHANGED or injury is None:
+            # Unchanged, or not revalidated (no cache, or the request failed): keep last run's record
+            record = previous_records[injury_id]
+            if record.get("Team") != team:
+                # Two teams configured with one ESPN team id list the same injuries
+                record = dict(record, Team=team)
+            if record.get("Player Name") == "Unknown":
+                # The roster may have learned this athlete since the last run
+                record["Player Name"] = run["player_names"].get(str(record.get("Athlete ID")), "Unknown")
+            run["writer"].write(record)
+            manifest_ids[injury_id] = run["date"] if injury is UNCHANGED else known[injury_id]
+        else:
+            updated.append((injury_id, injury))
+    detailed_injuries = await fetch_injury_details(scheduler, run, [{"$ref": ref_urls[injury_id]}
+                                                                    for injury_id in new_ids])
+
+    for injury_id, injury in updated + list(zip(new_ids, detailed_injuries)):
+        if injury:
+            # Extract and clean Athlete ID
+            athlete_ref = injury.get("athlete", {}).get("$ref", "")
+            raw_athlete_id = athlete_ref.split("/")[-1]
+            athlete_id = raw_athlete_id.split("?")[0]  # Remove any query parameters
+
+            # Attempt to find the Player Name
+            player_name = run["player_names"].get(athlete_id, "Unknown")
+
+            record = {
+                "Player Name": player_name,
+                "Athlete ID": athlete_id,
+                "Team": team,
+                "Injury ID": injury.get("id"),
+                "Status": injury.get("status"),
+                "Injury Type": injury.get("details", {}).get("type", "Unknown"),
+                "Return Date": injury.get("details", {}).get("returnDate", "Unknown"),
+                "Short Comment": injury.get("shortComment", ""),
+                "Long Comment": injury.get("longComment", ""),
+                "Reported Date": injury.get("date", "")
+            }
+            if player_name == "Unknown" and athlete_ref:
+                # Held back until resolve_unknown_athletes() has looked the athlete up
+                run["unresolved"].append((record, athlete_ref))
+            else:
+                run["writer"].write(record)
+            manifest_ids[injury_id] = run["date"]
+
+    # Injuries whose details failed to load stay out of the manifest and are retried next run
+    run["manifest"][team] = manifest_ids
+    log.info(f"✅ {team}: Retrieved {len(injury_ids)} injury records.")
+    if known_ids:
+        log.info(f"⏭️ {team}: Reused {len(reusable) - len(updated)} records, updated {len(updated)}, "
+                 f"fetched {len(new_ids) - refreshed} new and refreshed {refreshed}, "
+                 f"{len(known_ids - listed_ids)} resolved.")
+
+async def resolve_unknown_athletes(scheduler, run):
+    """Look up athletes missing from the roster through their athlete $ref.
+
+    Each athlete is fetched once however many injuries reference it, and resolved
+    names are written back to the roster store so the next run finds them locally.
+    """
+    unresolved = run["unresolved"]
+    if not unresolved:
+        return
+    athlete_refs = list(dict.fromkeys(athlete_ref for _, athlete_ref in unresolved))
+    athletes = await asyncio.gather(*(
+        scheduler.fetch_json(athlete_ref, run["log"], tag=run["league"]) for athlete_ref in athlete_refs
+    ))
+    names = {}
+    for athlete_ref, athlete in zip(athlete_refs, athletes):
+        name = athlete and (athlete.get("fullName") or athlete.get("displayName"))
+        if name:
+            names[athlete_ref] = name
+
+    resolved = {}
+    for record, athlete_ref in unresolved:
+        if athlete_ref in names:
+            record["Player Name"] = names[athlete_ref]
+            resolved[record["Athlete ID"]] = names[athlete_ref]
+        run["writer"].write(record)
+    run["unresolved"] = []
+
+    if resolved:
+        db = roster_store.connect()
+        try:
+            roster_store.upsert_athletes(db, run["league"], resolved.items(), run["date"])
+            db.commit()
+        finally:
+            db.close()
+        run["player_names"].update(resolved)
+    run["log"].info(f"🔎 Resolved {len(resolved)} of {len(athlete_refs)} athletes missing from the roster.")
+
+async def scrape_league(scheduler, run):
+    """Fetch every team of a league concurrently."""
+    with scheduler.metrics.stage(run["league"], tag=run["league"]) as stage:
+        tasks = [fetch_injury_data(scheduler, run, team, team_id) for team, team_id in run["config"]["team_ids"].items()]
+        await asyncio.gather(*tasks)
+        await resolve_unknown_athletes(scheduler, run)
+        stage["records"] = run["writer"].count
+
+def save_league_results(run, run_metrics):
+    """Publish a league's streamed reports to latest, add them to the history and injury
+    stores, and write its manifest, metrics and log."""
+    paths = league_paths(run["league"], run["date"])
+    fetched_teams = set(run["config"]["team_ids"]) - set(run["failed_teams"])
+    if not fetched_teams:
+        # Nothing was fetched, so there is no report: keep the previous one
+        run["writer"].abort()
+        run_metrics.write_jsonl(paths["metrics"], tag=run["league"])
+        run["log"].error(f"❌ {run['league']}: no team's injury list could be fetched, previous report kept")
+        run["log"].close()
+        print(f"❌ {run['league']} injury lists unavailable, previous report kept. Check {paths['log']} for details.")
+        return
+
+    # The JSON Lines and CSV reports were streamed while scraping; publish them into latest
+    run["writer"].close()
+    run["records"] = run["writer"].records
+    archive_report(run["league"], run["date"], run["writer"].jsonl_filename, run["log"], run["records"])
+    # Only the teams whose lists were fetched can have injuries that cleared
+    run["changes"] = store_report(run["league"], run["date"], run["writer"].jsonl_filename, run["log"],
+                                  paths["changes"], fetched_teams, run["records"])
+
+    # Save injuries that dropped off the list since the last run
+    json_codec.save(paths["resolved"], run["resolved"])
+
+    # Save the per-team injury ID manifest for the next incremental run
+    json_codec.save(paths["manifest"], run["manifest"])
+
+    # Save the league's request and stage metrics next to its log
+    run_metrics.write_jsonl(paths["metrics"], tag=run["league"])
+
+    # The log was written while scraping; close it once the league is done
+    run["log"].close()
+
+    print(f"✅ {run['league']} scraper completed. Data saved in {paths['folder']}. Check {paths['log']} for details.")
+
+async def run_leagues(leagues=None, rate=REQUESTS_PER_SECOND, max_concurrency=MAX_CONCURRENT_REQUESTS,
+                      use_cache=True, incremental=True, keep_records=False):
+    """Scrape the given leagues (default: all) concurrently over one shared session.
+
+    In incremental mode injuries listed in the previous run keep their record: with the
+    HTTP cache each is revalidated with a conditional request, without it they are
+    refetched once MAX_RECORD_AGE_DAYS old. `incremental=False` refetches (and
+    re-parses) every injury's details. With `keep_records` each league run's published
+    records stay in memory as run["records"].
+    """
+    leagues = leagues or list(LEAGUES)
+    runs = [new_league_run(league, incremental, keep_records) for league in leagues]
+    cache = HTTPCache() if use_cache else None
+    run_metrics = metrics.Metrics()
+    start = time.perf_counter()
+
+    try:
+        async with client_session(CONNECTION_LIMIT, CONNECTION_LIMIT_PER_HOST, KEEPALIVE_TIMEOUT) as session:
+            scheduler = RequestScheduler(
+                session,
+                rate=rate,
+                max_concurrency=max_concurrency,
+                per_host_concurrency=min(MAX_CONCURRENT_PER_HOST, max_concurrency),
+                cache=cache,
+                metrics=run_metrics,
+            )
+            await asyncio.gather(*(scrape_league(scheduler, run) for run in runs))
+    except BaseException as e:
+        # Keep the previous latest reports if the run did not finish; the logs so far stay on disk
+        for run in runs:
+            run["writer"].abort()
+            run["log"].error(f"❌ {run['league']} scraper stopped - {e!r}")
+            run["log"].close()
+        raise
+
+    if cache:
+        for run in runs:
+            run["log"].info(cache.summary(run["league"]))
+        cache.close()
+
+    for run in runs:
+        save_league_results(run, run_metrics)
+    print(run_metrics.summary_table())
+    run_metrics.write_prometheus("espn")
+    print(f"⏱️ Scraped {', '.join(leagues)} in {time.perf_counter() - start:.1f}s")
+    return runs
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape ESPN injury reports for one or more leagues.")
+    parser.add_argument("leagues", nargs="*", type=str.upper,
+                        help=f"Leagues to scrape (default: all of {', '.join(LEAGUES)})")
+    parser.add_argument("--rate", type=float, default=REQUESTS_PER_SECOND,
+                        help="Maximum requests per second per host")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENT_REQUESTS,
+                        help="Maximum requests in flight")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Fetch every document in full instead of revalidating the HTTP cache (incremental "
+                             f"runs then reuse injury records up to {MAX_RECORD_AGE_DAYS} days old)")
+    parser.add_argument("--full", action="store_true",
+                        help="Refetch and re-parse every injury's details instead of reusing listed injuries' records")
+    parser.add_argument("--prometheus", metavar="FOLDER",
+                        help="Also write the run's metrics to FOLDER/espn.prom in Prometheus text format")
+    args = parser.parse_args(argv)
+    unknown = [league for league in args.leagues if league not in LEAGUES]
+    if unknown:
+        parser.error(f"unknown league(s): {', '.join(unknown)}")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    metrics.prometheus_folder = args.prometheus
+    asyncio.run(run_leagues(args.leagues, rate=args.rate, max_concurrency=args.concurrency,
+                            use_cache=not args.no_cache, incremental=not args.full))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import os
+import re
+import sys
+import glob
+import csv
+import json_codec
+
+# Root of the Parquet history store, partitioned as league=<LEAGUE>/date=<YYYY-MM-DD>/
+history_folder = "injury_history"
+
+# Low-cardinality columns stored dictionary-encoded
+DICTIONARY_COLUMNS = ["Team", "Status", "Injury Type"]
+
+# Dated report folders written by the scrapers, e.g. nba_injuries/nba_injuries_2025-03-01
+DATED_FOLDER_PATTERN = re.compile(r"^(?P<league>[a-z]+)_injuries_(?P<date>\d{4}-\d{2}-\d{2})$")
+
+def snapshot_table(records):
+    """Build an Arrow table from injury records, dictionary-encoding low-cardinality columns."""
+    import pyarrow as pa
+    from injury_writer import INJURY_FIELDS
+
+    columns = {}
+    for field in INJURY_FIELDS:
+        values = [record.get(field) for record in records]
+        array = pa.array([None if value is None else str(value) for value in values], type=pa.string())
+        if field in DICTIONARY_COLUMNS:
+            array = array.dictionary_encode()
+        columns[field] = array
+    return pa.table(columns)
+
+def partition_folder(league, date):
+    return os.path.join(history_folder, f"league={league.upper()}", f"date={date}")
+
+def append_snapshot(league, date, records):
+    """Write one day's snapshot for a league, replacing that day's partition if it exists."""
+    import pyarrow.parquet as pq
+
+    folder = partition_folder(league, date)
+    os.makedirs(folder, exist_ok=True)
+    path = os.path.join(folder, "part-0.parquet")
+    tmp = f"{path}.tmp"
+    pq.write_table(snapshot_table(records), tmp, compression="zstd")
+    os.replace(tmp, path)
+    return path
+
+def archive_report(league, date, jsonl_filename, log, records=None):
+    """Add a finished JSON Lines report to the history store, logging the outcome to `log` (a run_log.RunLog).
+
+    `records` are the report's records when the caller still holds them, so the file is not read back.
+    """
+    from injury_writer import read_records
+
+    try:
+        if records is None:
+            records = read_records(jsonl_filename)
+        append_snapshot(league, date, records)
+        log.info(f"🗄️ Archived {len(records)} {league.upper()} records to {history_folder} for {date}")
+    except ImportError:
+        log.warning("⚠️ pyarrow is not installed, skipping the injury history store")
+    except Exception as e:
+        log.error(f"❌ Error archiving {league.upper()} history - {e}")
+
+def load_history(league, start_date=None, end_date=None, columns=None, filter=None):
+    """Read a league's snapshots between two ISO dates (inclusive) as an Arrow table.
+
+    Partition and column predicates (e.g. ``pyarrow.dataset.field("Status") == "Out"``)
+    are pushed down, so only matching partitions and row groups are read.
+    """
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    partitioning = ds.partitioning(pa.schema([("league", pa.string()), ("date", pa.string())]), flavor="hive")
+    dataset = ds.dataset(history_folder, format="parquet", partitioning=partitioning)
+
+    expression = ds.field("league") == league.upper()
+    if start_date:
+        expression = expression & (ds.field("date") >= start_date)
+    if end_date:
+        expression = expression & (ds.field("date") <= end_date)
+    if filter is not None:
+        expression = expression & filter
+    return dataset.to_table(columns=columns, filter=expression)
+
+def read_dated_report(folder):
+    """Records of a dated report folder, whichever format it was written in."""
+    from injury_writer import read_records
+
+    jsonl_path = os.path.join(folder, "injury_report.jsonl")
+    json_path = os.path.join(folder, "injury_report.json")
+    csv_path = os.path.join(folder, "injury_report.csv")
+    if os.path.exists(jsonl_path):
+        return read_records(jsonl_path)
+    if os.path.exists(json_path):
+        return json_codec.load(json_path)
+    if os.path.exists(csv_path):
+        with open(csv_path, newline="", encoding="utf-8") as csv_file:
+            return list(csv.DictReader(csv_file))
+    return None
+
+def backfill(root="."):
+    """Ingest every existing dated report folder under root into the history store."""
+    ingested = 0
+    for folder in sorted(glob.glob(os.path.join(root, "*_injuries", "*_injuries_*"))):
+        match = DATED_FOLDER_PATTERN.match(os.path.basename(folder))
+        if not match or not os.path.isdir(folder):
+            continue
+        records = read_dated_report(folder)
+        if records is None:
+            print(f"⚠️ No injury report in {folder}")
+            continue
+        append_snapshot(match.group("league"), match.group("date"), records)
+        ingested += 1
+        print(f"✅ {folder}: {len(records)} records")
+    print(f"✅ Backfilled {ingested} snapshots into {history_folder}")
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["backfill"]:
+        sys.exit("Usage: python history_store.py backfill")
+    backfill()
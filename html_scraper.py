@@ -0,0 +1,98 @@
+import os
+from datetime import datetime
+import cpu_pool
+from injury_writer import InjuryWriter
+from history_store import archive_report
+from injury_store import store_report
+from metrics import Metrics
+from run_log import RunLog, replay
+from http_cache import HTTPCache, cache_path
+from http_scheduler import RequestScheduler, client_session
+
+# Each site's page is fetched through the shared RequestScheduler (timeouts, retries with
+# jittered backoff, compressed transfer) and revalidated against the copy in the HTTP cache
+HEADERS = {'User-Agent': 'Mozilla/5.0'}
+REQUESTS_PER_SECOND = 1
+
+class PageUnavailable(Exception):
+    """The injury page could not be fetched or parsed, so the run has no report."""
+
+async def scrape_page(scheduler, writer, league, url, parse_page, today_date, log):
+    """Fetch a site's injury page and write the records parse_page() finds on it.
+
+    Returns False when the page could not be fetched or parsed.
+    """
+    html = await scheduler.fetch(url, log, tag=league)
+    if html is None:
+        log.error(f"❌ Failed to fetch {league} injury data")
+        return False
+
+    try:
+        # Parsing is CPU-bound, so it runs in the process pool when there is one
+        records, lines = await cpu_pool.run(parse_page, html, today_date)
+        replay(log, lines)
+        for record in records:
+            writer.write(record)
+
+        log.info(f"✅ Total injuries found: {writer.count}")
+        return True
+
+    except Exception as e:
+        log.error(f"❌ Error scraping {league} injury data: {str(e)}")
+        return False
+
+async def run(league, url, parse_page, main_folder, use_cache=True, keep_records=False):
+    """Scrape one site's injury page and save today's reports under main_folder.
+
+    `parse_page(html, today_date)` returns the page's records and the lines it logged
+    (it runs in a worker process when cpu_pool has any). Returns the run's metrics, its
+    change-log entries (None for the first report) and, with `keep_records`, the
+    published records. When the page could not be fetched the previous report is kept,
+    nothing is archived or stored, and changes and records are None.
+    """
+    today_date = datetime.today().strftime("%Y-%m-%d")
+    # The dated folder is named when the run starts, so a long-lived process rolls over at midnight
+    folder_name = os.path.join(main_folder, f"{main_folder}_{today_date}")
+    latest_folder = os.path.join(main_folder, "latest")
+    log_filename = os.path.join(folder_name, "scraper.log")
+    cache = HTTPCache(cache_path(main_folder)) if use_cache else None
+    run_metrics = Metrics()
+    log = RunLog(log_filename, league=league)
+
+    # Stream records to JSON Lines and CSV, then publish them into latest
+    try:
+        async with client_session(headers=HEADERS) as session:
+            scheduler = RequestScheduler(session, rate=REQUESTS_PER_SECOND, cache=cache, metrics=run_metrics)
+            with InjuryWriter(folder_name, latest_folder, main_folder, keep_records) as writer, \
+                    run_metrics.stage(league, tag=league) as stage:
+                if not await scrape_page(scheduler, writer, league, url, parse_page, today_date, log):
+                    # An empty report would read as every injury having cleared
+                    raise PageUnavailable()
+                stage["records"] = writer.count
+        archive_report(league, today_date, writer.jsonl_filename, log, writer.records)
+        changes = store_report(league, today_date, writer.jsonl_filename, log,
+                               os.path.join(folder_name, "changes.jsonl"), records=writer.records)
+        completed = True
+    except PageUnavailable:
+        log.warning(f"⚠️ {league}: no report published, the previous latest report is kept")
+        changes, completed = None, False
+    except BaseException as e:
+        log.error(f"❌ {league} scraper stopped - {e!r}")
+        raise
+    finally:
+        if cache:
+            log.info(cache.summary(league))
+            cache.close()
+        # Everything logged so far is on disk even if the run failed
+        log.close()
+
+    # Save the request and stage metrics next to the log
+    run_metrics.write_jsonl(os.path.join(folder_name, "metrics.jsonl"))
+    run_metrics.write_prometheus(league.lower())
+
+    print(run_metrics.summary_table())
+    if completed:
+        print(f"✅ Scraper completed. Data saved in {folder_name}. Check {log_filename} for details.")
+    else:
+        print(f"❌ {league} injury page unavailable, previous report kept. Check {log_filename} for details.")
+    return {"metrics": run_metrics, "changes": changes, "records": writer.records if completed else None}
@@ -0,0 +1,30 @@
+import importlib.util
+
+# Prefer the C-backed lxml parser; fall back to the stdlib parser when lxml is not installed
+PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+def parse_tables(html, table_class=None, heading_tag=None):
+    """(heading, table) pairs for the page's tables, in document order.
+
+    Only <table> elements (and `heading_tag` elements) are built into the tree, so
+    the rest of the page is skipped while parsing. `heading` is the text of the
+    closest `heading_tag` before the table, found in the same forward pass, or
+    None. With `table_class`, only tables carrying that class are returned.
+    """
+    from bs4 import BeautifulSoup, SoupStrainer
+
+    names = ["table", heading_tag] if heading_tag else ["table"]
+    soup = BeautifulSoup(html, PARSER, parse_only=SoupStrainer(names))
+
+    heading = None
+    tables = []
+    for element in soup.find_all(names):
+        if element.name == heading_tag:
+            heading = element.get_text(strip=True)
+        elif table_class is None or table_class in (element.get("class") or []):
+            tables.append((heading, element))
+    return tables
+
+def row_cells(row):
+    """The <td> cells of a table row (cells are always direct children of <tr>)."""
+    return row.find_all("td", recursive=False)
@@ -0,0 +1,121 @@
+import os
+import time
+import sqlite3
+
+# Default location and limits of the on-disk HTTP cache
+cache_folder = "http_cache"
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024  # Evict least recently used entries beyond 200 MB
+DEFAULT_TTL = 7 * 24 * 3600  # Entries not revalidated for a week are dropped
+
+def cache_path(name="responses"):
+    """Path of a named cache database in the cache folder (created if needed).
+
+    Scrapers that run alongside each other in one process use separate databases,
+    since each HTTPCache holds its write transaction open until it is closed.
+    """
+    os.makedirs(cache_folder, exist_ok=True)
+    return os.path.join(cache_folder, f"{name}.sqlite")
+
+class HTTPCache:
+    """Persistent conditional-GET cache keyed by URL.
+
+    Stores each response body with its ETag/Last-Modified validators so the
+    next request can be sent conditionally and a 304 served from disk.
+    Hit/miss counts and bytes saved are tracked per tag (e.g. per league).
+    """
+
+    def __init__(self, path=None, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL):
+        path = path or cache_path()
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = {}
+        self.db = sqlite3.connect(path)
+        self.db.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                validated_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.db.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+        # Expire entries that have not been revalidated within the TTL
+        self.db.execute("DELETE FROM responses WHERE validated_at < ?", (time.time() - ttl,))
+        self.db.commit()
+
+    def _tag_stats(self, tag):
+        if tag not in self.stats:
+            self.stats[tag] = {"requests": 0, "hits": 0, "bytes_saved": 0}
+        return self.stats[tag]
+
+    def conditional_headers(self, url):
+        """Request headers that let the server answer 304 for a cached URL."""
+        row = self.db.execute("SELECT etag, last_modified FROM responses WHERE url = ?", (url,)).fetchone()
+        headers = {}
+        if row:
+            if row[0]:
+                headers["If-None-Match"] = row[0]
+            if row[1]:
+                headers["If-Modified-Since"] = row[1]
+        return headers
+
+    def not_modified(self, url, tag=None):
+        """Return the cached body for a 304 response and record the hit."""
+        row = self.db.execute("SELECT body FROM responses WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        self.db.execute("UPDATE responses SET validated_at = ?, accessed_at = ? WHERE url = ?", (now, now, url))
+        stats = self._tag_stats(tag)
+        stats["requests"] += 1
+        stats["hits"] += 1
+        stats["bytes_saved"] += len(row[0])
+        return row[0]
+
+    def store(self, url, headers, body, tag=None):
+        """Record a fresh 200 response, keeping it only if it carries a validator."""
+        self._tag_stats(tag)["requests"] += 1
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        now = time.time()
+        self.db.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, body, len(body), now, now),
+        )
+
+    def discard(self, url):
+        """Forget a cached response, so the next request for it is sent unconditionally."""
+        self.db.execute("DELETE FROM responses WHERE url = ?", (url,))
+
+    def prune(self):
+        """Evict least recently used entries until the cache fits in max_bytes."""
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        evict = []
+        for url, size in self.db.execute("SELECT url, size FROM responses ORDER BY accessed_at"):
+            evict.append((url,))
+            excess -= size
+            if excess <= 0:
+                break
+        self.db.executemany("DELETE FROM responses WHERE url = ?", evict)
+
+    def summary(self, tag=None):
+        """One-line hit rate / bytes saved summary for the log."""
+        stats = self._tag_stats(tag)
+        requests = stats["requests"]
+        hit_rate = 100.0 * stats["hits"] / requests if requests else 0.0
+        return (f"📦 HTTP cache: {stats['hits']}/{requests} hits ({hit_rate:.1f}%), "
+                f"{stats['bytes_saved'] / 1024:.1f} KB saved")
+
+    def close(self):
+        self.prune()
+        self.db.commit()
+        self.db.close()
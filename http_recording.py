@@ -0,0 +1,53 @@
+import os
+import sqlite3
+import json_codec
+
+# Recordings hold one row per URL with the response body as the scrapers saw it
+# (304s answered from the HTTP cache are recorded with the cached body).
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    content_type TEXT,
+    body BLOB NOT NULL
+)
+"""
+
+def recording_path(folder):
+    return os.path.join(folder, "recording.sqlite")
+
+def endpoints_path(folder):
+    return os.path.join(folder, "endpoints.json")
+
+class Recorder:
+    """Captures every successful response of a run to disk so it can be replayed offline
+    (see benchmarks/replay_server.py). Install one as http_scheduler.recorder."""
+
+    def __init__(self, folder, endpoints=None):
+        os.makedirs(folder, exist_ok=True)
+        if endpoints is not None:
+            # The scrapers' entry URLs, so a replay starts from the same places
+            json_codec.save(endpoints_path(folder), endpoints)
+        self.path = recording_path(folder)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute(SCHEMA)
+        self.count = 0
+
+    def record(self, url, content_type, body):
+        self.db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?)", (url, content_type, body))
+        self.count += 1
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+def load_recording(folder):
+    """URL -> (content type, body) for every response in a recording."""
+    db = sqlite3.connect(recording_path(folder))
+    try:
+        return {url: (content_type, body) for url, content_type, body in db.execute("SELECT * FROM responses")}
+    finally:
+        db.close()
+
+def load_endpoints(folder):
+    """The scraper entry URLs saved with a recording."""
+    return json_codec.load(endpoints_path(folder))
@@ -0,0 +1,233 @@
+import asyncio
+import random
+import importlib.util
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+import json_codec
+from metrics import Metrics
+
+# Status codes that mean "slow down / try again later" rather than "this request is wrong"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# A stalled connect or socket read fails the attempt (and is retried) instead of hanging the run
+CONNECT_TIMEOUT = 10
+READ_TIMEOUT = 30
+
+# aiohttp decodes brotli responses only when a Brotli package is installed
+BROTLI = any(importlib.util.find_spec(name) for name in ("brotli", "brotlicffi"))
+ACCEPT_ENCODING = "gzip, deflate, br" if BROTLI else "gzip, deflate"
+
+# Set to an http_recording.Recorder to capture every response of the process (run_daily.py --record)
+recorder = None
+
+def client_session(limit=100, limit_per_host=30, keepalive_timeout=60, headers=None):
+    """aiohttp session with pooled keep-alive connections, connect/read timeouts and
+    compressed transfer. aiohttp is imported here so importing this module stays cheap."""
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, keepalive_timeout=keepalive_timeout)
+    timeout = aiohttp.ClientTimeout(total=None, connect=CONNECT_TIMEOUT, sock_read=READ_TIMEOUT)
+    return aiohttp.ClientSession(
+        connector=connector, timeout=timeout, headers={"Accept-Encoding": ACCEPT_ENCODING, **(headers or {})},
+    )
+
+class TokenBucket:
+    """Token-bucket rate limiter: at most `rate` acquisitions per second on average,
+    with bursts of at most `burst` back-to-back acquisitions, and none while paused."""
+
+    def __init__(self, rate, burst=1):
+        self.max_rate = float(rate)
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = None
+        self.slowed_at = None
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def _refill(self, now):
+        if self.updated is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        loop = asyncio.get_running_loop()
+        async with self.lock:
+            while True:
+                now = loop.time()
+                if now < self.paused_until:
+                    # Waiters queue on the lock, so nobody gets a token before the pause ends
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, until):
+        """Hand out no tokens before loop time `until` (e.g. a server's Retry-After)."""
+        self.paused_until = max(self.paused_until, until)
+
+    def slow_down(self, now, factor=0.5, min_rate=0.5, cooldown=1.0):
+        """Multiplicatively cut the rate after the server pushed back.
+
+        Rejections of requests that were already in flight when the rate was
+        last cut (within `cooldown` seconds) do not cut it again.
+        """
+        if self.slowed_at is not None and now - self.slowed_at < cooldown:
+            return
+        self.slowed_at = now
+        self.rate = max(min_rate, self.rate * factor)
+
+    def speed_up(self, fraction=0.01):
+        """Additively recover towards the configured rate after a success."""
+        self.rate = min(self.max_rate, self.rate + self.max_rate * fraction)
+
+def retry_after_seconds(value):
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds, or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+class RequestScheduler:
+    """Routes HTTP requests through a global concurrency cap, per-host concurrency
+    caps and a per-host token bucket, retrying 429/5xx responses with backoff.
+
+    When a host pushes back, its request rate is halved and then recovers
+    gradually on successful responses, never above the configured rate.
+    With an http_cache.HTTPCache, requests are sent conditionally and 304
+    responses are answered from the cache. Every attempt is recorded in
+    `metrics` (a metrics.Metrics).
+    """
+
+    def __init__(self, session, rate=20.0, burst=1, max_concurrency=50, per_host_concurrency=20,
+                 max_retries=4, backoff_base=0.5, backoff_max=30.0, cache=None, metrics=None):
+        self.session = session
+        self.cache = cache
+        self.metrics = metrics or Metrics()
+        self.rate = rate
+        self.burst = burst
+        self.per_host_concurrency = per_host_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.global_semaphore = asyncio.Semaphore(max_concurrency)
+        self.host_semaphores = {}
+        self.host_buckets = {}
+
+    def _host_limits(self, host):
+        if host not in self.host_semaphores:
+            self.host_semaphores[host] = asyncio.Semaphore(self.per_host_concurrency)
+            self.host_buckets[host] = TokenBucket(self.rate, self.burst)
+        return self.host_semaphores[host], self.host_buckets[host]
+
+    def _backoff_delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        # Exponential backoff with full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def fetch_json(self, url, log, tag=None, unchanged=None):
+        """Fetch JSON data from a URL, returning None (and logging why to `log`, a
+        run_log.RunLog) on failure.
+
+        `tag` groups cache statistics (e.g. by league).
+        """
+        return await self.fetch(url, log, tag, decode=json_codec.loads, unchanged=unchanged)
+
+    async def fetch(self, url, log, tag=None, decode=None, unchanged=None):
+        """Fetch a URL's body (bytes), returning None (and logging why) on failure.
+
+        `decode` is applied to the body inside the retry loop, so a body that
+        cannot be decoded (e.g. truncated JSON) is retried like a failed request.
+        When `unchanged` is given it is returned for a 304 answered from the cache,
+        for callers that kept what they built from the cached body last time.
+        """
+        decode = decode or (lambda body: body)
+        host = urlsplit(url).netloc
+        host_semaphore, bucket = self._host_limits(host)
+        loop = asyncio.get_running_loop()
+        first_queued = loop.time()
+
+        conditional = self.cache is not None
+        for attempt in range(self.max_retries + 1):
+            queued = loop.time()
+            retry_after = None
+            async with self.global_semaphore, host_semaphore:
+                await bucket.acquire()
+                sent = loop.time()
+                outcome, size, cache_hit = None, 0, False
+                try:
+                    headers = self.cache.conditional_headers(url) if conditional else None
+                    async with self.session.get(url, headers=headers) as response:
+                        outcome = response.status
+                        if response.status == 304 and self.cache:
+                            body = self.cache.not_modified(url, tag)
+                            if body is None:
+                                # The cached copy is gone, so ask again for the full body
+                                conditional = False
+                                status = "Status: 304 with no cached body"
+                            else:
+                                try:
+                                    result = decode(body) if unchanged is None else unchanged
+                                except Exception:
+                                    # Drop a cached body that no longer decodes; the retry fetches it in full
+                                    self.cache.discard(url)
+                                    raise
+                                cache_hit = True
+                                bucket.speed_up()
+                                if recorder:
+                                    recorder.record(url, response.headers.get("Content-Type"), body)
+                                return result
+                        elif response.status == 200:
+                            bucket.speed_up()
+                            body = await response.read()
+                            size = len(body)
+                            # Only a body that decodes is cached: a bad one would otherwise be
+                            # served again for every 304 that follows
+                            result = decode(body)
+                            if self.cache:
+                                self.cache.store(url, response.headers, body, tag)
+                            if recorder:
+                                recorder.record(url, response.headers.get("Content-Type"), body)
+                            return result
+                        elif response.status not in RETRY_STATUSES:
+                            log.error(f"❌ Failed to fetch {url} (Status: {response.status})",
+                                      url=url, status=response.status, duration=round(loop.time() - sent, 3))
+                            return None
+                        else:
+                            status = f"Status: {response.status}"
+                            retry_after = retry_after_seconds(response.headers.get("Retry-After"))
+                            if retry_after is not None:
+                                # The server asked every client to wait: pause the host's bucket now, so
+                                # requests already queued for a token are held back too
+                                bucket.pause(loop.time() + min(retry_after, self.backoff_max))
+                            bucket.slow_down(loop.time())
+                except Exception as e:
+                    outcome = type(e).__name__
+                    status = f"{type(e).__name__}: {e}"
+                finally:
+                    self.metrics.request(url, tag, outcome, loop.time() - sent, sent - queued, size, attempt, cache_hit)
+
+            if attempt == self.max_retries:
+                log.error(f"❌ Error fetching {url} - gave up after {attempt + 1} attempts ({status})",
+                          url=url, status=outcome, duration=round(loop.time() - first_queued, 3))
+                return None
+
+            delay = self._backoff_delay(attempt, retry_after)
+            log.warning(f"🔁 Retrying {url} in {delay:.1f}s ({status})", url=url, status=outcome)
+            await asyncio.sleep(delay)
+        return None
@@ -0,0 +1,258 @@
+import os
+import glob
+import sqlite3
+import argparse
+from change_feed import fingerprint, diff_fingerprints, change_entries, summary, append_changes
+
+# SQLite store of every injury the scrapers have reported, one row per league + Injury ID
+store_filename = "injuries.sqlite"
+
+# first_seen/last_seen are the dates of the first and last report that listed an injury,
+# listed is 1 while it is in its league's latest report, and fingerprint (see change_feed)
+# lets the next report be diffed against it without comparing every field.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS injuries (
+    league TEXT NOT NULL,
+    injury_id TEXT NOT NULL,
+    player_name TEXT,
+    athlete_id TEXT,
+    team TEXT,
+    status TEXT,
+    injury_type TEXT,
+    return_date TEXT,
+    short_comment TEXT,
+    long_comment TEXT,
+    reported_date TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    fingerprint BLOB,
+    listed INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (league, injury_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS injuries_team ON injuries (league, team, listed);
+CREATE INDEX IF NOT EXISTS injuries_athlete ON injuries (league, athlete_id);
+CREATE INDEX IF NOT EXISTS injuries_player ON injuries (player_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS injuries_status ON injuries (status, listed);
+CREATE INDEX IF NOT EXISTS injuries_reported ON injuries (reported_date);
+CREATE TABLE IF NOT EXISTS reports (
+    league TEXT NOT NULL,
+    report_date TEXT NOT NULL,
+    records INTEGER NOT NULL,
+    PRIMARY KEY (league, report_date)
+);
+"""
+
+# Report fields in column order after league and injury_id
+COLUMNS = [
+    ("Player Name", "player_name"), ("Athlete ID", "athlete_id"), ("Team", "team"), ("Status", "status"),
+    ("Injury Type", "injury_type"), ("Return Date", "return_date"), ("Short Comment", "short_comment"),
+    ("Long Comment", "long_comment"), ("Reported Date", "reported_date"),
+]
+
+UPSERT = f"""
+INSERT INTO injuries (league, injury_id, {", ".join(column for _, column in COLUMNS)}, first_seen, last_seen,
+                      fingerprint, listed)
+VALUES ({", ".join("?" * (len(COLUMNS) + 5))}, 1)
+ON CONFLICT (league, injury_id) DO UPDATE SET
+    {", ".join(f"{column} = excluded.{column}" for _, column in COLUMNS)},
+    first_seen = MIN(first_seen, excluded.first_seen),
+    last_seen = MAX(last_seen, excluded.last_seen),
+    fingerprint = excluded.fingerprint,
+    listed = 1
+"""
+
+def connect(path=None):
+    """Open the injury store, creating it if needed."""
+    path = path or store_filename
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    db = sqlite3.connect(path, timeout=30)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.row_factory = sqlite3.Row
+    columns = {row["name"] for row in db.execute("PRAGMA table_info(injuries)")}
+    if columns and "listed" not in columns:
+        add_change_columns(db)
+    db.executescript(SCHEMA)
+    return db
+
+def add_change_columns(db):
+    """Bring a store created before the change feed up to date: fingerprint every row and
+    mark the injuries of each league's latest report as listed."""
+    with db:
+        db.execute("ALTER TABLE injuries ADD COLUMN fingerprint BLOB")
+        db.execute("ALTER TABLE injuries ADD COLUMN listed INTEGER NOT NULL DEFAULT 0")
+        db.execute("""
+            UPDATE injuries SET listed = 1 WHERE last_seen =
+                (SELECT MAX(report_date) FROM reports WHERE reports.league = injuries.league)
+        """)
+        rows = db.execute("SELECT * FROM injuries").fetchall()
+        db.executemany("UPDATE injuries SET fingerprint = ? WHERE league = ? AND injury_id = ?",
+                       ((fingerprint(row_record(row)), row["league"], row["injury_id"]) for row in rows))
+        db.execute("DROP INDEX IF EXISTS injuries_team")
+        db.execute("DROP INDEX IF EXISTS injuries_status")
+
+def row_record(row):
+    """A stored injury as a report record."""
+    return {"Injury ID": row["injury_id"], **{field: row[column] for field, column in COLUMNS}}
+
+def upsert_report(db, league, report_date, records, teams=None):
+    """Upsert one report's records in a single transaction, marking injuries missing from it
+    as no longer listed.
+
+    When `teams` is given only those teams' injuries are unlisted: the report is partial
+    (some teams' lists could not be fetched) and says nothing about the others.
+    Returns the change-log entries against the league's previous report (see
+    change_feed), or None for its first report.
+    """
+    league = league.upper()
+    current = {str(record["Injury ID"]): record for record in records if record.get("Injury ID") is not None}
+    fingerprints = {injury_id: fingerprint(record) for injury_id, record in current.items()}
+    previous, previous_teams = {}, {}
+    for injury_id, row_fingerprint, team in db.execute(
+            "SELECT injury_id, fingerprint, team FROM injuries WHERE league = ? AND listed = 1", (league,)):
+        previous[injury_id], previous_teams[injury_id] = row_fingerprint, team
+    first_report = db.execute("SELECT 1 FROM reports WHERE league = ? LIMIT 1", (league,)).fetchone() is None
+    added, changed, removed = diff_fingerprints(previous, fingerprints)
+    if teams is not None:
+        removed = [injury_id for injury_id in removed if previous_teams[injury_id] in teams]
+
+    # Only the injuries that changed or went away are read back
+    old = {}
+    for injury_id in changed + removed:
+        row = db.execute("SELECT * FROM injuries WHERE league = ? AND injury_id = ?", (league, injury_id)).fetchone()
+        old[injury_id] = row_record(row)
+
+    rows = [(league, injury_id, *(record.get(field) for field, _ in COLUMNS), report_date, report_date,
+             fingerprints[injury_id]) for injury_id, record in current.items()]
+    with db:
+        db.executemany(UPSERT, rows)
+        db.executemany("UPDATE injuries SET listed = 0 WHERE league = ? AND injury_id = ?",
+                       ((league, injury_id) for injury_id in removed))
+        db.execute("INSERT OR REPLACE INTO reports VALUES (?, ?, ?)", (league, report_date, len(rows)))
+    if first_report:
+        return None
+    return change_entries(league, [current[injury_id] for injury_id in added],
+                          [(old[injury_id], current[injury_id]) for injury_id in changed],
+                          [old[injury_id] for injury_id in removed])
+
+def store_report(league, date, jsonl_filename, log, changes_filename=None, teams=None, records=None):
+    """Add a finished JSON Lines report to the injury store, logging the outcome to `log` (a
+    run_log.RunLog) and appending what changed since the previous report to changes_filename.
+    `teams` limits which teams' missing injuries are unlisted (see upsert_report), and
+    `records` are the report's records when the caller still holds them.
+
+    Returns the change-log entries, or None for a league's first report or when storing failed.
+    """
+    from injury_writer import read_records
+
+    try:
+        db = connect()
+        try:
+            if records is None:
+                records = read_records(jsonl_filename)
+            changes = upsert_report(db, league, date, records, teams)
+        finally:
+            db.close()
+        log.info(f"🗃️ Stored {len(records)} {league.upper()} injuries in {store_filename} for {date}")
+        if changes is None:
+            log.info(f"🔄 {league.upper()}: first report in the injury store, no changes to record")
+        else:
+            log.info(summary(league.upper(), changes))
+            if changes_filename:
+                append_changes(changes_filename, changes)
+        return changes
+    except Exception as e:
+        log.error(f"❌ Error storing {league.upper()} injuries - {e}")
+        return None
+
+def current_injuries(db, league=None, team=None, status=None):
+    """Injuries listed in their league's latest report, optionally for one team or status."""
+    query, params = "SELECT * FROM injuries WHERE listed = 1", []
+    for column, value in (("league", league and league.upper()), ("team", team), ("status", status)):
+        if value:
+            query += f" AND {column} = ?"
+            params.append(value)
+    return db.execute(query + " ORDER BY league, team, player_name", params).fetchall()
+
+def player_injuries(db, player=None, athlete_id=None, league=None):
+    """Every injury stored for a player (by name or Athlete ID), newest first, with the
+    number of days it was listed."""
+    query = """
+        SELECT *, CAST(julianday(last_seen) - julianday(first_seen) AS INTEGER) + 1 AS days_listed
+        FROM injuries WHERE
+    """
+    if athlete_id:
+        query, params = query + " athlete_id = ?", [str(athlete_id)]
+    else:
+        query, params = query + " player_name = ? COLLATE NOCASE", [player]
+    if league:
+        query += " AND league = ?"
+        params.append(league.upper())
+    return db.execute(query + " ORDER BY last_seen DESC, first_seen DESC", params).fetchall()
+
+def backfill(root="."):
+    """Upsert every existing dated report folder under root, oldest first."""
+    from history_store import DATED_FOLDER_PATTERN, read_dated_report
+
+    folders = []
+    for folder in glob.glob(os.path.join(root, "*_injuries", "*_injuries_*")):
+        match = DATED_FOLDER_PATTERN.match(os.path.basename(folder))
+        if match and os.path.isdir(folder):
+            folders.append((match.group("date"), match.group("league"), folder))
+
+    ingested = 0
+    db = connect()
+    try:
+        for date, league, folder in sorted(folders):
+            records = read_dated_report(folder)
+            if records is None:
+                print(f"⚠️ No injury report in {folder}")
+                continue
+            upsert_report(db, league, date, records)
+            ingested += 1
+            print(f"✅ {folder}: {len(records)} records")
+    finally:
+        db.close()
+    print(f"✅ Backfilled {ingested} reports into {store_filename}")
+
+def print_rows(rows, columns):
+    if not rows:
+        print("No matching injuries.")
+        return
+    widths = [max(len(column), *(len(str(row[column] or "")) for row in rows)) for column in columns]
+    print("  ".join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[column] or "").ljust(width) for column, width in zip(columns, widths)))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Query the SQLite injury store.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    current = commands.add_parser("current", help="Injuries listed in each league's latest report")
+    current.add_argument("--league")
+    current.add_argument("--team")
+    current.add_argument("--status", help='e.g. "Out"')
+    player = commands.add_parser("player", help="A player's injuries and how long each was listed")
+    player.add_argument("name", nargs="?")
+    player.add_argument("--athlete-id")
+    player.add_argument("--league")
+    commands.add_parser("backfill", help="Import every existing dated report folder")
+    args = parser.parse_args(argv)
+
+    if args.command == "backfill":
+        return backfill()
+    if args.command == "player" and not (args.name or args.athlete_id):
+        parser.error("player needs a name or --athlete-id")
+
+    db = connect()
+    try:
+        if args.command == "current":
+            rows = current_injuries(db, args.league, args.team, args.status)
+            print_rows(rows, ["league", "team", "player_name", "status", "injury_type", "return_date", "first_seen"])
+        else:
+            rows = player_injuries(db, args.name, args.athlete_id, args.league)
+            print_rows(rows, ["league", "team", "player_name", "status", "injury_type", "first_seen", "last_seen",
+                              "days_listed"])
+    finally:
+        db.close()
+
+if __name__ == "__main__":
+    main()
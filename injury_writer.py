@@ -0,0 +1,89 @@
+import os
+import csv
+import shutil
+from typing import Optional, TypedDict
+import json_codec
+
+# Column order shared by every scraper's injury report
+INJURY_FIELDS = [
+    "Player Name", "Athlete ID", "Team", "Injury ID", "Status", "Injury Type",
+    "Return Date", "Short Comment", "Long Comment", "Reported Date",
+]
+
+# An injury record as the scrapers write it; read_records() validates reports against
+# it when msgspec is installed (Status is null when ESPN leaves it out)
+InjuryRecord = TypedDict("InjuryRecord", {field: Optional[str] for field in INJURY_FIELDS})
+
+def publish(src, dst):
+    """Atomically point dst at src's contents, hard-linking when the filesystem allows it."""
+    tmp = f"{dst}.tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    try:
+        os.link(src, tmp)
+    except OSError:
+        shutil.copyfile(src, tmp)
+    os.replace(tmp, dst)
+
+def read_records(path):
+    """Read the records of a JSON Lines injury report."""
+    with open(path, "rb") as jsonl_file:
+        return json_codec.loads_lines(jsonl_file.read(), InjuryRecord)
+
+class InjuryWriter:
+    """Streams injury records to JSON Lines and CSV as they arrive.
+
+    Records are written once, to temporary files in the dated folder, and are only
+    kept in memory (in `records`) when `keep_records` is set. close() renames the
+    files into place and publishes them into the latest folder, so a run that fails
+    part-way never replaces the previous latest report.
+    """
+
+    def __init__(self, folder, latest_folder, latest_prefix, keep_records=False):
+        os.makedirs(folder, exist_ok=True)
+        os.makedirs(latest_folder, exist_ok=True)
+        self.jsonl_filename = os.path.join(folder, "injury_report.jsonl")
+        self.csv_filename = os.path.join(folder, "injury_report.csv")
+        self.latest_jsonl_filename = os.path.join(latest_folder, f"{latest_prefix}_latest.jsonl")
+        self.latest_csv_filename = os.path.join(latest_folder, f"{latest_prefix}_latest.csv")
+        self.count = 0
+        self.records = [] if keep_records else None
+        self.jsonl_file = open(f"{self.jsonl_filename}.tmp", "wb")
+        self.csv_file = open(f"{self.csv_filename}.tmp", "w", newline="", encoding="utf-8")
+        self.csv_writer = csv.DictWriter(self.csv_file, fieldnames=INJURY_FIELDS, extrasaction="ignore")
+        self.csv_writer.writeheader()
+
+    def write(self, record):
+        """Append one injury record to both outputs."""
+        self.jsonl_file.write(json_codec.dumpb(record))
+        self.jsonl_file.write(b"\n")
+        self.csv_writer.writerow(record)
+        if self.records is not None:
+            self.records.append(record)
+        self.count += 1
+
+    def close(self):
+        """Finish the dated files and publish them into latest."""
+        self.jsonl_file.close()
+        self.csv_file.close()
+        os.replace(f"{self.jsonl_filename}.tmp", self.jsonl_filename)
+        os.replace(f"{self.csv_filename}.tmp", self.csv_filename)
+        publish(self.jsonl_filename, self.latest_jsonl_filename)
+        publish(self.csv_filename, self.latest_csv_filename)
+
+    def abort(self):
+        """Discard a partial run, leaving the previous reports untouched."""
+        self.jsonl_file.close()
+        self.csv_file.close()
+        for filename in (self.jsonl_filename, self.csv_filename):
+            if os.path.exists(f"{filename}.tmp"):
+                os.remove(f"{filename}.tmp")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
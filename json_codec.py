@@ -0,0 +1,74 @@
+import json
+import importlib.util
+
+# JSON libraries in order of preference; the stdlib json module is always there. Every
+# backend writes the same bytes: compact separators (two-space indents for files meant
+# to be read) and UTF-8 text rather than \u escapes.
+BACKENDS = [name for name in ("msgspec", "orjson") if importlib.util.find_spec(name)] + ["json"]
+
+def _stdlib():
+    def dumpb(obj):
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def dumpb_indented(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+
+    def loads_lines(data, type=None):
+        return [json.loads(line) for line in data.splitlines() if line.strip()]
+
+    return json.loads, dumpb, dumpb_indented, loads_lines
+
+def _orjson():
+    import orjson
+
+    def dumpb_indented(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def loads_lines(data, type=None):
+        return [orjson.loads(line) for line in data.splitlines() if line.strip()]
+
+    return orjson.loads, orjson.dumps, dumpb_indented, loads_lines
+
+def _msgspec():
+    import msgspec
+
+    # Decoders are built once per type; a typed decoder validates while it decodes
+    decoders = {None: msgspec.json.Decoder()}
+
+    def dumpb_indented(obj):
+        return msgspec.json.format(msgspec.json.encode(obj), indent=2)
+
+    def loads_lines(data, type=None):
+        if type not in decoders:
+            decoders[type] = msgspec.json.Decoder(type)
+        return decoders[type].decode_lines(data)
+
+    return decoders[None].decode, msgspec.json.encode, dumpb_indented, loads_lines
+
+def use(backend):
+    """Decode and encode with one backend ("msgspec", "orjson" or "json") from now on."""
+    global BACKEND, loads, dumpb, dumpb_indented, loads_lines
+    BACKEND = backend
+    loads, dumpb, dumpb_indented, loads_lines = {"msgspec": _msgspec, "orjson": _orjson, "json": _stdlib}[backend]()
+
+use(BACKENDS[0])
+
+# loads(data)                  Object from JSON bytes or str (e.g. a response body as read)
+# dumpb(obj)                   Compact JSON as bytes
+# dumpb_indented(obj)          Indented JSON as bytes
+# loads_lines(data, type=None) Objects of a JSON Lines document (bytes), decoded as `type`
+#                              (e.g. a TypedDict) and validated against it with msgspec
+
+def dumps(obj):
+    """Compact JSON as str, for text files."""
+    return dumpb(obj).decode()
+
+def save(filename, obj):
+    """Write an object to a file as indented JSON."""
+    with open(filename, "wb") as json_file:
+        json_file.write(dumpb_indented(obj))
+
+def load(filename):
+    """Read a JSON file."""
+    with open(filename, "rb") as json_file:
+        return loads(json_file.read())
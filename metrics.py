@@ -0,0 +1,181 @@
+import os
+import time
+import json_codec
+import bisect
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# Upper bounds (seconds) of the request latency histogram buckets
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Folder for Prometheus text-format files (one <name>.prom per scraper, e.g. for the
+# node_exporter textfile collector). Set by the --prometheus flag; None writes nothing.
+prometheus_folder = None
+
+class Histogram:
+    """Fixed-bucket histogram; counts[i] holds observations <= buckets[i] (the last one is +Inf)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th quantile (the maximum for the +Inf bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self):
+        return {"buckets": list(self.buckets), "counts": self.counts, "count": self.count,
+                "sum": self.sum, "max": self.max}
+
+class Metrics:
+    """Per-request and per-stage measurements of one scraper run.
+
+    RequestScheduler records every attempt (latency, time spent waiting for a slot,
+    bytes in, status, retry number, cache hit); scrapers wrap their stages in
+    stage() and set the number of records they produced. Requests and stages are
+    grouped by tag (the league).
+    """
+
+    def __init__(self):
+        self.requests = []
+        self.stages = []
+
+    def request(self, url, tag, status, seconds, wait, size, attempt, cache_hit=False):
+        self.requests.append({
+            "time": time.time(), "host": urlsplit(url).netloc, "tag": tag, "url": url, "status": status,
+            "seconds": round(seconds, 6), "wait": round(wait, 6), "bytes": size, "attempt": attempt,
+            "cache_hit": cache_hit,
+        })
+
+    @contextmanager
+    def stage(self, name, tag=None):
+        """Time a pipeline stage; set stage["records"] inside the block."""
+        stage = {"stage": name, "tag": tag, "records": 0}
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage["seconds"] = round(time.perf_counter() - start, 6)
+            stage["records_per_second"] = stage["records"] / stage["seconds"] if stage["seconds"] else 0.0
+            self.stages.append(stage)
+
+    def totals(self, tag=None):
+        """Aggregates per (tag, host), for one tag or (tag=None) all of them."""
+        totals = {}
+        for event in self.requests:
+            if tag is not None and event["tag"] != tag:
+                continue
+            key = (event["tag"], event["host"])
+            if key not in totals:
+                totals[key] = {"tag": event["tag"], "host": event["host"], "attempts": 0, "retries": 0,
+                               "failures": 0, "cache_hits": 0, "bytes": 0, "statuses": {},
+                               "latency": Histogram(), "wait": 0.0}
+            total = totals[key]
+            total["attempts"] += 1
+            total["retries"] += event["attempt"] > 0
+            total["failures"] += event["status"] not in (200, 304)
+            total["cache_hits"] += event["cache_hit"]
+            total["bytes"] += event["bytes"]
+            total["wait"] += event["wait"]
+            status = str(event["status"])
+            total["statuses"][status] = total["statuses"].get(status, 0) + 1
+            total["latency"].observe(event["seconds"])
+        return list(totals.values())
+
+    def write_jsonl(self, filename, tag=None):
+        """Write the requests, per-host totals and stages (of one tag, or all) as JSON Lines."""
+        with open(filename, "w", encoding="utf-8") as jsonl_file:
+            for event in self.requests:
+                if tag is None or event["tag"] == tag:
+                    jsonl_file.write(json_codec.dumps({"type": "request", **event}) + "\n")
+            for total in self.totals(tag):
+                jsonl_file.write(json_codec.dumps({"type": "host", **total, "latency": total["latency"].to_dict()}) + "\n")
+            for stage in self.stages:
+                if tag is None or stage["tag"] == tag:
+                    jsonl_file.write(json_codec.dumps({"type": "stage", **stage}) + "\n")
+
+    def summary_table(self):
+        """Per-host and per-stage summary for the end of a run."""
+        lines = [f"📊 {'tag':<12} {'host':<32} {'reqs':>5} {'retry':>5} {'fail':>5} {'304':>5} "
+                 f"{'KB in':>8} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7}"]
+        for total in self.totals():
+            latency = total["latency"]
+            lines.append(
+                f"   {str(total['tag']):<12} {total['host'][:32]:<32} {total['attempts']:5d} {total['retries']:5d} "
+                f"{total['failures']:5d} {total['cache_hits']:5d} {total['bytes'] / 1024:8.1f} "
+                f"{latency.quantile(0.5) * 1e3:7.0f} {latency.quantile(0.95) * 1e3:7.0f} {latency.max * 1e3:7.0f}"
+            )
+        for stage in self.stages:
+            lines.append(f"   {stage['stage']:<12} {stage['seconds']:8.2f}s {stage['records']:6d} records "
+                         f"{stage['records_per_second']:8.1f} records/s")
+        return "\n".join(lines)
+
+    def prometheus_text(self, scraper):
+        """The metrics in Prometheus text exposition format, labelled with the scraper's name
+        (ESPN injuries and roster syncs share a host and league tags)."""
+        lines = []
+
+        def metric(name, kind, help_text):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        totals = self.totals()
+        metric("injury_scraper_request_duration_seconds", "histogram", "HTTP request latency per attempt.")
+        for total in totals:
+            labels = f'scraper="{scraper}",host="{total["host"]}",tag="{total["tag"]}"'
+            latency = total["latency"]
+            cumulative = 0
+            for bound, count in zip(list(latency.buckets) + ["+Inf"], latency.counts):
+                cumulative += count
+                lines.append(f'injury_scraper_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"injury_scraper_request_duration_seconds_sum{{{labels}}} {latency.sum}")
+            lines.append(f"injury_scraper_request_duration_seconds_count{{{labels}}} {latency.count}")
+        for name, key, help_text in (
+            ("injury_scraper_response_bytes_total", "bytes", "Response body bytes received."),
+            ("injury_scraper_retries_total", "retries", "Request attempts that were retries."),
+            ("injury_scraper_cache_hits_total", "cache_hits", "Requests answered 304 from the HTTP cache."),
+            ("injury_scraper_request_wait_seconds_total", "wait", "Time requests waited for a slot or token."),
+        ):
+            metric(name, "counter", help_text)
+            for total in totals:
+                lines.append(f'{name}{{scraper="{scraper}",host="{total["host"]}",tag="{total["tag"]}"}} {total[key]}')
+        metric("injury_scraper_responses_total", "counter", "Request attempts by status code or error.")
+        for total in totals:
+            for status, count in total["statuses"].items():
+                lines.append(f'injury_scraper_responses_total{{scraper="{scraper}",host="{total["host"]}",tag="{total["tag"]}",'
+                             f'status="{status}"}} {count}')
+        metric("injury_scraper_stage_duration_seconds", "gauge", "Wall time of the last run's pipeline stages.")
+        for stage in self.stages:
+            lines.append(f'injury_scraper_stage_duration_seconds{{scraper="{scraper}",stage="{stage["stage"]}"}} {stage["seconds"]}')
+        metric("injury_scraper_stage_records", "gauge", "Records produced by the last run's pipeline stages.")
+        for stage in self.stages:
+            lines.append(f'injury_scraper_stage_records{{scraper="{scraper}",stage="{stage["stage"]}"}} {stage["records"]}')
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, name):
+        """Write <prometheus_folder>/<name>.prom when a Prometheus folder is configured."""
+        if not prometheus_folder:
+            return
+        os.makedirs(prometheus_folder, exist_ok=True)
+        filename = os.path.join(prometheus_folder, f"{name}.prom")
+        # Collectors may read the folder at any time, so never expose a partial file
+        with open(f"{filename}.tmp", "w") as prom_file:
+            prom_file.write(self.prometheus_text(name))
+        os.replace(f"{filename}.tmp", filename)
@@ -0,0 +1,79 @@
+import os
+import csv
+import pickle
+import roster_store
+
+# Folder holding the per-league roster CSVs written by Get_player_id.py
+players_folder = "player_ids"
+
+def players_csv_path(league):
+    """Path of the roster CSV for a league (e.g. player_ids/NBA_Players.csv)."""
+    return os.path.join(players_folder, f"{league}_Players.csv")
+
+def players_cache_path(league):
+    """Path of the pickled index built from the league's roster CSV."""
+    return os.path.join(players_folder, f"{league}_Players.pkl")
+
+def build_player_index(csv_path):
+    """Parse a roster CSV into an Athlete ID -> Player Name dict."""
+    index = {}
+    with open(csv_path, newline="", encoding="utf-8") as csv_file:
+        for row in csv.DictReader(csv_file):
+            athlete_id = (row.get("Athlete ID") or "").strip()
+            if athlete_id:
+                index[athlete_id] = row.get("Player Name") or ""
+    return index
+
+def load_player_index(league):
+    """Load the Athlete ID -> Player Name index for a league.
+
+    Reads the roster store once Get_player_id.py has synced the league into it.
+    Otherwise the legacy roster CSV is used, topped up with any names the
+    scrapers resolved into the store. The parsed CSV is cached next to it and
+    reused for as long as the CSV's size and modification time are unchanged.
+    """
+    store_names = {}
+    if os.path.exists(roster_store.store_filename):
+        db = roster_store.connect()
+        try:
+            store_names = roster_store.load_names(db, league)
+            synced = roster_store.last_synced(db, league) is not None
+        finally:
+            db.close()
+        if synced:
+            return store_names
+
+    index = load_csv_index(league)
+    index.update(store_names)
+    return index
+
+def load_csv_index(league):
+    """Athlete ID -> Player Name from the league's roster CSV, via the pickled cache."""
+    csv_path = players_csv_path(league)
+    cache_path = players_cache_path(league)
+    if not os.path.exists(csv_path):
+        return {}
+
+    stat = os.stat(csv_path)
+    signature = (stat.st_size, stat.st_mtime_ns)
+
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as cache_file:
+                cached_signature, index = pickle.load(cache_file)
+            if cached_signature == signature:
+                return index
+        except Exception:
+            pass  # Corrupt or outdated cache, rebuild it below
+
+    index = build_player_index(csv_path)
+
+    # Write to a temporary file first so a concurrent reader never sees a partial cache
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        with open(tmp_path, "wb") as cache_file:
+            pickle.dump((signature, index), cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # The cache is only an optimisation
+    return index
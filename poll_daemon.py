@@ -0,0 +1,227 @@
+import time
+import heapq
+import asyncio
+import argparse
+import cpu_pool
+from datetime import datetime, timezone
+import AFL_Injuries
+import NRL_injuries
+import Get_player_id
+import espn_scraper
+from run_log import RunLog
+from run_daily import roster_is_stale
+
+# When each league plays, in UTC: the months of its season and weekly windows of
+# (weekday, start hour, hours) from a few hours before its usual game times, when
+# final injury designations and team lists come out, until the last games end.
+SCHEDULES = {
+    "NBA": {"season": {10, 11, 12, 1, 2, 3, 4, 5, 6}, "windows": [(day, 21, 7) for day in range(7)]},
+    "NFL": {"season": {9, 10, 11, 12, 1, 2},
+            "windows": [(4, 18, 4), (6, 14, 12), (0, 22, 5), (3, 22, 5)]},
+    "MLB": {"season": {3, 4, 5, 6, 7, 8, 9, 10}, "windows": [(day, 15, 12) for day in range(7)]},
+    "NHL": {"season": {10, 11, 12, 1, 2, 3, 4, 5, 6}, "windows": [(day, 21, 7) for day in range(7)]},
+    "AFL": {"season": {3, 4, 5, 6, 7, 8, 9},
+            "windows": [(1, 6, 4), (3, 7, 4), (4, 7, 4), (5, 1, 12), (6, 1, 10)]},
+    "NRL": {"season": {3, 4, 5, 6, 7, 8, 9, 10},
+            "windows": [(1, 5, 3), (3, 7, 4), (4, 6, 6), (5, 2, 10), (6, 3, 8)]},
+}
+
+# Shortest and longest poll interval (seconds) in a game window, in season and off season
+POLL_BOUNDS = {
+    "game": (10 * 60, 30 * 60),
+    "season": (30 * 60, 3 * 3600),
+    "offseason": (3 * 3600, 12 * 3600),
+}
+
+# A poll that finds changes halves the league's interval; a quiet one stretches it
+CHANGED_FACTOR = 0.5
+QUIET_FACTOR = 1.5
+
+REQUESTS_PER_SECOND = 10
+LOG_FILENAME = "poll_daemon.log"
+
+class Clock:
+    """Wall clock in Unix seconds."""
+
+    def now(self):
+        return time.time()
+
+    async def sleep(self, seconds):
+        await asyncio.sleep(seconds)
+
+class SimulatedClock:
+    """Clock that jumps ahead instead of sleeping, so days of polling run in seconds.
+
+    Callbacks scheduled with call_at() (e.g. changes to a stub server's data) run
+    in time order as sleeps pass them.
+    """
+
+    def __init__(self, start):
+        self.time = start
+        self.events = []
+
+    def now(self):
+        return self.time
+
+    def call_at(self, when, callback):
+        heapq.heappush(self.events, (when, len(self.events), callback))
+
+    async def sleep(self, seconds):
+        target = self.time + seconds
+        while self.events and self.events[0][0] <= target:
+            when, _, callback = heapq.heappop(self.events)
+            self.time = max(self.time, when)
+            callback()
+        self.time = target
+        await asyncio.sleep(0)
+
+def in_game_window(windows, moment):
+    """True when a UTC datetime falls in one of a league's weekly game windows."""
+    hour_of_week = moment.weekday() * 24 + moment.hour
+    return any((hour_of_week - (day * 24 + start)) % 168 < hours for day, start, hours in windows)
+
+def phase(league, now):
+    """"game", "season" or "offseason" for a league at Unix time `now`."""
+    schedule = SCHEDULES[league]
+    moment = datetime.fromtimestamp(now, timezone.utc)
+    if moment.month not in schedule["season"]:
+        return "offseason"
+    return "game" if in_game_window(schedule["windows"], moment) else "season"
+
+def next_interval(interval, changes, current_phase):
+    """Adapt a league's poll interval to what its last poll found, within the phase's bounds.
+
+    `changes` is the number of changes the poll found, or None when it could not tell.
+    """
+    low, high = POLL_BOUNDS[current_phase]
+    if interval is None:
+        return high
+    if changes:
+        interval *= CHANGED_FACTOR
+    elif changes is not None:
+        interval *= QUIET_FACTOR
+    return min(high, max(low, interval))
+
+def next_poll_time(league, now, interval):
+    """When to poll next: after `interval`, or at the top of the first hour in between
+    where the league's phase changes, so a long quiet interval never runs into a game window."""
+    current_phase = phase(league, now)
+    hour = (int(now) // 3600 + 1) * 3600
+    while hour < now + interval:
+        if phase(league, hour) != current_phase:
+            return hour
+        hour += 3600
+    return now + interval
+
+async def poll_espn(league, rate):
+    """Scrape one ESPN league; returns the number of changes found.
+
+    Every listed injury is revalidated (incremental mode would reuse last run's record
+    and miss status, return date and comment changes); unchanged ones answer 304.
+    """
+    if roster_is_stale():
+        await Get_player_id.sync_rosters()
+    runs = await espn_scraper.run_leagues([league], rate=rate, use_cache=True, incremental=False)
+    changes = runs[0]["changes"]
+    return None if changes is None else len(changes)
+
+async def poll_html(module):
+    """Scrape the AFL or NRL injury page; returns the number of changes found."""
+    changes = (await module.run(use_cache=True))["changes"]
+    return None if changes is None else len(changes)
+
+def league_pollers(leagues, rate=REQUESTS_PER_SECOND):
+    """League -> coroutine function polling it."""
+    pollers = {}
+    for league in leagues:
+        if league in espn_scraper.LEAGUES:
+            pollers[league] = lambda league=league: poll_espn(league, rate)
+        elif league == "AFL":
+            pollers[league] = lambda: poll_html(AFL_Injuries)
+        elif league == "NRL":
+            pollers[league] = lambda: poll_html(NRL_injuries)
+    return pollers
+
+class PollDaemon:
+    """Polls each league on its own adaptive schedule, one poll at a time.
+
+    Every league is polled at start; after that a league's interval follows the
+    changes it finds (next_interval) within bounds set by its game schedule, or
+    stays at `fixed_interval` seconds when one is given. The scrapers revalidate
+    every team list, page and listed injury against the HTTP cache, so polling an
+    unchanged league costs one conditional request (answered 304) for each.
+    """
+
+    def __init__(self, pollers, clock=None, fixed_interval=None, log=None):
+        self.pollers = pollers
+        self.clock = clock or Clock()
+        self.fixed_interval = fixed_interval
+        self.log = log or RunLog(echo=True)
+        now = self.clock.now()
+        self.state = {league: {"next_poll": now, "interval": None, "polls": 0, "changes": 0} for league in pollers}
+
+    async def poll(self, league):
+        state = self.state[league]
+        start = time.perf_counter()
+        try:
+            changes = await self.pollers[league]()
+        except Exception as e:
+            self.log.error(f"❌ {league}: poll failed - {e!r}", league=league)
+            changes = None
+        now = self.clock.now()
+        current_phase = phase(league, now)
+        if self.fixed_interval:
+            state["interval"] = self.fixed_interval
+            state["next_poll"] = now + self.fixed_interval
+        else:
+            state["interval"] = next_interval(state["interval"], changes, current_phase)
+            state["next_poll"] = next_poll_time(league, now, state["interval"])
+        state["polls"] += 1
+        state["changes"] += changes or 0
+        self.log.info(f"📡 {league}: {'no report to compare' if changes is None else f'{changes} changes'}, "
+                      f"next poll in {(state['next_poll'] - now) / 60:.0f} min ({current_phase})",
+                      league=league, duration=round(time.perf_counter() - start, 3))
+        return changes
+
+    async def run(self, until=None):
+        """Poll forever, or until clock time `until`."""
+        while True:
+            league = min(self.state, key=lambda league: self.state[league]["next_poll"])
+            next_poll = self.state[league]["next_poll"]
+            if until is not None and next_poll > until:
+                await self.clock.sleep(max(0.0, until - self.clock.now()))
+                return
+            await self.clock.sleep(max(0.0, next_poll - self.clock.now()))
+            await self.poll(league)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Poll injury reports continuously, each league on its own schedule.")
+    parser.add_argument("leagues", nargs="*", type=str.upper,
+                        help=f"Leagues to poll (default: all of {', '.join(SCHEDULES)})")
+    parser.add_argument("--rate", type=float, default=REQUESTS_PER_SECOND, help="Maximum ESPN requests per second")
+    parser.add_argument("--interval", type=float, metavar="MINUTES",
+                        help="Poll every league at this fixed interval instead of adapting")
+    parser.add_argument("--workers", type=int, default=cpu_pool.workers,
+                        help="Worker processes parsing the AFL and NRL pages (0 parses them inline)")
+    args = parser.parse_args(argv)
+    unknown = [league for league in args.leagues if league not in SCHEDULES]
+    if unknown:
+        parser.error(f"unknown league(s): {', '.join(unknown)}")
+    return args
+
+def main(argv=None):
+    args = parse_args(argv)
+    cpu_pool.workers = args.workers
+    log = RunLog(LOG_FILENAME, echo=True)
+    daemon = PollDaemon(league_pollers(args.leagues or list(SCHEDULES), args.rate),
+                        fixed_interval=args.interval and args.interval * 60, log=log)
+    try:
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        log.info("👋 Polling stopped")
+    finally:
+        cpu_pool.shutdown()
+        log.close()
+
+if __name__ == "__main__":
+    main()
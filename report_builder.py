@@ -0,0 +1,180 @@
+import io
+import os
+import zipfile
+import pandas as pd
+import cpu_pool
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+# Columns written for every team, plus "Comment" when a team has short comments
+REPORT_COLUMNS = ["Player Name", "Injury Type", "Status", "Return Date", "Reported Date"]
+MAX_COLUMN_WIDTH = 50  # Cap width at 50 to avoid extremely wide columns
+
+# Shared style objects (one instance each instead of one per cell)
+TITLE_FONT = Font(bold=True, size=16)
+TEAM_FONT = Font(bold=True, size=14)
+BOLD_FONT = Font(bold=True)
+REPORT_FONTS = (TITLE_FONT, TEAM_FONT, BOLD_FONT)
+
+def styled(ws, value, font):
+    """A write-only cell carrying a shared font."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.font = font
+    return cell
+
+def register_fonts(ws):
+    """Register the report fonts in a fixed order, so that every workbook numbers their
+    cell styles alike and a sheet rendered in another workbook can be merged in."""
+    for font in REPORT_FONTS:
+        styled(ws, None, font).style_id
+
+def load_league_frames(league_files):
+    """Read each league's latest CSV (league -> path) as an all-string DataFrame."""
+    league_frames = {}
+    for league, file in league_files.items():
+        if not os.path.exists(file):
+            print(f"⚠️ {league} file not found: {file}")
+            continue
+        try:
+            df = pd.read_csv(file, dtype=str, keep_default_na=False)
+        except Exception as e:
+            print(f"❌ Error processing {league}: {str(e)}")
+            continue
+        # Skip if empty
+        if df.empty:
+            print(f"⚠️ {league} file exists but contains no data")
+            continue
+        league_frames[league] = df
+    return league_frames
+
+def frame_from_records(records):
+    """Build an all-string report frame from in-memory injury records."""
+    from injury_writer import INJURY_FIELDS
+
+    return pd.DataFrame(records, columns=INJURY_FIELDS).fillna("").astype(str)
+
+def column_widths(df, title, has_comments):
+    """Width of each report column, computed from the whole league frame at once."""
+    columns = REPORT_COLUMNS + (["Short Comment"] if has_comments else [])
+    headers = REPORT_COLUMNS + (["Comment"] if has_comments else [])
+    widths = []
+    for column, header in zip(columns, headers):
+        longest = max(int(df[column].str.len().max()), len(header))
+        if column == "Player Name":
+            # Column A also holds the sheet title and the team names
+            longest = max(longest, len(title), int(df["Team"].str.len().max()))
+        widths.append(min(longest + 2, MAX_COLUMN_WIDTH))
+    return widths
+
+def write_league_sheet(wb, league, df):
+    """Write one league's sheet: a block per team with a bold header row."""
+    ws = wb.create_sheet(title=league)
+    register_fonts(ws)
+    title = f"{league} Injury Report"
+    has_comments = "Short Comment" in df.columns and (df["Short Comment"] != "").any()
+
+    # Column widths must be set before rows are streamed in write-only mode
+    for col_num, width in enumerate(column_widths(df, title, has_comments), 1):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+
+    # Add league name as a bold header
+    ws.append([styled(ws, title, TITLE_FONT)])
+    ws.append([])  # Blank row
+
+    for team, team_data in df.groupby("Team", sort=True):
+        # Add team name as a title
+        ws.append([styled(ws, team, TEAM_FONT)])
+
+        # Add column headers; the comment column only appears for teams with comments
+        team_has_comments = has_comments and (team_data["Short Comment"] != "").any()
+        headers = REPORT_COLUMNS + (["Comment"] if team_has_comments else [])
+        ws.append([styled(ws, header, BOLD_FONT) for header in headers])
+
+        # Add team data
+        columns = REPORT_COLUMNS + (["Short Comment"] if team_has_comments else [])
+        for row_values in team_data[columns].itertuples(index=False, name=None):
+            ws.append([value or None for value in row_values])
+
+        # Add space before next team
+        ws.append([])
+
+def write_summary_sheet(wb, available_leagues):
+    """Write the summary sheet listing teams and injuries per league."""
+    summary_sheet = wb.create_sheet(title="Summary")
+    register_fonts(summary_sheet)
+    total_teams = sum(data["teams"] for data in available_leagues.values())
+    total_injuries = sum(data["injuries"] for data in available_leagues.values())
+
+    rows = [[league, data["teams"], data["injuries"]] for league, data in sorted(available_leagues.items())]
+    header = ["League", "Number of Teams with Injuries", "Total Injuries"]
+    title = "Combined Injury Report Summary"
+    total_row = ["TOTAL", total_teams, total_injuries]
+
+    # Auto-adjust summary sheet column widths
+    for col_num in range(3):
+        cells = [header[col_num], total_row[col_num]] + [row[col_num] for row in rows]
+        if col_num == 0:
+            cells.append(title)
+        width = max(len(str(value)) for value in cells) + 2
+        summary_sheet.column_dimensions[get_column_letter(col_num + 1)].width = width
+
+    summary_sheet.append([styled(summary_sheet, title, TITLE_FONT)])
+    summary_sheet.append([])
+    summary_sheet.append(header)
+    for row in rows:
+        summary_sheet.append(row)
+    summary_sheet.append([styled(summary_sheet, value, BOLD_FONT) for value in total_row])
+
+def render_league_sheet(league, df):
+    """One league's sheet rendered in a workbook of its own (in a worker process);
+    returns the sheet's XML part for merge_sheets()."""
+    wb = Workbook(write_only=True)
+    write_league_sheet(wb, league, df)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    with zipfile.ZipFile(buffer) as archive:
+        return archive.read("xl/worksheets/sheet1.xml")
+
+def merge_sheets(workbook, sheets, output_file):
+    """Save a workbook to output_file with some of its sheets' XML parts
+    (part name -> XML) swapped for ones rendered elsewhere."""
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as target:
+        for item in source.infolist():
+            target.writestr(item, sheets.get(item.filename) or source.read(item.filename))
+
+def build_report(league_frames, output_file):
+    """Render already-loaded league frames (league -> DataFrame) into one workbook:
+    a summary sheet followed by one sheet per league."""
+    available_leagues = {
+        league: {"teams": int(df["Team"].nunique()), "injuries": len(df)}
+        for league, df in league_frames.items()
+    }
+
+    # Write-only workbook: rows are streamed to disk instead of kept as cell objects
+    wb = Workbook(write_only=True)
+    write_summary_sheet(wb, available_leagues)
+    # With a process pool the league sheets are rendered in parallel, each in its own
+    # workbook, and left empty here until their XML is merged in on saving
+    parallel = cpu_pool.workers > 0
+    if parallel:
+        rendered = cpu_pool.map_in_pool(render_league_sheet, list(league_frames), list(league_frames.values()))
+    for league, df in league_frames.items():
+        if parallel:
+            wb.create_sheet(title=league)
+        else:
+            write_league_sheet(wb, league, df)
+        print(f"✅ Added {league} with {available_leagues[league]['injuries']} injuries "
+              f"across {available_leagues[league]['teams']} teams")
+
+    os.makedirs(os.path.dirname(output_file) or ".", exist_ok=True)
+    if parallel:
+        # Sheet 1 is the summary, so the league sheets are parts 2 onwards
+        merge_sheets(wb, {f"xl/worksheets/sheet{number}.xml": xml for number, xml in enumerate(rendered, 2)},
+                     output_file)
+    else:
+        wb.save(output_file)
+    print(f"✅ Combined injury report saved as {output_file}")
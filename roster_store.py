@@ -0,0 +1,110 @@
+import os
+import time
+import sqlite3
+
+# SQLite roster store kept next to the legacy roster CSVs
+players_folder = "player_ids"
+store_filename = os.path.join(players_folder, "rosters.sqlite")
+
+# last_seen is NULL while an athlete is still on the roster, so a daily sync only
+# writes the athletes that were added, renamed or dropped since the last sync.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS athletes (
+    league TEXT NOT NULL,
+    athlete_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT,
+    PRIMARY KEY (league, athlete_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS syncs (
+    league TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    sync_date TEXT NOT NULL,
+    athletes INTEGER NOT NULL
+);
+"""
+
+UPSERT = """
+INSERT INTO athletes (league, athlete_id, name, first_seen, last_seen) VALUES (?, ?, ?, ?, NULL)
+ON CONFLICT (league, athlete_id) DO UPDATE SET name = excluded.name, last_seen = NULL
+"""
+
+def connect(path=None):
+    """Open the roster store, creating it if needed."""
+    path = path or store_filename
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA journal_mode=WAL")
+    db.executescript(SCHEMA)
+    return db
+
+def load_active(db, league):
+    """Athlete ID -> Player Name for athletes on the league's roster at the last sync."""
+    return dict(db.execute(
+        "SELECT athlete_id, name FROM athletes WHERE league = ? AND last_seen IS NULL", (league,)
+    ))
+
+def upsert_athletes(db, league, athletes, seen_date, active=None):
+    """Upsert (athlete_id, name) pairs seen on seen_date; returns the number of rows written.
+
+    Pass the league's load_active() result as `active` to skip athletes that are
+    already stored unchanged.
+    """
+    if active is not None:
+        athletes = [(athlete_id, name) for athlete_id, name in athletes if active.get(athlete_id) != name]
+    db.executemany(UPSERT, ((league, athlete_id, name, seen_date) for athlete_id, name in athletes))
+    return len(athletes)
+
+def mark_departed(db, league, active, seen_ids):
+    """Close out athletes that were active but missing from a complete sync.
+
+    Their last_seen becomes the date of the previous sync, the last one they appeared in.
+    """
+    departed = [athlete_id for athlete_id in active if athlete_id not in seen_ids]
+    previous = db.execute("SELECT sync_date FROM syncs WHERE league = ?", (league,)).fetchone()
+    if departed and previous:
+        db.executemany(
+            "UPDATE athletes SET last_seen = ? WHERE league = ? AND athlete_id = ?",
+            ((previous[0], league, athlete_id) for athlete_id in departed),
+        )
+    return len(departed)
+
+def record_sync(db, league, sync_date, athletes):
+    db.execute("INSERT OR REPLACE INTO syncs VALUES (?, ?, ?, ?)", (league, time.time(), sync_date, athletes))
+
+def last_synced(db, league):
+    """Unix time of the league's last complete sync, or None."""
+    row = db.execute("SELECT synced_at FROM syncs WHERE league = ?", (league,)).fetchone()
+    return row[0] if row else None
+
+def lookup_name(db, league, athlete_id):
+    """Player name for one Athlete ID, or None."""
+    row = db.execute("SELECT name FROM athletes WHERE league = ? AND athlete_id = ?", (league, athlete_id)).fetchone()
+    return row[0] if row else None
+
+def lookup_athlete(db, league, athlete_id):
+    """(name, first_seen, last_seen) for one Athlete ID, or None.
+
+    last_seen of an athlete still on the roster is the date of the last sync.
+    """
+    return db.execute("""
+        SELECT a.name, a.first_seen, COALESCE(a.last_seen, s.sync_date)
+        FROM athletes a LEFT JOIN syncs s ON s.league = a.league
+        WHERE a.league = ? AND a.athlete_id = ?
+    """, (league, athlete_id)).fetchone()
+
+def load_names(db, league):
+    """Athlete ID -> Player Name for every athlete ever stored for a league."""
+    return dict(db.execute("SELECT athlete_id, name FROM athletes WHERE league = ?", (league,)))
+
+def export_csv(db, league, csv_filename):
+    """Write a league's current roster in the legacy <LEAGUE>_Players.csv format."""
+    import csv
+
+    with open(csv_filename, "w", newline="", encoding="utf-8") as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(["Player Name", "Athlete ID"])
+        writer.writerows(db.execute(
+            "SELECT name, athlete_id FROM athletes WHERE league = ? AND last_seen IS NULL", (league,)
+        ))
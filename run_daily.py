@@ -0,0 +1,124 @@
+import os
+import time
+import asyncio
+import argparse
+import http_scheduler
+import metrics
+import cpu_pool
+import AFL_Injuries
+import NRL_injuries
+import Excel_sheet
+import Get_player_id
+import espn_scraper
+import roster_store
+from http_recording import Recorder
+
+# Resync rosters when the oldest league sync is older than this
+ROSTER_MAX_AGE_HOURS = 24
+
+def roster_is_stale(max_age_hours=ROSTER_MAX_AGE_HOURS):
+    """True when any ESPN league's roster was never synced or was synced too long ago."""
+    if not os.path.exists(roster_store.store_filename):
+        return True
+    db = roster_store.connect()
+    try:
+        synced = [roster_store.last_synced(db, league) for league in Get_player_id.leagues]
+    finally:
+        db.close()
+    if any(synced_at is None for synced_at in synced):
+        return True
+    return time.time() - min(synced) > max_age_hours * 3600
+
+def scraper_endpoints():
+    """The entry URL of every scraper (saved with recordings for replay)."""
+    return {
+        "espn": {league: config["base_url"] for league, config in espn_scraper.LEAGUES.items()},
+        "rosters": dict(Get_player_id.leagues),
+        "afl": AFL_Injuries.url,
+        "nrl": NRL_injuries.url,
+    }
+
+async def timed_stage(name, awaitable, timings):
+    """Await a stage and record its wall time."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        timings[name] = time.perf_counter() - start
+
+async def espn_stage(args, timings):
+    """Sync rosters when stale, then scrape every ESPN league; returns the league runs."""
+    if args.force_roster or roster_is_stale(args.roster_max_age):
+        await timed_stage("roster sync", Get_player_id.sync_rosters(), timings)
+    else:
+        print("⏭️ Rosters are fresh, skipping Get_player_id")
+    return await timed_stage("ESPN leagues", espn_scraper.run_leagues(
+        rate=args.rate, use_cache=not args.no_cache, incremental=not args.full,
+        keep_records=not args.skip_report,
+    ), timings)
+
+async def run_daily(args):
+    timings = {}
+    start = time.perf_counter()
+    metrics.prometheus_folder = args.prometheus
+    cpu_pool.workers = args.workers
+    if args.record:
+        # A recording must hold every response a scraper can ask for, so nothing is skipped
+        args.full = args.force_roster = True
+        http_scheduler.recorder = Recorder(args.record, scraper_endpoints())
+
+    # Every scraper is async, so the HTML sites are fetched alongside the ESPN engine
+    use_cache = not args.no_cache
+    # The scrapers keep their records in memory only when the report is rendered from them
+    keep_records = not args.skip_report
+    try:
+        espn_runs, afl, nrl = await asyncio.gather(
+            espn_stage(args, timings),
+            timed_stage("AFL", AFL_Injuries.run(use_cache, keep_records), timings),
+            timed_stage("NRL", NRL_injuries.run(use_cache, keep_records), timings),
+        )
+    finally:
+        if args.record:
+            http_scheduler.recorder.close()
+            print(f"🎙️ Recorded {http_scheduler.recorder.count} responses to {http_scheduler.recorder.path}")
+            http_scheduler.recorder = None
+    if not args.skip_report:
+        # The report is rendered from the records the scrapers kept, not re-read from the CSVs
+        league_records = {run["league"]: run["records"] for run in espn_runs}
+        league_records.update(AFL=afl["records"], NRL=nrl["records"])
+        await timed_stage("Excel report", asyncio.to_thread(Excel_sheet.main, league_records), timings)
+
+    timings["total"] = time.perf_counter() - start
+    print("⏱️ Stage timings")
+    for name, elapsed in timings.items():
+        print(f"  {name:<14} {elapsed:7.1f}s")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the daily injury scrape and report in one process.")
+    parser.add_argument("--full", action="store_true",
+                        help="Refetch and re-parse every ESPN injury's details instead of reusing listed ones' records")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the HTTP cache (without --full, listed ESPN injuries then reuse "
+                             f"records up to {espn_scraper.MAX_RECORD_AGE_DAYS} days old)")
+    parser.add_argument("--rate", type=float, default=espn_scraper.REQUESTS_PER_SECOND,
+                        help="Maximum ESPN requests per second")
+    parser.add_argument("--force-roster", action="store_true", help="Sync rosters even if they are fresh")
+    parser.add_argument("--roster-max-age", type=float, default=ROSTER_MAX_AGE_HOURS,
+                        help="Hours before rosters are considered stale")
+    parser.add_argument("--skip-report", action="store_true", help="Do not render the combined Excel report")
+    parser.add_argument("--prometheus", metavar="FOLDER",
+                        help="Also write each scraper's metrics to FOLDER/<scraper>.prom in Prometheus text format")
+    parser.add_argument("--record", metavar="FOLDER",
+                        help="Capture every HTTP response into FOLDER for offline replay (implies --full --force-roster)")
+    parser.add_argument("--workers", type=int, default=cpu_pool.workers,
+                        help="Worker processes for HTML parsing and report rendering (0 runs them inline)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    try:
+        asyncio.run(run_daily(parse_args(argv)))
+    finally:
+        cpu_pool.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import os
+import sys
+import queue
+import logging
+import threading
+from logging.handlers import QueueListener
+
+# Structured fields a log line can carry; they are written after the message as key=value
+FIELDS = ("league", "team", "url", "status", "duration")
+
+# Longest a logged line waits in memory before it is written to the file
+FLUSH_INTERVAL = 0.1
+
+class FieldFormatter(logging.Formatter):
+    """`2025-01-31 06:00:01 WARNING 🔁 Retrying ... | league=NBA url=... duration=0.412` lines."""
+
+    def format(self, record):
+        line = f"{self.formatTime(record)} {record.levelname:<7} {record.getMessage()}"
+        fields = " ".join(f"{name}={getattr(record, name)}" for name in FIELDS
+                          if getattr(record, name, None) is not None)
+        return f"{line} | {fields}" if fields else line
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that leaves flushing to its listener instead of flushing every line."""
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        if self.stream:
+            self.stream.flush()
+
+class DrainingListener(QueueListener):
+    """Queue listener that writes in batches: once the queue runs empty it flushes the
+    file and waits FLUSH_INTERVAL before taking the next line, so the lines logged in
+    the meantime cost the event loop one thread switch between them. stop() ends the wait."""
+
+    def __init__(self, records, *handlers):
+        super().__init__(records, *handlers)
+        self.stopping = threading.Event()
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                if isinstance(handler, BufferedFileHandler):
+                    handler.drain()
+            self.stopping.wait(FLUSH_INTERVAL)
+            return self.queue.get(block)
+
+    def stop(self):
+        self.stopping.set()
+        super().stop()
+
+class RunLog:
+    """A scraper run's log, appended to its scraper.log while the run is going (a day's
+    folder keeps the log of every run that day).
+
+    Logging a line only builds its record and puts it on a queue; a listener
+    thread formats and writes it to the file (and to stdout with `echo=True`)
+    within FLUSH_INTERVAL, so the event loop never waits on disk I/O and a crash
+    keeps everything logged before it (a kill loses at most FLUSH_INTERVAL of it).
+    Default fields (e.g. league) are added to every line; bind() returns a log
+    with more of them that writes to the same file. close() stops the listener.
+    """
+
+    def __init__(self, filename=None, echo=False, level=logging.INFO, **fields):
+        handlers = []
+        if filename:
+            os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+            file_handler = BufferedFileHandler(filename, mode="a", encoding="utf-8")
+            file_handler.setFormatter(FieldFormatter())
+            handlers.append(file_handler)
+        if echo:
+            handlers.append(logging.StreamHandler(sys.stdout))
+
+        self.level = level
+        self.listener = DrainingListener(queue.SimpleQueue(), *handlers)
+        self.listener.start()
+        self.filename = filename
+        self.fields = fields
+
+    def bind(self, **fields):
+        """A log writing to the same file with extra default fields."""
+        bound = object.__new__(RunLog)
+        bound.level, bound.listener, bound.filename = self.level, self.listener, self.filename
+        bound.fields = {**self.fields, **fields}
+        return bound
+
+    def log(self, level, message, **fields):
+        if level < self.level:
+            return
+        # Records are queued directly rather than through a Logger and QueueHandler, which
+        # would look up the caller's stack frame and format the record on the event loop
+        record = logging.LogRecord("injury_scraper", level, "", 0, message, None, None)
+        record.__dict__.update(self.fields)
+        record.__dict__.update(fields)
+        self.listener.queue.put_nowait(record)
+
+    def debug(self, message, **fields):
+        self.log(logging.DEBUG, message, **fields)
+
+    def info(self, message, **fields):
+        self.log(logging.INFO, message, **fields)
+
+    def warning(self, message, **fields):
+        self.log(logging.WARNING, message, **fields)
+
+    def error(self, message, **fields):
+        self.log(logging.ERROR, message, **fields)
+
+    def close(self):
+        """Write out everything logged so far and stop the listener thread."""
+        if self.listener._thread is not None:
+            self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class LineBuffer:
+    """Stand-in for a RunLog in a worker process: keeps each line as (level, message,
+    fields) so the parent can replay() them into its own log."""
+
+    def __init__(self):
+        self.lines = []
+
+    def log(self, level, message, **fields):
+        self.lines.append((level, message, fields))
+
+    def debug(self, message, **fields):
+        self.log(logging.DEBUG, message, **fields)
+
+    def info(self, message, **fields):
+        self.log(logging.INFO, message, **fields)
+
+    def warning(self, message, **fields):
+        self.log(logging.WARNING, message, **fields)
+
+    def error(self, message, **fields):
+        self.log(logging.ERROR, message, **fields)
+
+def replay(log, lines):
+    """Write lines kept by a LineBuffer to a log."""
+    for level, message, fields in lines:
+        log.log(level, message, **fields)
@@ -0,0 +1,31 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from bench_suite import record_stub_run, start_replay_server  # noqa: E402
+from replay_server import redirect_scrapers  # noqa: E402
+
+@pytest.fixture(scope="session")
+def recording(tmp_path_factory):
+    """A recording of every scraper run against stub_server.StubServer, made once per session."""
+    folder = str(tmp_path_factory.mktemp("recording"))
+    record_stub_run(folder)
+    return folder
+
+@pytest.fixture(scope="session")
+def replay(recording):
+    """A replay server for the recording, with every scraper pointed at it."""
+    server = start_replay_server(recording, latency=0.0)
+    redirect_scrapers(server.base_url, server.endpoints)
+    return server
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """An empty working directory for the scrapers' reports and stores."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
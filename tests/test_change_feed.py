@@ -0,0 +1,46 @@
+import injury_store
+from change_feed import fingerprint, diff_fingerprints
+
+def record(injury_id, status="Out", reported="2025-03-01"):
+    return {
+        "Player Name": f"Player {injury_id}", "Athlete ID": str(injury_id), "Team": "Team", "Injury ID": str(injury_id),
+        "Status": status, "Injury Type": "Knee", "Return Date": "2025-03-15", "Short Comment": "",
+        "Long Comment": "", "Reported Date": reported,
+    }
+
+def test_fingerprint_ignores_reported_date():
+    assert fingerprint(record(1)) == fingerprint(record(1, reported="2025-03-02"))
+    assert fingerprint(record(1)) != fingerprint(record(1, status="Questionable"))
+
+def test_diff_fingerprints():
+    previous = {"1": b"a", "2": b"b", "3": b"c"}
+    current = {"1": b"a", "2": b"x", "4": b"d"}
+    assert diff_fingerprints(previous, current) == (["4"], ["2"], ["3"])
+
+def test_upsert_report_changes(tmp_path):
+    db = injury_store.connect(str(tmp_path / "injuries.sqlite"))
+    assert injury_store.upsert_report(db, "NBA", "2025-03-01", [record(1), record(2), record(3)]) is None
+
+    changes = injury_store.upsert_report(db, "NBA", "2025-03-02",
+                                         [record(1), record(2, status="Questionable"), record(4)])
+    by_change = {entry["change"]: entry for entry in changes}
+    assert len(changes) == 3
+    assert by_change["added"]["Injury ID"] == "4"
+    assert by_change["changed"]["fields"] == {"Status": ["Out", "Questionable"]}
+    assert by_change["removed"]["Injury ID"] == "3"
+    assert [row["injury_id"] for row in injury_store.current_injuries(db, "NBA")] == ["1", "2", "4"]
+
+    # An unchanged report records nothing
+    assert injury_store.upsert_report(db, "NBA", "2025-03-03", [record(1), record(2, status="Questionable"),
+                                                                record(4)]) == []
+    db.close()
+
+def test_upsert_report_unlists_only_fetched_teams(tmp_path):
+    db = injury_store.connect(str(tmp_path / "injuries.sqlite"))
+    injury_store.upsert_report(db, "NBA", "2025-03-01", [record(1), dict(record(2), Team="Other")])
+
+    # Neither team's injury is in the report, but only Team's list was fetched
+    changes = injury_store.upsert_report(db, "NBA", "2025-03-02", [], teams={"Team"})
+    assert [(entry["change"], entry["Injury ID"]) for entry in changes] == [("removed", "1")]
+    assert [row["injury_id"] for row in injury_store.current_injuries(db, "NBA")] == ["2"]
+    db.close()
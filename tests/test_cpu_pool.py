@@ -0,0 +1,48 @@
+import io
+import random
+import asyncio
+import zipfile
+import contextlib
+
+import pytest
+
+import cpu_pool
+import report_builder
+import AFL_Injuries
+from bench_excel import make_frames
+from bench_html_parsing import afl_fixture, TODAY
+
+@pytest.fixture
+def pool(monkeypatch):
+    """Two worker processes for the duration of a test."""
+    monkeypatch.setattr(cpu_pool, "workers", 2)
+    yield
+    cpu_pool.shutdown()
+
+def workbook_parts(path):
+    with zipfile.ZipFile(path) as workbook:
+        return {item.filename: workbook.read(item.filename) for item in workbook.infolist()}
+
+def test_parallel_report_matches_serial(tmp_path, monkeypatch):
+    """League sheets rendered in workers and spliced in make the same workbook as the
+    serial render, apart from its creation time (docProps/core.xml)."""
+    frames = make_frames(200)
+    with contextlib.redirect_stdout(io.StringIO()):
+        report_builder.build_report(frames, str(tmp_path / "serial.xlsx"))
+        monkeypatch.setattr(cpu_pool, "workers", 2)
+        try:
+            report_builder.build_report(frames, str(tmp_path / "parallel.xlsx"))
+        finally:
+            cpu_pool.shutdown()
+
+    serial, parallel = workbook_parts(tmp_path / "serial.xlsx"), workbook_parts(tmp_path / "parallel.xlsx")
+    assert list(serial) == list(parallel)
+    assert [name for name in serial if serial[name] != parallel[name]] in ([], ["docProps/core.xml"])
+
+def test_parse_page_in_pool(pool):
+    """An AFL page parsed in a worker gives the same records and log lines as inline."""
+    html = afl_fixture(random.Random(0))
+    inline = AFL_Injuries.parse_page(html, TODAY)
+    records, lines = asyncio.run(cpu_pool.run(AFL_Injuries.parse_page, html, TODAY))
+    assert records == inline[0] and len(records) == 18 * 12
+    assert lines == inline[1]
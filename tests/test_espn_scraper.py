@@ -0,0 +1,33 @@
+import io
+import asyncio
+import contextlib
+
+import espn_scraper
+from stub_server import StubServer
+
+TEAMS = len(espn_scraper.LEAGUES["NBA"]["team_ids"])
+
+def test_incremental_run_revalidates_listed_injuries(workdir, monkeypatch):
+    """With the HTTP cache an incremental run revalidates every reused record, so a
+    status change on a listed injury is picked up while unchanged ones answer 304."""
+    async def scenario():
+        stub = StubServer()
+        base_url = await stub.start()
+        monkeypatch.setitem(espn_scraper.LEAGUES["NBA"], "base_url", f"{base_url}/NBA/teams/{{}}/injuries")
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                await espn_scraper.run_leagues(["NBA"], rate=1000, use_cache=True, incremental=True)
+                injury_id = stub.change_status("NBA", 2)
+                requests, not_modified = stub.requests, stub.not_modified
+                (run,) = await espn_scraper.run_leagues(["NBA"], rate=1000, use_cache=True, incremental=True)
+        finally:
+            await stub.stop()
+        return run, injury_id, stub.requests - requests, stub.not_modified - not_modified
+
+    run, injury_id, requests, not_modified = asyncio.run(scenario())
+    injuries = 5 * TEAMS
+    assert (requests, not_modified) == (TEAMS + injuries, TEAMS + injuries - 1)
+    assert run["writer"].count == injuries
+    (entry,) = run["changes"]
+    assert entry["change"] == "changed" and entry["Injury ID"] == injury_id
+    assert entry["fields"] == {"Status": ["Out", "Day-To-Day"]}
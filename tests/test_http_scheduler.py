@@ -0,0 +1,144 @@
+import asyncio
+
+from aiohttp import web
+
+from http_cache import HTTPCache
+from http_scheduler import RequestScheduler, client_session
+from run_log import RunLog
+from stub_server import StubServer
+
+async def fetch_all(server, urls, **scheduler_options):
+    log = RunLog()
+    try:
+        async with client_session() as session:
+            scheduler = RequestScheduler(session, **scheduler_options)
+            return await asyncio.gather(*(scheduler.fetch_json(url, log) for url in urls)), scheduler
+    finally:
+        log.close()
+
+def test_retry_after_holds_back_queued_requests():
+    """Configured above the server's limit: the scheduler backs off on 429 and sends nothing
+    until the server's Retry-After is up, including requests already waiting for a token."""
+    async def scenario():
+        server = StubServer(max_rate=20)
+        await server.start()
+        try:
+            urls = [f"{server.base_url}/injury/NFL-1-{i}" for i in range(80)]
+            results, _ = await fetch_all(server, urls, rate=60)
+        finally:
+            await server.stop()
+        return results, server
+
+    results, server = asyncio.run(scenario())
+    assert all(results)
+    assert server.rejected > 0
+    assert server.early == 0
+
+def test_conditional_get_answers_304_from_cache(tmp_path):
+    async def scenario():
+        server = StubServer()
+        await server.start()
+        cache = HTTPCache(str(tmp_path / "cache.sqlite"))
+        try:
+            url = f"{server.base_url}/injury/NBA-1-0"
+            (first,), _ = await fetch_all(server, [url], cache=cache)
+            (second,), scheduler = await fetch_all(server, [url], cache=cache)
+        finally:
+            cache.close()
+            await server.stop()
+        return first, second, server, scheduler
+
+    first, second, server, scheduler = asyncio.run(scenario())
+    assert first == second and first["id"] == "NBA-1-0"
+    assert server.requests == 2 and server.not_modified == 1
+    assert scheduler.metrics.requests[0]["cache_hit"]
+
+class FlakyJSONServer:
+    """Answers its first request with truncated JSON and then valid JSON, both under one
+    ETag, and 304 to a request carrying that ETag."""
+
+    def __init__(self):
+        self.conditional = []
+        self.runner = None
+
+    async def handle(self, request):
+        self.conditional.append("If-None-Match" in request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304, headers={"ETag": '"v1"'})
+        body = b'{"id": "1", "status": "Out"}'
+        if len(self.conditional) == 1:
+            body = body[:10]
+        return web.Response(body=body, content_type="application/json", headers={"ETag": '"v1"'})
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_get("/injury", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        return f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/injury"
+
+    async def stop(self):
+        await self.runner.cleanup()
+
+def test_undecodable_body_is_not_cached(tmp_path):
+    """A truncated 200 is retried in full instead of being revalidated from the cache."""
+    async def scenario():
+        server = FlakyJSONServer()
+        url = await server.start()
+        cache = HTTPCache(str(tmp_path / "cache.sqlite"))
+        try:
+            (result,), _ = await fetch_all(server, [url], cache=cache, backoff_base=0.01)
+            cached = cache.conditional_headers(url)
+        finally:
+            cache.close()
+            await server.stop()
+        return result, cached, server
+
+    result, cached, server = asyncio.run(scenario())
+    assert result == {"id": "1", "status": "Out"}
+    assert server.conditional == [False, False]
+    assert cached == {"If-None-Match": '"v1"'}
+
+def test_undecodable_cached_body_is_discarded(tmp_path):
+    """A bad body cached before is dropped on its 304 and fetched again in full."""
+    async def scenario():
+        server = FlakyJSONServer()
+        url = await server.start()
+        server.conditional.append(False)  # Serve valid JSON from the first request
+        cache = HTTPCache(str(tmp_path / "cache.sqlite"))
+        cache.store(url, {"ETag": '"v1"'}, b'{"id": "1"')
+        try:
+            (result,), _ = await fetch_all(server, [url], cache=cache, backoff_base=0.01)
+        finally:
+            cache.close()
+            await server.stop()
+        return result, server
+
+    result, server = asyncio.run(scenario())
+    assert result == {"id": "1", "status": "Out"}
+    assert server.conditional == [False, True, False]
+
+def test_not_modified_without_cached_body_is_retried(tmp_path):
+    """A 304 for a URL the cache no longer holds is retried without conditional headers."""
+    class EvictedCache(HTTPCache):
+        def not_modified(self, url, tag=None):
+            return None  # Evicted between sending the request and reading its answer
+
+    async def scenario():
+        server = FlakyJSONServer()
+        url = await server.start()
+        server.conditional.append(False)  # Serve valid JSON from the first request
+        cache = EvictedCache(str(tmp_path / "cache.sqlite"))
+        cache.store(url, {"ETag": '"v1"'}, b'{"id": "1", "status": "Out"}')
+        try:
+            (result,), _ = await fetch_all(server, [url], cache=cache, backoff_base=0.01)
+        finally:
+            cache.close()
+            await server.stop()
+        return result, server
+
+    result, server = asyncio.run(scenario())
+    assert result == {"id": "1", "status": "Out"}
+    assert server.conditional == [False, True, False]
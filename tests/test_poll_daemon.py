@@ -0,0 +1,37 @@
+import io
+import asyncio
+import contextlib
+
+import espn_scraper
+import json_codec
+import poll_daemon
+from run_log import RunLog
+from stub_server import StubServer
+
+def test_poll_reports_status_change(workdir, monkeypatch):
+    """A listed injury whose status changes is reported although its team's list did not change."""
+    monkeypatch.setattr(poll_daemon, "roster_is_stale", lambda: False)
+
+    async def scenario():
+        stub = StubServer()
+        base_url = await stub.start()
+        monkeypatch.setitem(espn_scraper.LEAGUES["NBA"], "base_url", f"{base_url}/NBA/teams/{{}}/injuries")
+        log = RunLog()
+        daemon = poll_daemon.PollDaemon({"NBA": lambda: poll_daemon.poll_espn("NBA", 1000)}, log=log)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                first = await daemon.poll("NBA")
+                quiet = await daemon.poll("NBA")
+                injury_id = stub.change_status("NBA", 2)
+                changed = await daemon.poll("NBA")
+        finally:
+            log.close()
+            await stub.stop()
+        return first, quiet, changed, injury_id
+
+    first, quiet, changed, injury_id = asyncio.run(scenario())
+    assert (first, quiet, changed) == (None, 0, 1)
+    with open(espn_scraper.league_paths("NBA")["changes"], "rb") as changes_file:
+        (entry,) = json_codec.loads_lines(changes_file.read())
+    assert entry["change"] == "changed" and entry["Injury ID"] == injury_id
+    assert entry["fields"] == {"Status": ["Out", "Day-To-Day"]}
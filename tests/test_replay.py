@@ -0,0 +1,154 @@
+"""Every scraper and the Excel report, replayed offline from a recording of the stub server.
+
+Each test runs one stage in an empty working directory, as benchmarks/bench_suite.py
+does, and checks the records it produced and the requests it made. The stub serves
+five injuries per ESPN team and 2,000 athletes per roster, and the AFL and NRL
+fixtures list 12 players for each of 18 and 17 teams. Run with pytest-benchmark
+installed to get timings (`python -m pytest tests --benchmark-only`).
+"""
+import io
+import os
+import asyncio
+import contextlib
+
+import pytest
+
+import AFL_Injuries
+import espn_scraper
+import injury_store
+import json_codec
+from bench_suite import run_stage
+from injury_writer import read_records
+
+RATE = 1000
+
+# ESPN: 124 team lists, 620 injury details and 615 athlete lookups (no roster is
+# synced first, and two NHL teams share team id 1, so five athletes repeat)
+TEAMS = sum(len(config["team_ids"]) for config in espn_scraper.LEAGUES.values())
+ESPN_RECORDS = 5 * TEAMS
+ESPN_REQUESTS = TEAMS + ESPN_RECORDS + 615
+EXPECTED = {
+    # stage: (records, requests)
+    "rosters": (4 * 2000, 4 * 2),  # Two pages of 1,000 athletes per league
+    "espn": (ESPN_RECORDS, ESPN_REQUESTS),
+    "afl": (18 * 12, 1),
+    "nrl": (17 * 12, 1),
+}
+
+def replayed(replay, func):
+    """Run func quietly; returns its result and the requests the replay server answered."""
+    before, missing = replay.requests, replay.missing
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    assert replay.missing == missing, "requests missing from the recording"
+    return result, replay.requests - before
+
+def check_stage(benchmark, replay, stage):
+    records, requests = benchmark.pedantic(replayed, args=(replay, lambda: run_stage(stage, RATE)), rounds=1)
+    benchmark.extra_info.update(records=records, requests=requests)
+    assert (records, requests) == EXPECTED[stage]
+
+def test_rosters(benchmark, replay, workdir):
+    check_stage(benchmark, replay, "rosters")
+
+def test_espn(benchmark, replay, workdir):
+    check_stage(benchmark, replay, "espn")
+
+def test_afl(benchmark, replay, workdir):
+    check_stage(benchmark, replay, "afl")
+
+def test_nrl(benchmark, replay, workdir):
+    check_stage(benchmark, replay, "nrl")
+
+def test_excel(benchmark, replay, workdir):
+    for stage in ("espn", "afl", "nrl"):
+        replayed(replay, lambda: run_stage(stage, RATE))
+    rows, requests = benchmark.pedantic(replayed, args=(replay, lambda: run_stage("excel", RATE)), rounds=1)
+    assert rows == ESPN_RECORDS + 18 * 12 + 17 * 12
+    assert requests == 0, "the report is rendered without fetching anything"
+
+def test_report_from_records(replay, workdir):
+    """run_daily.py renders the records its scrapers kept; they make the same frames as the CSVs."""
+    from report_builder import frame_from_records, load_league_frames
+    from pandas.testing import assert_frame_equal
+    import Excel_sheet
+
+    runs, _ = replayed(replay, lambda: asyncio.run(espn_scraper.run_leagues(rate=RATE, use_cache=False,
+                                                                            incremental=False, keep_records=True)))
+    afl, _ = replayed(replay, lambda: asyncio.run(AFL_Injuries.run(use_cache=False, keep_records=True)))
+    league_records = {run["league"]: run["records"] for run in runs}
+    league_records["AFL"] = afl["records"]
+    csv_frames = load_league_frames(Excel_sheet.league_files)
+    assert sorted(csv_frames) == sorted(league_records)
+    for league, records in league_records.items():
+        assert_frame_equal(frame_from_records(records), csv_frames[league])
+
+    _, requests = replayed(replay, lambda: Excel_sheet.main(league_records))
+    assert requests == 0
+    assert len(os.listdir(Excel_sheet.output_dir)) == 1
+
+def test_espn_incremental(replay, workdir, monkeypatch):
+    """A second incremental run fetches only the team lists and finds no changes; records
+    past MAX_RECORD_AGE_DAYS, or from a manifest without fetch dates, are refetched."""
+    def scrape():
+        return asyncio.run(espn_scraper.run_leagues(rate=RATE, use_cache=False, incremental=True))
+
+    replayed(replay, scrape)
+    runs, requests = replayed(replay, scrape)
+    assert requests == TEAMS
+    assert sum(run["writer"].count for run in runs) == ESPN_RECORDS
+    assert all(run["changes"] == [] for run in runs)
+    assert all(run["records"] is None for run in runs), "records are only kept when asked for"
+
+    # Athletes were resolved by the first run, so a refresh fetches lists and details only
+    with monkeypatch.context() as patch:
+        patch.setattr(espn_scraper, "MAX_RECORD_AGE_DAYS", 0)
+        runs, requests = replayed(replay, scrape)
+    assert requests == TEAMS + ESPN_RECORDS
+    assert all(run["changes"] == [] for run in runs)
+
+    # A manifest written before fetch dates were kept has its records refetched once
+    for league in espn_scraper.LEAGUES:
+        path = espn_scraper.league_paths(league)["manifest"]
+        json_codec.save(path, {team: list(ids) for team, ids in json_codec.load(path).items()})
+    runs, requests = replayed(replay, scrape)
+    assert requests == TEAMS + ESPN_RECORDS
+    runs, requests = replayed(replay, scrape)
+    assert requests == TEAMS
+
+def listed_injuries(league):
+    db = injury_store.connect()
+    try:
+        return len(injury_store.current_injuries(db, league))
+    finally:
+        db.close()
+
+def test_failed_page_keeps_previous_report(replay, workdir, monkeypatch):
+    """An AFL page that cannot be fetched publishes nothing and unlists nothing."""
+    replayed(replay, lambda: run_stage("afl", RATE))
+    monkeypatch.setattr(AFL_Injuries, "url", AFL_Injuries.url + "/missing")
+    missing = replay.missing
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = asyncio.run(AFL_Injuries.run(use_cache=False))
+    assert replay.missing == missing + 1
+    assert result["changes"] is None
+    assert listed_injuries("AFL") == EXPECTED["afl"][0]
+    assert len(read_records(os.path.join(AFL_Injuries.main_folder, "latest", "afl_injuries_latest.jsonl"))) == EXPECTED["afl"][0]
+
+@pytest.mark.parametrize("incremental", [True, False], ids=["incremental", "full"])
+def test_failed_team_list_keeps_its_injuries(replay, workdir, monkeypatch, incremental):
+    """A team whose ESPN list cannot be fetched keeps its injuries listed and in latest."""
+    def scrape():
+        return asyncio.run(espn_scraper.run_leagues(["NBA"], rate=RATE, use_cache=False, incremental=incremental))
+
+    replayed(replay, scrape)
+    monkeypatch.setitem(espn_scraper.LEAGUES["NBA"]["team_ids"], "Atlanta Hawks", 999)
+    with contextlib.redirect_stdout(io.StringIO()):
+        (run,) = scrape()
+    assert run["failed_teams"] == ["Atlanta Hawks"]
+    assert run["changes"] == []
+    assert run["writer"].count == 5 * len(espn_scraper.LEAGUES["NBA"]["team_ids"])
+    assert listed_injuries("NBA") == run["writer"].count
+    latest = read_records(espn_scraper.league_paths("NBA")["latest_jsonl"])
+    assert sum(1 for record in latest if record["Team"] == "Atlanta Hawks") == 5
+    assert len(json_codec.load(espn_scraper.league_paths("NBA")["manifest"])["Atlanta Hawks"]) == 5